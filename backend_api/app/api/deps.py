@@ -2,7 +2,7 @@ from collections.abc import Generator
 from dataclasses import dataclass
 from datetime import datetime
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
@@ -10,6 +10,7 @@ from ..core.database import SessionLocal
 from ..core.rbac import ADMIN_ONLY_ROLES, MUTATE_ROLES, READ_ROLES, has_role
 from ..core.security import decode_token
 from ..models.auth import InvestorAccount, User
+from ..services.pagination import decode_cursor
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
@@ -21,6 +22,16 @@ class InvestorAccessContext:
     investor_id: int
 
 
+def keyset_cursor(cursor: str | None = Query(default=None)) -> tuple[datetime, int] | None:
+    """Decoded ``?cursor=`` of a keyset-paginated listing (None = start from the newest)."""
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail="cursor is invalid") from exc
+
+
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
@@ -1,14 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 
 from ...api.deps import require_mutate_access, require_read_access
-from ...schemas.backups import BackupListItemDTO, RestoreBackupRequest
+from ...schemas.backups import AutoBackupTicketDTO, BackupListItemDTO, RestoreBackupRequest
 from ...schemas.common import ApiResponse
 from ...services.fund_runtime import runtime
 from ...services.backup_service import (
+    compact_backup_chain,
     list_local_backups,
     restore_from_local_backup,
     trigger_manual_backup,
+    verify_backup_chain,
 )
+from ...services.backup_worker import get_auto_backup_worker
 
 
 router = APIRouter()
@@ -32,14 +35,54 @@ def list_backups(days: int = Query(default=30, ge=1, le=365), _user=Depends(requ
 
 
 @router.post("/manual", response_model=ApiResponse[dict])
-def create_manual_backup(_user=Depends(require_mutate_access)):
+def create_manual_backup(
+    format: str | None = Query(default=None, pattern="^(archive|xlsx)$"),
+    _user=Depends(require_mutate_access),
+):
     def _write(manager):
-        backup = trigger_manual_backup(manager, description="api_manual")
+        backup = trigger_manual_backup(manager, description="api_manual", backup_format=format)
         return {"backup_id": backup["backup_id"], "created_at": backup["created_at"]}
 
     return ApiResponse(message="Manual backup created", data=runtime.mutate(_write))
 
 
+@router.get("/auto/{ticket_id}", response_model=ApiResponse[AutoBackupTicketDTO])
+def auto_backup_status(ticket_id: str, _user=Depends(require_read_access)):
+    ticket = get_auto_backup_worker().get(ticket_id)
+    if ticket is None:
+        raise HTTPException(status_code=404, detail="Auto backup ticket not found")
+    return ApiResponse(data=AutoBackupTicketDTO(**ticket))
+
+
+@router.get("/chain/verify", response_model=ApiResponse[dict])
+def verify_chain(
+    backup_id: str | None = Query(default=None, max_length=255, pattern=r"^[\w\-\.]+$"),
+    _user=Depends(require_read_access),
+):
+    try:
+        result = verify_backup_chain(backup_id)
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return ApiResponse(data=result)
+
+
+@router.post("/chain/compact", response_model=ApiResponse[dict])
+def compact_chain(
+    backup_id: str | None = Query(default=None, max_length=255, pattern=r"^[\w\-\.]+$"),
+    prune: bool = Query(default=False),
+    _user=Depends(require_mutate_access),
+):
+    try:
+        result = compact_backup_chain(backup_id, prune=prune)
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return ApiResponse(message="Backup chain compacted", data=result)
+
+
 @router.post("/restore", response_model=ApiResponse[dict])
 def restore_backup(payload: RestoreBackupRequest, _user=Depends(require_mutate_access)):
     def _write(manager):
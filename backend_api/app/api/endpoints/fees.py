@@ -19,6 +19,7 @@ from ...schemas.fees import (
     FeePreviewSummaryDTO,
     FeeRecordDTO,
 )
+from ...services.fee_preview_cache import CachedFeePreview, get_fee_preview_cache
 from ...services.fund_runtime import runtime
 from ...services.mappers import fee_record_to_dto
 
@@ -59,15 +60,14 @@ def _read_fee_config_bundle(manager) -> FeeConfigBundleDTO:
     )
 
 
-def _build_preview(manager, end_date, total_nav: float) -> list[FeePreviewDTO]:
+def _build_preview(manager, end_date, total_nav: float) -> tuple[list[FeePreviewDTO], dict[int, dict]]:
     previews: list[FeePreviewDTO] = []
-    for inv in manager.get_regular_investors():
-        result = manager.calculate_performance_fee(
-            inv.id,
-            end_date,
-            end_date,
-            total_nav,
-        )
+    investors = manager.get_regular_investors()
+    results = manager.calculate_investor_fees(
+        [inv.id for inv in investors], runtime.as_datetime(end_date), total_nav
+    )
+    for inv in investors:
+        result = results[inv.id]
         fee_amount = float(result.get("total_fee", result.get("fee", 0.0)))
         excess_profit = float(result.get("excess_profit", 0.0))
         current_price = float(result.get("current_price", 0.0))
@@ -96,25 +96,57 @@ def _build_preview(manager, end_date, total_nav: float) -> list[FeePreviewDTO]:
                 fee_source=str(result.get("fee_source", resolved_config["fee_source"])),
             )
         )
-    return previews
+    return previews, results
+
+
+def _preview_key(manager, end_date, total_nav: float) -> tuple:
+    """Everything a preview depends on; equal keys mean the cached preview is still exact."""
+    return (
+        str(end_date),
+        round(total_nav, 2),
+        manager.data_generation,
+        len(manager.transactions),
+        max((tx.id for tx in manager.transactions), default=0),
+        json.dumps(manager.get_fee_config_snapshot(), sort_keys=True),
+    )
 
 
-def _build_confirm_token(manager, end_date, total_nav: float, previews: list[FeePreviewDTO]) -> str:
-    tx_count = len(manager.transactions)
-    last_tx_id = max([tx.id for tx in manager.transactions], default=0)
+def _build_confirm_token(key: tuple, previews: list[FeePreviewDTO]) -> str:
+    end_date, total_nav, generation, tx_count, last_tx_id, fee_config_snapshot = key
     payload = {
-        "end_date": str(end_date),
-        "total_nav": round(total_nav, 2),
+        "end_date": end_date,
+        "total_nav": total_nav,
         "total_fee_amount": round(sum(item.fee_amount for item in previews), 2),
         "total_units_to_transfer": round(sum(item.units_to_transfer for item in previews), 6),
+        "data_generation": generation,
         "tx_count": tx_count,
         "last_tx_id": last_tx_id,
-        "fee_config_snapshot": manager.get_fee_config_snapshot(),
+        "fee_config_snapshot": fee_config_snapshot,
     }
     raw = json.dumps(payload, sort_keys=True).encode("utf-8")
     return hashlib.sha256(raw).hexdigest()
 
 
+def _cached_preview(manager, end_date, total_nav: float) -> CachedFeePreview:
+    """Return the memoized preview for the manager's current data, computing it on a miss."""
+    cache = get_fee_preview_cache()
+    key = _preview_key(manager, end_date, total_nav)
+    entry = cache.get(key)
+    if entry is not None:
+        return entry
+    previews, fee_calculations = _build_preview(manager, end_date, total_nav)
+    entry = CachedFeePreview(
+        key=key,
+        token=_build_confirm_token(key, previews),
+        previews=previews,
+        fee_calculations=fee_calculations,
+    )
+    # Generation unknown (another process wrote): usable for this request, not worth caching.
+    if manager.data_generation is not None:
+        cache.put(entry)
+    return entry
+
+
 @router.get("/config", response_model=ApiResponse[FeeConfigBundleDTO])
 def get_fee_config(_user=Depends(require_read_access)):
     return ApiResponse(data=runtime.read(_read_fee_config_bundle))
@@ -178,17 +210,17 @@ def delete_fee_override(
 @router.post("/preview", response_model=ApiResponse[FeePreviewBundleDTO])
 def preview_fees(payload: FeePreviewRequest, _user=Depends(require_read_access)):
     def _read(manager):
-        previews = _build_preview(manager, payload.end_date, payload.total_nav)
+        entry = _cached_preview(manager, payload.end_date, payload.total_nav)
+        previews = entry.previews
         summary = FeePreviewSummaryDTO(
             total_fee_amount=sum(item.fee_amount for item in previews),
             total_units_to_transfer=sum(item.units_to_transfer for item in previews),
             investor_count=len(previews),
         )
-        token = _build_confirm_token(manager, payload.end_date, payload.total_nav, previews)
         return FeePreviewBundleDTO(
             items=previews,
             summary=summary,
-            confirm_token=token,
+            confirm_token=entry.token,
             generated_at=datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
         )
 
@@ -201,9 +233,11 @@ def apply_fees(payload: FeeApplyRequest, _user=Depends(require_mutate_access)):
         if not payload.acknowledge_risk or not payload.acknowledge_backup:
             raise HTTPException(status_code=400, detail="Missing safety acknowledgements")
 
-        previews = _build_preview(manager, payload.end_date, payload.total_nav)
-        expected_token = _build_confirm_token(manager, payload.end_date, payload.total_nav, previews)
-        if payload.confirm_token != expected_token:
+        # Reuse the previewed fee details only if they were computed from exactly this data.
+        entry = get_fee_preview_cache().get_by_token(payload.confirm_token)
+        if entry is None or entry.key != _preview_key(manager, payload.end_date, payload.total_nav):
+            entry = _cached_preview(manager, payload.end_date, payload.total_nav)
+        if payload.confirm_token != entry.token:
             raise HTTPException(
                 status_code=409,
                 detail="Fee preview token mismatch. Please preview again before applying fees.",
@@ -212,12 +246,16 @@ def apply_fees(payload: FeeApplyRequest, _user=Depends(require_mutate_access)):
         results = manager.apply_year_end_fees_enhanced(
             runtime.as_datetime(payload.end_date),
             payload.total_nav,
+            fee_calculations=entry.fee_calculations,
         )
+        get_fee_preview_cache().discard_token(entry.token)
         if not isinstance(results, dict):
             raise HTTPException(status_code=400, detail="Unexpected fee response")
         return results
 
-    return ApiResponse(message="Fees applied", data=runtime.mutate(_write))
+    results, changes = runtime.mutate_with_changes(_write)
+    results["changes"] = changes
+    return ApiResponse(message="Fees applied", data=results)
 
 
 @router.get("/history", response_model=ApiResponse[list[FeeRecordDTO]])
@@ -12,6 +12,7 @@ from ...schemas.investors import (
     InvestorUpdateRequest,
 )
 from ...services.fund_runtime import runtime
+from ...services.investor_valuations import get_valuation_table
 from ...services.mappers import investor_to_card_dto, investor_to_dto
 
 
@@ -63,12 +64,10 @@ def list_investor_cards(
     _user=Depends(require_read_access),
 ):
     def _read(manager):
-        current_nav = nav if nav is not None else (manager.get_latest_total_nav() or 0)
-        cards: list[InvestorCardDTO] = []
-        for inv in manager.get_regular_investors():
-            balance, profit, profit_percent = manager.get_investor_balance(inv.id, current_nav)
-            cards.append(investor_to_card_dto(inv, balance, profit, profit_percent))
-        return cards
+        return [
+            investor_to_card_dto(row.investor, row.balance, row.profit, row.profit_percent)
+            for row in get_valuation_table(manager, nav).rows
+        ]
 
     return ApiResponse(data=runtime.read(_read))
 
@@ -81,18 +80,14 @@ def list_investor_cards_paginated(
     _user=Depends(require_read_access),
 ):
     def _read(manager):
-        current_nav = nav if nav is not None else (manager.get_latest_total_nav() or 0)
-        cards: list[InvestorCardDTO] = []
-        for inv in manager.get_regular_investors():
-            balance, profit, profit_percent = manager.get_investor_balance(inv.id, current_nav)
-            cards.append(investor_to_card_dto(inv, balance, profit, profit_percent))
-
-        cards.sort(key=lambda item: item.current_value, reverse=True)
-        start = (page - 1) * page_size
-        end = start + page_size
+        # Ranked table is cached per snapshot; only the rows on this page become DTOs
+        table = get_valuation_table(manager, nav)
         return PaginatedResponse(
-            items=cards[start:end],
-            total=len(cards),
+            items=[
+                investor_to_card_dto(row.investor, row.balance, row.profit, row.profit_percent)
+                for row in table.page(page, page_size)
+            ],
+            total=len(table),
             page=page,
             page_size=page_size,
         )
@@ -216,6 +211,7 @@ def update_investor(
             investor.ward_code = ""
             investor.ward_name = ""
 
+        manager._track_modified("investors", investor)
         return investor_to_dto(investor)
 
     return ApiResponse(message="Investor updated", data=runtime.mutate(_write))
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from ...api.deps import require_mutate_access, require_read_access
 from ...schemas.common import ApiResponse
-from ...schemas.nav import NavPointDTO, NavUpdateRequest
+from ...schemas.nav import NavPointDTO, NavSeriesDTO, NavUpdateRequest
 from ...services.fund_runtime import runtime
-from ...services.mappers import nav_point_to_dto
+from ...services.mappers import nav_daily_point_to_dto, nav_point_to_dto
 
 
 router = APIRouter()
@@ -30,3 +32,21 @@ def nav_history(_user=Depends(require_read_access)):
 
     return ApiResponse(data=runtime.read(_read))
 
+
+@router.get("/series", response_model=ApiResponse[NavSeriesDTO])
+def nav_series(
+    start_date: date | None = Query(default=None),
+    end_date: date | None = Query(default=None),
+    _user=Depends(require_read_access),
+):
+    if start_date and end_date and start_date > end_date:
+        start_date, end_date = end_date, start_date
+
+    def _read(manager):
+        return NavSeriesDTO(
+            points=[nav_daily_point_to_dto(point) for point in manager.get_nav_series(start_date, end_date)],
+            period_return=manager.get_period_return(start_date, end_date),
+        )
+
+    return ApiResponse(data=runtime.read(_read))
+
@@ -1,15 +1,23 @@
-import unicodedata
 from datetime import date, datetime, timezone
 
 from config import DEFAULT_UNIT_PRICE
+from core.models import DEPOSIT_KINDS, FEE_KINDS, WITHDRAWAL_KINDS
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response
-
-from ...api.deps import InvestorAccessContext, require_investor_access, require_read_access
+from fastapi.responses import FileResponse, StreamingResponse
+
+from ...api.deps import (
+    InvestorAccessContext,
+    get_current_user,
+    keyset_cursor,
+    require_investor_access,
+    require_read_access,
+)
 from ...schemas.common import ApiResponse
 from ...schemas.reports import (
     DashboardKPIDTO,
     DashboardResponseDTO,
+    ExportJobDTO,
     InvestorFeeDetailsDTO,
     InvestorLifetimeDTO,
     InvestorProfileDTO,
@@ -19,9 +27,14 @@ from ...schemas.reports import (
     TransactionReportDTO,
     TransactionReportSummaryDTO,
 )
-from ...services.export_service import build_transactions_csv, build_transactions_pdf
+from ...services.export_jobs import ExportQueueFull, get_export_job_queue
+from ...services.export_service import build_transactions_pdf, iter_transactions_csv
 from ...services.fund_runtime import runtime
+from ...services.investor_valuations import get_valuation_table
 from ...services.mappers import fee_record_to_dto, transaction_to_dto
+from ...services.pagination import encode_cursor
+from ...services.report_timeline import ReportTimeline, get_report_timeline_cache, kinds_filter
+from ...services.snapshot_cache import get_dashboard_cache, get_report_summary_cache
 
 
 router = APIRouter()
@@ -34,11 +47,6 @@ def _safe_float(value, default: float = 0.0) -> float:
         return default
 
 
-def _normalize_text(value: str) -> str:
-    normalized = unicodedata.normalize("NFD", value).encode("ascii", "ignore").decode("ascii")
-    return normalized.lower().strip()
-
-
 def _to_datetime(value) -> datetime:
     if isinstance(value, datetime):
         return value
@@ -68,97 +76,19 @@ def _normalize_date_range(start_date: str | None, end_date: str | None) -> tuple
     return parsed_start, parsed_end
 
 
-def _is_deposit_type(tx_type: str) -> bool:
-    normalized_type = _normalize_text(tx_type)
-    return "nap" in normalized_type or "deposit" in normalized_type
-
-
-def _is_withdraw_type(tx_type: str) -> bool:
-    normalized_type = _normalize_text(tx_type)
-    return (
-        "rut" in normalized_type
-        or "withdraw" in normalized_type
-        or "rat" in normalized_type
-    )
-
-
-def _sort_transaction_key(tx) -> tuple[datetime, int]:
-    return _to_datetime(tx.date), int(getattr(tx, "id", 0))
-
-
-def _is_fee_type(tx_type: str) -> bool:
-    normalized_type = _normalize_text(tx_type)
-    return "phi" in normalized_type or "fee" in normalized_type
-
-
-def _match_tx_type(tx, tx_type: str | None) -> bool:
-    if not tx_type:
-        return True
-    wanted = _normalize_text(tx_type)
-    return wanted in _normalize_text(tx.type)
-
-
-def _match_base_filters(
-    tx,
-    investor_id: int | None,
-    start_date: date | None,
-    end_date: date | None,
-) -> bool:
-    tx_date = _to_datetime(tx.date).date()
-    if investor_id is not None and tx.investor_id != investor_id:
-        return False
-    if start_date and tx_date < start_date:
-        return False
-    if end_date and tx_date > end_date:
-        return False
-    return True
-
-
 def _resolve_period_bounds(
-    transactions_asc,
+    timeline: ReportTimeline,
     start_date: date | None,
     end_date: date | None,
 ) -> tuple[date | None, date | None]:
-    if not transactions_asc:
+    if not len(timeline):
         return start_date, end_date
 
-    global_start = _to_datetime(transactions_asc[0].date).date()
-    global_end = _to_datetime(transactions_asc[-1].date).date()
-    period_start = start_date or global_start
-    period_end = end_date or global_end
+    period_start = start_date or timeline.dates[0]
+    period_end = end_date or timeline.dates[-1]
     return period_start, period_end
 
 
-def _snapshot_units_and_nav(
-    transactions_asc,
-    investor_id: int | None,
-    boundary_date: date,
-    include_boundary: bool,
-) -> tuple[float, float, float | None]:
-    total_units = 0.0
-    investor_units = 0.0
-    latest_nav: float | None = None
-
-    for tx in transactions_asc:
-        tx_date = _to_datetime(tx.date).date()
-        if include_boundary:
-            if tx_date > boundary_date:
-                break
-        elif tx_date >= boundary_date:
-            break
-
-        units_delta = _safe_float(getattr(tx, "units_change", 0.0))
-        total_units += units_delta
-        if investor_id is None:
-            investor_units = total_units
-        elif tx.investor_id == investor_id:
-            investor_units += units_delta
-
-        latest_nav = _safe_float(getattr(tx, "nav", 0.0))
-
-    return investor_units, total_units, latest_nav
-
-
 def _compute_value(investor_units: float, total_units: float, nav_value: float | None) -> float:
     if nav_value is None or total_units <= 0:
         return 0.0
@@ -167,31 +97,13 @@ def _compute_value(investor_units: float, total_units: float, nav_value: float |
 
 
 def _first_non_zero_value_in_period(
-    transactions_asc,
+    timeline: ReportTimeline,
     investor_id: int | None,
     period_start: date,
     period_end: date,
 ) -> float:
-    total_units = 0.0
-    investor_units = 0.0
-    latest_nav: float | None = None
-
-    for tx in transactions_asc:
-        tx_date = _to_datetime(tx.date).date()
-        if tx_date > period_end:
-            break
-
-        units_delta = _safe_float(getattr(tx, "units_change", 0.0))
-        total_units += units_delta
-        if investor_id is None:
-            investor_units = total_units
-        elif tx.investor_id == investor_id:
-            investor_units += units_delta
-        latest_nav = _safe_float(getattr(tx, "nav", 0.0))
-
-        if tx_date < period_start:
-            continue
-
+    for prefix in range(timeline.prefix_before(period_start) + 1, timeline.prefix_through(period_end) + 1):
+        investor_units, total_units, latest_nav = timeline.snapshot(investor_id, prefix)
         current_value = _compute_value(investor_units, total_units, latest_nav)
         if current_value > 0:
             return current_value
@@ -200,7 +112,7 @@ def _first_non_zero_value_in_period(
 
 
 def _estimate_market_performance(
-    transactions_asc,
+    timeline: ReportTimeline,
     investor_id: int | None,
     period_start: date | None,
     period_end: date | None,
@@ -210,21 +122,11 @@ def _estimate_market_performance(
     if not period_start or not period_end or period_start > period_end:
         return 0.0, 0.0
 
-    (
-        start_investor_units,
-        start_total_units,
-        start_nav,
-    ) = _snapshot_units_and_nav(
-        transactions_asc=transactions_asc,
-        investor_id=investor_id,
-        boundary_date=period_start,
-        include_boundary=False,
+    start_investor_units, start_total_units, start_nav = timeline.snapshot(
+        investor_id, timeline.prefix_before(period_start)
     )
-    end_investor_units, end_total_units, end_nav = _snapshot_units_and_nav(
-        transactions_asc=transactions_asc,
-        investor_id=investor_id,
-        boundary_date=period_end,
-        include_boundary=True,
+    end_investor_units, end_total_units, end_nav = timeline.snapshot(
+        investor_id, timeline.prefix_through(period_end)
     )
 
     start_value = _compute_value(start_investor_units, start_total_units, start_nav)
@@ -234,7 +136,7 @@ def _estimate_market_performance(
     percent_base = start_value
     if percent_base <= 0:
         percent_base = _first_non_zero_value_in_period(
-            transactions_asc=transactions_asc,
+            timeline=timeline,
             investor_id=investor_id,
             period_start=period_start,
             period_end=period_end,
@@ -246,7 +148,7 @@ def _estimate_market_performance(
 
 def _build_transaction_summary(
     transactions,
-    transactions_asc,
+    timeline: ReportTimeline,
     investor_id: int | None,
     period_start: date | None,
     period_end: date | None,
@@ -261,16 +163,16 @@ def _build_transaction_summary(
         by_type[tx.type] = by_type.get(tx.type, 0) + 1
         amount = _safe_float(tx.amount)
         total_volume += abs(amount)
-        if _is_deposit_type(tx.type):
+        if tx.kind in DEPOSIT_KINDS:
             total_deposits += abs(amount)
-        elif _is_withdraw_type(tx.type):
+        elif tx.kind in WITHDRAWAL_KINDS:
             total_withdrawals += abs(amount)
-        elif _is_fee_type(tx.type) and amount < 0:
+        elif tx.kind in FEE_KINDS and amount < 0:
             fees_in_period += abs(amount)
 
     net_cash_flow = total_deposits - total_withdrawals
     gross_profit_loss, gross_profit_loss_percent = _estimate_market_performance(
-        transactions_asc=transactions_asc,
+        timeline=timeline,
         investor_id=investor_id,
         period_start=period_start,
         period_end=period_end,
@@ -297,81 +199,137 @@ def _build_transaction_summary(
 def _prepare_transactions_data(
     manager,
     investor_id: int | None,
-    tx_type: str | None,
     start_date: date | None,
     end_date: date | None,
-):
+) -> tuple[dict, ReportTimeline, TransactionReportSummaryDTO]:
     name_map = {inv.id: inv.name for inv in manager.investors}
-    transactions_asc = sorted(manager.transactions, key=_sort_transaction_key)
-    transactions_desc = sorted(transactions_asc, key=_sort_transaction_key, reverse=True)
-    period_start, period_end = _resolve_period_bounds(
-        transactions_asc=transactions_asc,
+    timeline = get_report_timeline_cache().get(manager)
+
+    def _build_summary() -> TransactionReportSummaryDTO:
+        period_start, period_end = _resolve_period_bounds(
+            timeline=timeline,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return _build_transaction_summary(
+            transactions=timeline.window(investor_id, start_date, end_date)[::-1],
+            timeline=timeline,
+            investor_id=investor_id,
+            period_start=period_start,
+            period_end=period_end,
+        )
+
+    # The summary ignores tx_type, so every page and type filter of a range shares it
+    summary = get_report_summary_cache().get_or_build(
+        manager, (investor_id, start_date, end_date), _build_summary
+    )
+    return name_map, timeline, summary
+
+
+def _filtered_transactions(
+    timeline: ReportTimeline,
+    investor_id: int | None,
+    tx_type: str | None,
+    start_date: date | None,
+    end_date: date | None,
+) -> list:
+    """Every matching transaction, newest first (exports)."""
+    return timeline.window(investor_id, start_date, end_date, kinds=kinds_filter(tx_type), type_text=tx_type)[::-1]
+
+
+def _build_transaction_report(
+    manager,
+    investor_id: int | None,
+    tx_type: str | None,
+    start_date: date | None,
+    end_date: date | None,
+    page: int,
+    page_size: int,
+    before: tuple[datetime, int] | None,
+) -> TransactionReportDTO:
+    name_map, timeline, summary = _prepare_transactions_data(
+        manager=manager,
+        investor_id=investor_id,
         start_date=start_date,
         end_date=end_date,
     )
+    page_items, total, has_more = timeline.page_desc(
+        investor_id=investor_id,
+        start=start_date,
+        end=end_date,
+        before=before,
+        offset=0 if before is not None else (page - 1) * page_size,
+        limit=page_size,
+        kinds=kinds_filter(tx_type),
+        type_text=tx_type,
+    )
+    items = [
+        transaction_to_dto(tx, name_map.get(tx.investor_id, f"Investor {tx.investor_id}"))
+        for tx in page_items
+    ]
+
+    return TransactionReportDTO(
+        summary=summary,
+        items=items,
+        total=total,
+        page=page,
+        page_size=page_size,
+        next_cursor=encode_cursor(page_items[-1]) if has_more and page_items else None,
+    )
+
 
-    kpi_filtered = [
-        tx
-        for tx in transactions_desc
-        if _match_base_filters(tx, investor_id=investor_id, start_date=start_date, end_date=end_date)
+def _build_dashboard(manager, nav: float | None) -> DashboardResponseDTO:
+    valuations = get_valuation_table(manager, nav)
+    current_nav = valuations.nav
+    total_units = manager.get_total_units()
+    total_fees_paid = manager.get_total_fees_paid()
+    current_price = manager.calculate_price_per_unit(current_nav) if current_nav > 0 else 0.0
+
+    fm = manager.get_fund_manager()
+    fm_value = 0.0
+    if fm:
+        fm_units = manager.get_investor_units(fm.id)
+        fm_value = fm_units * current_price
+
+    # Top 10 by balance from the shared valuation table (stable on ties)
+    top = [
+        TopInvestorDTO(
+            investor_id=row.investor.id,
+            investor_name=row.investor.name,
+            balance=row.balance,
+            profit=row.profit,
+            profit_percent=row.profit_percent,
+        )
+        for row in valuations.top(10)
     ]
-    filtered = [tx for tx in kpi_filtered if _match_tx_type(tx, tx_type)]
 
-    summary = _build_transaction_summary(
-        transactions=kpi_filtered,
-        transactions_asc=transactions_asc,
-        investor_id=investor_id,
-        period_start=period_start,
-        period_end=period_end,
+    # Fund performance = price-per-unit growth since inception.
+    # This correctly reflects the fund's investment return regardless of
+    # deposits/withdrawals (which don't affect price per unit).
+    gross_return = (current_price / DEFAULT_UNIT_PRICE - 1.0) if current_price > 0 else 0.0
+    # Year-to-date unit-price growth, read from the materialized daily series.
+    return_ytd = manager.get_period_return(date(date.today().year, 1, 1))
+
+    return DashboardResponseDTO(
+        kpis=DashboardKPIDTO(
+            total_nav=current_nav,
+            total_investors=len(valuations),
+            total_units=total_units,
+            total_fees_paid=total_fees_paid,
+            fund_manager_value=fm_value,
+            gross_return=gross_return,
+            return_ytd=return_ytd,
+        ),
+        top_investors=top,
     )
-    return name_map, filtered, summary
 
 
 @router.get("/dashboard", response_model=ApiResponse[DashboardResponseDTO])
 def dashboard(nav: float | None = Query(default=None, ge=0), _user=Depends(require_read_access)):
     def _read(manager):
-        current_nav = nav if nav is not None else (manager.get_latest_total_nav() or 0.0)
-        regular_investors = manager.get_regular_investors()
-        total_units = sum(t.units for t in manager.tranches)
-        total_fees_paid = sum(t.cumulative_fees_paid for t in manager.tranches)
-        current_price = manager.calculate_price_per_unit(current_nav) if current_nav > 0 else 0.0
-
-        fm = manager.get_fund_manager()
-        fm_value = 0.0
-        if fm:
-            fm_units = manager.get_investor_units(fm.id)
-            fm_value = fm_units * current_price
-
-        top = []
-        for inv in regular_investors:
-            balance, profit, profit_pct = manager.get_investor_balance(inv.id, current_nav)
-            top.append(
-                TopInvestorDTO(
-                    investor_id=inv.id,
-                    investor_name=inv.name,
-                    balance=balance,
-                    profit=profit,
-                    profit_percent=profit_pct,
-                )
-            )
-        top.sort(key=lambda row: row.balance, reverse=True)
-
-        # Fund performance = price-per-unit growth since inception.
-        # This correctly reflects the fund's investment return regardless of
-        # deposits/withdrawals (which don't affect price per unit).
-        gross_return = (current_price / DEFAULT_UNIT_PRICE - 1.0) if current_price > 0 else 0.0
-
-        return DashboardResponseDTO(
-            kpis=DashboardKPIDTO(
-                total_nav=current_nav,
-                total_investors=len(regular_investors),
-                total_units=total_units,
-                total_fees_paid=total_fees_paid,
-                fund_manager_value=fm_value,
-                gross_return=gross_return,
-            ),
-            top_investors=top[:10],
-        )
+        # Cached per snapshot; the YTD window also depends on today's date.
+        key = (nav, date.today())
+        return get_dashboard_cache().get_or_build(manager, key, lambda: _build_dashboard(manager, nav))
 
     return ApiResponse(data=runtime.read(_read))
 
@@ -504,32 +462,21 @@ def transaction_report(
     tx_type: str | None = Query(default=None),
     start_date: str | None = Query(default=None),
     end_date: str | None = Query(default=None),
+    before: tuple[datetime, int] | None = Depends(keyset_cursor),
     _user=Depends(require_read_access),
 ):
     normalized_start_date, normalized_end_date = _normalize_date_range(start_date, end_date)
 
     def _read(manager):
-        name_map, filtered, summary = _prepare_transactions_data(
-            manager=manager,
+        return _build_transaction_report(
+            manager,
             investor_id=investor_id,
             tx_type=tx_type,
             start_date=normalized_start_date,
             end_date=normalized_end_date,
-        )
-
-        start = (page - 1) * page_size
-        end = start + page_size
-        items = [
-            transaction_to_dto(tx, name_map.get(tx.investor_id, f"Investor {tx.investor_id}"))
-            for tx in filtered[start:end]
-        ]
-
-        return TransactionReportDTO(
-            summary=summary,
-            items=items,
-            total=len(filtered),
             page=page,
             page_size=page_size,
+            before=before,
         )
 
     return ApiResponse(data=runtime.read(_read))
@@ -542,37 +489,31 @@ def my_transaction_report(
     tx_type: str | None = Query(default=None),
     start_date: str | None = Query(default=None),
     end_date: str | None = Query(default=None),
+    before: tuple[datetime, int] | None = Depends(keyset_cursor),
     investor_ctx: InvestorAccessContext = Depends(require_investor_access),
 ):
     normalized_start_date, normalized_end_date = _normalize_date_range(start_date, end_date)
 
     def _read(manager):
-        name_map, filtered, summary = _prepare_transactions_data(
-            manager=manager,
+        return _build_transaction_report(
+            manager,
             investor_id=investor_ctx.investor_id,
             tx_type=tx_type,
             start_date=normalized_start_date,
             end_date=normalized_end_date,
-        )
-
-        start = (page - 1) * page_size
-        end = start + page_size
-        items = [
-            transaction_to_dto(tx, name_map.get(tx.investor_id, f"Investor {tx.investor_id}"))
-            for tx in filtered[start:end]
-        ]
-
-        return TransactionReportDTO(
-            summary=summary,
-            items=items,
-            total=len(filtered),
             page=page,
             page_size=page_size,
+            before=before,
         )
 
     return ApiResponse(data=runtime.read(_read))
 
 
+def _export_filename(generated_at: datetime, extension: str) -> dict[str, str]:
+    filename = f"cnfund-transactions-{generated_at.strftime('%Y-%m-%d')}.{extension}"
+    return {"Content-Disposition": f'attachment; filename="{filename}"'}
+
+
 def _build_export_payload(
     export_format: str,
     investor_id: int | None,
@@ -580,55 +521,70 @@ def _build_export_payload(
     normalized_start_date: date | None,
     normalized_end_date: date | None,
 ):
+    if export_format == "csv":
+        return _stream_csv_export(investor_id, tx_type, normalized_start_date, normalized_end_date)
+
     def _read(manager):
-        name_map, filtered, summary = _prepare_transactions_data(
+        name_map, timeline, summary = _prepare_transactions_data(
             manager=manager,
             investor_id=investor_id,
-            tx_type=tx_type,
             start_date=normalized_start_date,
             end_date=normalized_end_date,
         )
-        generated_at = datetime.now(timezone.utc).replace(tzinfo=None)
-
-        if export_format == "pdf":
-            content = build_transactions_pdf(
-                transactions=filtered,
-                name_map=name_map,
-                summary=summary,
-                start_date=normalized_start_date,
-                end_date=normalized_end_date,
-                generated_at=generated_at,
-            )
-            media_type = "application/pdf"
-            extension = "pdf"
-        else:
-            content = build_transactions_csv(
-                transactions=filtered,
-                name_map=name_map,
-                summary=summary,
-                start_date=normalized_start_date,
-                end_date=normalized_end_date,
-            )
-            media_type = "text/csv; charset=utf-8"
-            extension = "csv"
-
-        return {
-            "content": content,
-            "media_type": media_type,
-            "extension": extension,
-            "generated_at": generated_at,
-        }
-
-    payload = runtime.read(_read)
-    filename_date = payload["generated_at"].strftime("%Y-%m-%d")
-    filename = f"cnfund-transactions-{filename_date}.{payload['extension']}"
-    headers = {
-        "Content-Disposition": f'attachment; filename="{filename}"',
-    }
+        filtered = _filtered_transactions(
+            timeline, investor_id, tx_type, normalized_start_date, normalized_end_date
+        )
+        return filtered, name_map, summary
+
+    # Rendering works on the snapshot's rows after the read callback returns;
+    # large exports should use the export job endpoints instead
+    filtered, name_map, summary = runtime.read(_read)
+    generated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    content = build_transactions_pdf(
+        transactions=filtered,
+        name_map=name_map,
+        summary=summary,
+        start_date=normalized_start_date,
+        end_date=normalized_end_date,
+        generated_at=generated_at,
+    )
     return Response(
-        content=payload["content"],
-        media_type=payload["media_type"],
-        headers=headers,
+        content=content,
+        media_type="application/pdf",
+        headers=_export_filename(generated_at, "pdf"),
+    )
+
+
+def _stream_csv_export(
+    investor_id: int | None,
+    tx_type: str | None,
+    start_date: date | None,
+    end_date: date | None,
+) -> StreamingResponse:
+    """
+    Stream the CSV report. Only the summary and the filter spans are resolved
+    inside ``runtime.read``; rows are then written in chunks from that snapshot's
+    timeline, which (like its transactions) is never modified after publication.
+    """
+
+    def _read(manager):
+        name_map, timeline, summary = _prepare_transactions_data(
+            manager=manager,
+            investor_id=investor_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        rows = timeline.iter_desc(
+            investor_id, start_date, end_date, kinds=kinds_filter(tx_type), type_text=tx_type
+        )
+        return iter_transactions_csv(rows, name_map, summary, start_date, end_date)
+
+    chunks = runtime.read(_read)
+    generated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    return StreamingResponse(
+        chunks,
+        media_type="text/csv; charset=utf-8",
+        headers=_export_filename(generated_at, "csv"),
     )
 
 
@@ -675,3 +631,90 @@ def export_my_transactions(
         normalized_start_date=normalized_start_date,
         normalized_end_date=normalized_end_date,
     )
+
+
+def _submit_pdf_job(
+    owner: str,
+    investor_id: int | None,
+    tx_type: str | None,
+    start_date: str | None,
+    end_date: str | None,
+) -> ExportJobDTO:
+    normalized_start_date, normalized_end_date = _normalize_date_range(start_date, end_date)
+
+    def _read(manager):
+        name_map, timeline, summary = _prepare_transactions_data(
+            manager=manager,
+            investor_id=investor_id,
+            start_date=normalized_start_date,
+            end_date=normalized_end_date,
+        )
+        rows = _filtered_transactions(timeline, investor_id, tx_type, normalized_start_date, normalized_end_date)
+        return rows, name_map, summary
+
+    # Only the row selection runs against the snapshot; rendering happens in the job pool
+    rows, name_map, summary = runtime.read(_read)
+    try:
+        job = get_export_job_queue().submit(
+            owner=owner,
+            transactions=rows,
+            name_map=name_map,
+            summary=summary.model_dump(),
+            start_date=normalized_start_date,
+            end_date=normalized_end_date,
+        )
+    except ExportQueueFull as exc:
+        raise HTTPException(status_code=429, detail=str(exc)) from exc
+    return ExportJobDTO(**job)
+
+
+def _job_owner(user) -> str:
+    return f"user:{user.id}"
+
+
+def _owned_job(job_id: str, user) -> dict:
+    job = get_export_job_queue().get(job_id, _job_owner(user))
+    if job is None:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return job
+
+
+@router.post("/transactions/export/jobs", response_model=ApiResponse[ExportJobDTO], status_code=202)
+def submit_transactions_export_job(
+    investor_id: int | None = Query(default=None, ge=0),
+    tx_type: str | None = Query(default=None),
+    start_date: str | None = Query(default=None),
+    end_date: str | None = Query(default=None),
+    user=Depends(require_read_access),
+):
+    return ApiResponse(data=_submit_pdf_job(_job_owner(user), investor_id, tx_type, start_date, end_date))
+
+
+@router.post("/me/transactions/export/jobs", response_model=ApiResponse[ExportJobDTO], status_code=202)
+def submit_my_transactions_export_job(
+    tx_type: str | None = Query(default=None),
+    start_date: str | None = Query(default=None),
+    end_date: str | None = Query(default=None),
+    investor_ctx: InvestorAccessContext = Depends(require_investor_access),
+):
+    return ApiResponse(
+        data=_submit_pdf_job(
+            _job_owner(investor_ctx.user), investor_ctx.investor_id, tx_type, start_date, end_date
+        )
+    )
+
+
+@router.get("/export-jobs/{job_id}", response_model=ApiResponse[ExportJobDTO])
+def export_job_status(job_id: str, user=Depends(get_current_user)):
+    return ApiResponse(data=ExportJobDTO(**_owned_job(job_id, user)))
+
+
+@router.get("/export-jobs/{job_id}/download")
+def download_export_job(job_id: str, user=Depends(get_current_user)):
+    job = _owned_job(job_id, user)
+    if job["status"] != "done":
+        raise HTTPException(status_code=409, detail=f"Export job is {job['status']}")
+    path = get_export_job_queue().store.artifact_path(job_id)
+    if not path.exists():
+        raise HTTPException(status_code=404, detail="Export artifact expired")
+    return FileResponse(path, media_type="application/pdf", filename=job["filename"])
@@ -1,10 +1,16 @@
 from fastapi import APIRouter, Depends, Query
 
-from ...api.deps import require_read_access
+from ...api.deps import require_admin_access, require_read_access
 from ...core.config import get_settings
 from ...schemas.common import ApiResponse
 from ...schemas.system import FeatureFlagsDTO, LocationProvinceDTO, LocationWardDTO
+from ...services.backup_worker import get_auto_backup_worker
+from ...services.drive_upload import get_drive_uploader
+from ...services.export_jobs import get_export_job_queue
+from ...services.fund_runtime import get_runtime
+from ...services.investor_valuations import get_valuation_cache
 from ...services.location_catalog import get_provinces, get_wards
+from ...services.snapshot_cache import get_dashboard_cache
 
 
 router = APIRouter()
@@ -23,6 +29,20 @@ def feature_flags(_user=Depends(require_read_access)):
     )
 
 
+@router.get("/runtime-stats", response_model=ApiResponse[dict])
+def runtime_stats(_user=Depends(require_admin_access)):
+    return ApiResponse(
+        data={
+            "lock": get_runtime().lock_stats(),
+            "dashboard_cache": get_dashboard_cache().stats(),
+            "valuation_cache": get_valuation_cache().stats(),
+            "export_jobs": get_export_job_queue().stats(),
+            "auto_backup": get_auto_backup_worker().stats(),
+            "drive_upload": get_drive_uploader().stats(),
+        }
+    )
+
+
 @router.get("/locations/provinces", response_model=ApiResponse[list[LocationProvinceDTO]])
 def location_provinces(_user=Depends(require_read_access)):
     return ApiResponse(data=[LocationProvinceDTO(**row) for row in get_provinces()])
@@ -1,6 +1,9 @@
+from datetime import date, datetime
+from typing import Callable
+
 from fastapi import APIRouter, Depends, HTTPException, Query
 
-from ...api.deps import require_mutate_access, require_read_access
+from ...api.deps import keyset_cursor, require_mutate_access, require_read_access
 from ...core.config import get_settings
 from ...schemas.common import ApiResponse, PaginatedResponse
 from ...schemas.transactions import (
@@ -8,9 +11,11 @@ from ...schemas.transactions import (
     TransactionCreateRequest,
     TransactionDTO,
 )
-from ...services.backup_service import trigger_auto_backup_after_transaction
+from ...services.backup_worker import get_auto_backup_worker
 from ...services.fund_runtime import runtime
 from ...services.mappers import transaction_to_card_dto, transaction_to_dto
+from ...services.pagination import encode_cursor
+from ...services.report_timeline import get_report_timeline_cache, kinds_filter
 
 
 router = APIRouter()
@@ -24,26 +29,56 @@ def _investor_name_map(manager) -> dict[int, str]:
     return names
 
 
+def _transaction_page(
+    manager,
+    to_dto: Callable,
+    page: int,
+    page_size: int,
+    before: tuple[datetime, int] | None,
+    investor_id: int | None,
+    start_date: date | None,
+    end_date: date | None,
+    tx_type: str | None,
+) -> PaginatedResponse:
+    """Newest-first page from the cached (date, id) timeline; keyset when ``before`` is given."""
+    name_map = _investor_name_map(manager)
+    if start_date and end_date and start_date > end_date:
+        start_date, end_date = end_date, start_date
+    page_items, total, has_more = get_report_timeline_cache().get(manager).page_desc(
+        investor_id=investor_id,
+        start=start_date,
+        end=end_date,
+        before=before,
+        offset=0 if before is not None else (page - 1) * page_size,
+        limit=page_size,
+        kinds=kinds_filter(tx_type),
+        type_text=tx_type,
+    )
+    items = [to_dto(tx, name_map.get(tx.investor_id, f"Investor {tx.investor_id}")) for tx in page_items]
+    return PaginatedResponse(
+        items=items,
+        total=total,
+        page=page,
+        page_size=page_size,
+        next_cursor=encode_cursor(page_items[-1]) if has_more and page_items else None,
+    )
+
+
 @router.get("", response_model=ApiResponse[PaginatedResponse[TransactionDTO]])
 def list_transactions(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=200),
+    before: tuple[datetime, int] | None = Depends(keyset_cursor),
+    investor_id: int | None = Query(default=None, ge=0),
+    start_date: date | None = Query(default=None),
+    end_date: date | None = Query(default=None),
+    tx_type: str | None = Query(default=None),
     _user=Depends(require_read_access),
 ):
     def _read(manager):
-        name_map = _investor_name_map(manager)
-        all_txs = sorted(
-            manager.transactions,
-            key=lambda tx: (tx.date, tx.id),
-            reverse=True,
+        return _transaction_page(
+            manager, transaction_to_dto, page, page_size, before, investor_id, start_date, end_date, tx_type
         )
-        start = (page - 1) * page_size
-        end = start + page_size
-        items = [
-            transaction_to_dto(tx, name_map.get(tx.investor_id, f"Investor {tx.investor_id}"))
-            for tx in all_txs[start:end]
-        ]
-        return PaginatedResponse(items=items, total=len(all_txs), page=page, page_size=page_size)
 
     return ApiResponse(data=runtime.read(_read))
 
@@ -52,22 +87,17 @@ def list_transactions(
 def list_transaction_cards(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=200),
+    before: tuple[datetime, int] | None = Depends(keyset_cursor),
+    investor_id: int | None = Query(default=None, ge=0),
+    start_date: date | None = Query(default=None),
+    end_date: date | None = Query(default=None),
+    tx_type: str | None = Query(default=None),
     _user=Depends(require_read_access),
 ):
     def _read(manager):
-        name_map = _investor_name_map(manager)
-        all_txs = sorted(
-            manager.transactions,
-            key=lambda tx: (tx.date, tx.id),
-            reverse=True,
+        return _transaction_page(
+            manager, transaction_to_card_dto, page, page_size, before, investor_id, start_date, end_date, tx_type
         )
-        start = (page - 1) * page_size
-        end = start + page_size
-        items = [
-            transaction_to_card_dto(tx, name_map.get(tx.investor_id, f"Investor {tx.investor_id}"))
-            for tx in all_txs[start:end]
-        ]
-        return PaginatedResponse(items=items, total=len(all_txs), page=page, page_size=page_size)
 
     return ApiResponse(data=runtime.read(_read))
 
@@ -110,24 +140,16 @@ def create_transaction(payload: TransactionCreateRequest, _user=Depends(require_
             raise HTTPException(status_code=400, detail=message)
         return {"success": True, "message": message}
 
-    result = runtime.mutate(_write)
+    result, changes = runtime.mutate_with_changes(_write)
+    result["changes"] = changes
 
     if settings.auto_backup_on_new_transaction:
+        # Queued, not run: a burst of transactions shares one ticket and one backup of the final state
         try:
-            auto_backup = runtime.read(
-                lambda manager: trigger_auto_backup_after_transaction(
-                    manager,
-                    transaction_type=payload.transaction_type,
-                )
-            )
-            result["auto_backup"] = auto_backup
+            ticket = get_auto_backup_worker().request(payload.transaction_type)
+            result["auto_backup"] = {"ticket_id": ticket["ticket_id"], "status": ticket["status"]}
         except Exception as exc:
-            result["auto_backup"] = {
-                "backup_id": None,
-                "local_backup": False,
-                "google_drive_uploaded": False,
-                "google_drive_reason": f"auto_backup_failed:{exc}",
-            }
+            result["auto_backup"] = {"ticket_id": None, "status": "failed", "error": f"auto_backup_failed:{exc}"}
 
     return ApiResponse(message="Transaction processed", data=result)
 
@@ -140,7 +162,9 @@ def delete_transaction(transaction_id: int, _user=Depends(require_mutate_access)
             raise HTTPException(status_code=400, detail="Delete failed")
         return {"deleted": True, "transaction_id": transaction_id}
 
-    return ApiResponse(message="Transaction deleted", data=runtime.mutate(_write))
+    result, changes = runtime.mutate_with_changes(_write)
+    result["changes"] = changes
+    return ApiResponse(message="Transaction deleted", data=result)
 
 
 @router.post("/{transaction_id}/undo", response_model=ApiResponse[dict])
@@ -151,4 +175,6 @@ def undo_transaction(transaction_id: int, _user=Depends(require_mutate_access)):
             raise HTTPException(status_code=400, detail="Undo failed")
         return {"undone": True, "transaction_id": transaction_id}
 
-    return ApiResponse(message="Transaction undone", data=runtime.mutate(_write))
+    result, changes = runtime.mutate_with_changes(_write)
+    result["changes"] = changes
+    return ApiResponse(message="Transaction undone", data=result)
@@ -31,6 +31,24 @@ class Settings(BaseSettings):
     feature_fee_safety: bool = True
     feature_transactions_load_more: bool = True
     auto_backup_on_new_transaction: bool = True
+    auto_backup_debounce_seconds: float = 5.0
+    auto_backup_max_delay_seconds: float = 60.0
+    backup_format: str = "xlsx"  # xlsx | archive (columnar zip, opt-in)
+    backup_incremental: bool = True
+    backup_full_every: int = 20
+    drive_upload_chunk_mb: int = 8
+    drive_upload_max_retries: int = 5
+    drive_upload_backoff_seconds: float = 1.0
+    generation_check_ttl_seconds: float = 0.5
+    fee_preview_cache_ttl_seconds: int = 600
+    fee_preview_cache_max_entries: int = 32
+    dashboard_cache_max_entries: int = 16
+    valuation_cache_max_entries: int = 8
+    report_summary_cache_max_entries: int = 32
+    export_jobs_dir: str = ""
+    export_job_workers: int = 2
+    export_job_max_pending: int = 8
+    export_job_ttl_hours: int = 24
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -15,6 +15,8 @@ from .core.database import Base, SessionLocal, engine
 from .core.rate_limit import limiter
 from .core.security import decode_token, get_password_hash
 from .models.auth import AuditLog, User
+from .services.backup_worker import shutdown_auto_backup_worker
+from .services.export_jobs import shutdown_export_job_queue
 
 
 logger = logging.getLogger(__name__)
@@ -56,6 +58,8 @@ async def lifespan(_app: FastAPI):
     finally:
         db.close()
     yield
+    shutdown_export_job_queue()
+    shutdown_auto_backup_worker()
 
 
 app = FastAPI(
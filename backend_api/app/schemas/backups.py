@@ -8,6 +8,18 @@ class BackupListItemDTO(BaseModel):
     metadata: dict
 
 
+class AutoBackupTicketDTO(BaseModel):
+    ticket_id: str
+    status: str  # queued | running | done | failed
+    requests: int
+    transaction_types: list[str]
+    created_at: str
+    started_at: str | None = None
+    finished_at: str | None = None
+    result: dict | None = None
+    error: str | None = None
+
+
 class RestoreBackupRequest(BaseModel):
     backup_id: str = Field(min_length=1, max_length=255, pattern=r"^[\w\-\.]+$")
     backup_date: str | None = None
@@ -17,6 +17,8 @@ class PaginatedResponse(BaseModel, Generic[T]):
     total: int
     page: int = Field(ge=1)
     page_size: int = Field(ge=1, le=200)
+    # Keyset cursor for the next page (pass back as ?cursor=); None on the last page
+    next_cursor: str | None = None
 
 
 class ValidationErrorPayload(BaseModel):
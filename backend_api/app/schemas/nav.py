@@ -13,3 +13,15 @@ class NavPointDTO(BaseModel):
     nav: float
     type: str
 
+
+class NavDailyPointDTO(BaseModel):
+    date: str
+    total_nav: float
+    total_units: float
+    price_per_unit: float
+
+
+class NavSeriesDTO(BaseModel):
+    points: list[NavDailyPointDTO]
+    period_return: float
+
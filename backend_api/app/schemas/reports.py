@@ -13,6 +13,7 @@ class DashboardKPIDTO(BaseModel):
     total_fees_paid: float
     fund_manager_value: float
     gross_return: float
+    return_ytd: float = 0.0
 
 
 class TopInvestorDTO(BaseModel):
@@ -113,3 +114,17 @@ class TransactionReportDTO(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: str | None = None
+
+
+class ExportJobDTO(BaseModel):
+    job_id: str
+    status: str  # queued | running | done | failed
+    progress: float
+    total_rows: int
+    filename: str
+    created_at: str
+    started_at: str | None = None
+    finished_at: str | None = None
+    error: str | None = None
+    size_bytes: int | None = None
@@ -1,8 +1,14 @@
-import base64
+import gzip
+import hashlib
+import importlib.util
+import io
 import json
 import logging
 import os
 import re
+import threading
+import zipfile
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
@@ -14,9 +20,41 @@ from core.models import FeeRecord, Investor, Transaction, Tranche
 from helpers import parse_currency
 from utils.type_safety_fixes import safe_float_conversion, safe_int_conversion
 
+from ..core.config import get_settings
+from .drive_upload import get_drive_uploader
+
 logger = logging.getLogger(__name__)
 
 EXPORT_DIR = Path(__file__).resolve().parents[3] / "exports"
+BACKUP_SUFFIXES = (".xlsx", ".zip")
+ARCHIVE_SUFFIX = ".zip"
+ARCHIVE_FORMAT = "cnfund-backup"
+ARCHIVE_VERSION = 2
+ARCHIVE_MANIFEST = "manifest.json"
+CHAIN_STATE_FILE = "backup_chain_state.json"
+# Row key per table, used to diff incremental backups
+TABLE_KEYS = {
+    "Investors": "id",
+    "Tranches": "tranche_id",
+    "Transactions": "id",
+    "Fee Records": "id",
+    "Fee Config Global": "id",
+    "Fee Config Overrides": "investor_id",
+}
+_MIME_TYPES = {
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ".zip": "application/zip",
+}
+_chain_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class _WrittenBackup:
+    path: Path
+    # Hash of the frames, known at write time for xlsx backups
+    content_hash: str | None = None
+    # Base of a new incremental chain: always uploaded, later increments point at it
+    chain_base: bool = False
 
 
 def _as_date(value: Any):
@@ -161,7 +199,9 @@ def list_local_backups(days: int = 30) -> list[dict[str, Any]]:
     EXPORT_DIR.mkdir(exist_ok=True)
     cutoff = datetime.now() - timedelta(days=days)
     items: list[dict[str, Any]] = []
-    for path in EXPORT_DIR.glob("Fund_Export_*.xlsx"):
+    for path in EXPORT_DIR.glob("Fund_Export_*"):
+        if path.suffix not in BACKUP_SUFFIXES:
+            continue
         stat = path.stat()
         modified = datetime.fromtimestamp(stat.st_mtime)
         if modified < cutoff:
@@ -171,25 +211,33 @@ def list_local_backups(days: int = 30) -> list[dict[str, Any]]:
             backup_type = "auto"
         elif "manual" in filename:
             backup_type = "manual"
+        elif "compact" in filename:
+            backup_type = "compact"
         else:
             backup_type = "unknown"
-        items.append(
-            {
-                "backup_id": filename,
-                "backup_type": backup_type,
-                "created_at": modified.isoformat(),
-                "size_kb": round(stat.st_size / 1024, 1),
-                "path": str(path),
-            }
-        )
+        item = {
+            "backup_id": filename,
+            "backup_type": backup_type,
+            "created_at": modified.isoformat(),
+            "size_kb": round(stat.st_size / 1024, 1),
+            "path": str(path),
+            "format": "archive" if path.suffix == ARCHIVE_SUFFIX else "xlsx",
+        }
+        if path.suffix == ARCHIVE_SUFFIX:
+            try:
+                manifest = read_backup_archive_manifest(path)
+            except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+                manifest = {}
+            item["backup_kind"] = manifest.get("kind", "full")
+            item["base"] = manifest.get("base")
+            item["parent"] = manifest.get("parent")
+        items.append(item)
     items.sort(key=lambda row: row["created_at"], reverse=True)
     return items
 
 
-def _write_backup_excel(fund_manager, filename: str) -> Path:
-    EXPORT_DIR.mkdir(exist_ok=True)
-    output_path = EXPORT_DIR / filename
-
+def _backup_frames(fund_manager) -> dict[str, pd.DataFrame]:
+    """One DataFrame per backed-up table, keyed by its Excel sheet name (restore order)."""
     investors_df = pd.DataFrame(
         [
             {
@@ -298,17 +346,433 @@ def _write_backup_excel(fund_manager, filename: str) -> Path:
         ]
     )
 
+    return {
+        "Investors": investors_df,
+        "Tranches": tranches_df,
+        "Transactions": transactions_df,
+        "Fee Records": fees_df,
+        "Fee Config Global": fee_global_df,
+        "Fee Config Overrides": fee_overrides_df,
+    }
+
+
+def _write_backup_excel(frames: dict[str, pd.DataFrame], filename: str) -> Path:
+    EXPORT_DIR.mkdir(exist_ok=True)
+    output_path = EXPORT_DIR / filename
+
     with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-        investors_df.to_excel(writer, sheet_name="Investors", index=False)
-        tranches_df.to_excel(writer, sheet_name="Tranches", index=False)
-        transactions_df.to_excel(writer, sheet_name="Transactions", index=False)
-        fees_df.to_excel(writer, sheet_name="Fee Records", index=False)
-        fee_global_df.to_excel(writer, sheet_name="Fee Config Global", index=False)
-        fee_overrides_df.to_excel(writer, sheet_name="Fee Config Overrides", index=False)
+        for sheet_name, frame in frames.items():
+            frame.to_excel(writer, sheet_name=sheet_name, index=False)
 
     return output_path
 
 
+def _frames_content_hash(frames: dict[str, pd.DataFrame]) -> str:
+    """
+    SHA-256 over per-table digests of the backup frames. Used for xlsx backups,
+    whose bytes embed the workbook creation time and so never repeat.
+    """
+    content = {
+        "format": "xlsx",
+        "tables": [
+            [name, hashlib.sha256(frame.to_csv(index=False).encode("utf-8")).hexdigest()]
+            for name, frame in frames.items()
+        ],
+    }
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _parquet_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _stringify_objects(frame: pd.DataFrame) -> pd.DataFrame:
+    """Object columns as str/None so Parquet gets one type per column (dates, mixed configs)."""
+    converted = frame.copy()
+    for column in converted.select_dtypes(include="object").columns:
+        converted[column] = [None if value is None or pd.isna(value) else str(value) for value in converted[column]]
+    return converted
+
+
+def _encode_table(frame: pd.DataFrame, codec: str) -> bytes:
+    if codec == "parquet":
+        buffer = io.BytesIO()
+        _stringify_objects(frame).to_parquet(buffer, engine="pyarrow", index=False, compression="snappy")
+        return buffer.getvalue()
+    # mtime=0 keeps the bytes (and checksum) identical for identical data
+    return gzip.compress(frame.to_csv(index=False).encode("utf-8"), mtime=0)
+
+
+def _decode_table(data: bytes, codec: str) -> pd.DataFrame:
+    if codec == "parquet":
+        if not _parquet_available():
+            raise ValueError("pyarrow is required to restore a Parquet backup archive")
+        return pd.read_parquet(io.BytesIO(data), engine="pyarrow")
+    # Read every column as text: restore parses values itself (keeps phone leading zeros)
+    try:
+        return pd.read_csv(io.BytesIO(gzip.decompress(data)), dtype=str)
+    except pd.errors.EmptyDataError:
+        return pd.DataFrame()
+
+
+def _archive_codec() -> str:
+    return "parquet" if _parquet_available() else "csv.gz"
+
+
+def _unique_path(stem: str, suffix: str) -> Path:
+    """``EXPORT_DIR/<stem><suffix>``, numbered when a backup with that name already exists (same second)."""
+    EXPORT_DIR.mkdir(exist_ok=True)
+    path = EXPORT_DIR / f"{stem}{suffix}"
+    counter = 1
+    while path.exists():
+        path = EXPORT_DIR / f"{stem}_{counter}{suffix}"
+        counter += 1
+    return path
+
+
+def _write_backup_archive(
+    frames: dict[str, pd.DataFrame],
+    output_path: Path,
+    header: dict[str, Any] | None = None,
+    deleted: dict[str, list[str]] | None = None,
+) -> Path:
+    """
+    Columnar backup: a zip with one compressed file per table plus ``manifest.json``
+    (codec, row count and SHA-256 per table). Parquet when pyarrow is installed,
+    gzip CSV otherwise; members are already compressed, so the zip only stores them.
+
+    ``header`` overrides the chain fields (``kind``, ``base``, ``parent``,
+    ``sequence``) of a full backup; ``deleted`` lists, per table, the keys an
+    incremental backup removes.
+    """
+    EXPORT_DIR.mkdir(exist_ok=True)
+    codec = _archive_codec()
+    extension = "parquet" if codec == "parquet" else "csv.gz"
+
+    manifest: dict[str, Any] = {
+        "format": ARCHIVE_FORMAT,
+        "version": ARCHIVE_VERSION,
+        "codec": codec,
+        "created_at": datetime.now().isoformat(),
+        "kind": "full",
+        "base": output_path.name,
+        "parent": None,
+        "sequence": 0,
+        **(header or {}),
+        "tables": [],
+    }
+    temp_path = output_path.with_name(f".{output_path.name}.tmp")
+    with zipfile.ZipFile(temp_path, "w", compression=zipfile.ZIP_STORED) as archive:
+        for sheet_name, frame in frames.items():
+            member = f"{_canonical_name(sheet_name)}.{extension}"
+            data = _encode_table(frame, codec)
+            archive.writestr(member, data)
+            entry = {
+                "name": sheet_name,
+                "file": member,
+                "rows": int(len(frame)),
+                "columns": [str(column) for column in frame.columns],
+                "sha256": hashlib.sha256(data).hexdigest(),
+            }
+            if deleted is not None:
+                entry["deleted"] = deleted.get(sheet_name, [])
+            manifest["tables"].append(entry)
+        archive.writestr(ARCHIVE_MANIFEST, json.dumps(manifest, ensure_ascii=False, indent=2))
+    os.replace(temp_path, output_path)
+    return output_path
+
+
+def read_backup_archive_manifest(path: Path) -> dict[str, Any]:
+    with zipfile.ZipFile(path) as archive:
+        manifest = json.loads(archive.read(ARCHIVE_MANIFEST).decode("utf-8"))
+    if manifest.get("format") != ARCHIVE_FORMAT:
+        raise ValueError(f"{path.name} is not a CNFund backup archive")
+    return manifest
+
+
+def _read_backup_archive(path: Path) -> dict[str, pd.DataFrame]:
+    """Tables of a backup archive keyed by sheet name; every member is checked against the manifest."""
+    manifest = read_backup_archive_manifest(path)
+    tables: dict[str, pd.DataFrame] = {}
+    with zipfile.ZipFile(path) as archive:
+        for entry in manifest["tables"]:
+            data = archive.read(entry["file"])
+            if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+                raise ValueError(f"checksum mismatch for {entry['file']} in {path.name}")
+            frame = _decode_table(data, manifest["codec"])
+            if len(frame) != int(entry["rows"]):
+                raise ValueError(f"row count mismatch for {entry['file']} in {path.name}")
+            if frame.empty and entry.get("columns"):
+                frame = pd.DataFrame(columns=entry["columns"])
+            tables[entry["name"]] = frame
+    return tables
+
+
+def _key_text(value: Any) -> str:
+    """Row key as text; ``5``, ``5.0`` and ``"5"`` (CSV) are the same key."""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    text = str(value).strip()
+    if text.endswith(".0") and text[:-2].lstrip("-").isdigit():
+        return text[:-2]
+    return text
+
+
+def _row_digests(frame: pd.DataFrame, key: str) -> dict[str, str] | None:
+    """
+    ``{key: digest of the row}`` in frame order, or None when the key is not
+    unique (such a table cannot be diffed, the next backup is a full one).
+    """
+    if frame.empty or key not in frame.columns:
+        return {}
+    digests: dict[str, str] = {}
+    for key_value, row in zip(frame[key].tolist(), frame.itertuples(index=False, name=None)):
+        payload = json.dumps([str(value) for value in row], ensure_ascii=False)
+        digests[_key_text(key_value)] = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+    return digests if len(digests) == len(frame) else None
+
+
+def _load_chain_state() -> dict[str, Any] | None:
+    try:
+        return json.loads((EXPORT_DIR / CHAIN_STATE_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _save_chain_state(state: dict[str, Any]) -> None:
+    EXPORT_DIR.mkdir(exist_ok=True)
+    path = EXPORT_DIR / CHAIN_STATE_FILE
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_text(json.dumps(state), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def _write_full_backup(frames: dict[str, pd.DataFrame], stem: str) -> _WrittenBackup:
+    """
+    Full archive that becomes the base of a new incremental chain, unless it
+    holds the same rows as the chain head: then the chain carries on from the
+    head, so a full backup whose upload is skipped as unchanged never ends up
+    as the parent of an increment. Caller holds ``_chain_lock``.
+    """
+    path = _write_backup_archive(frames, _unique_path(stem, ARCHIVE_SUFFIX))
+    digests = {name: _row_digests(frame, TABLE_KEYS[name]) for name, frame in frames.items()}
+    state = _load_chain_state()
+    if (
+        state
+        and state.get("head")
+        and (EXPORT_DIR / state["head"]).exists()
+        and all(digest is not None for digest in digests.values())
+        and state.get("tables") == digests
+    ):
+        return _WrittenBackup(path)
+    _save_chain_state({"head": path.name, "base": path.name, "sequence": 0, "tables": digests, "drive": {}})
+    return _WrittenBackup(path, chain_base=True)
+
+
+def _can_extend_chain(state: dict[str, Any] | None, full_every: int) -> bool:
+    if not state or not state.get("head") or not (EXPORT_DIR / state["head"]).exists():
+        return False
+    if int(state.get("sequence", 0)) + 1 >= max(1, full_every):
+        return False
+    tables = state.get("tables") or {}
+    return all(tables.get(name) is not None for name in TABLE_KEYS)
+
+
+def _write_incremental_backup(fund_manager, stem: str) -> _WrittenBackup:
+    """
+    Auto backup as an increment of the current chain: only rows whose content
+    changed since the chain head, plus the keys of removed rows. Falls back to a
+    full archive (new chain) every ``backup_full_every`` backups, when there is
+    no usable chain, or when a table has duplicate keys.
+    """
+    settings = get_settings()
+    frames = _backup_frames(fund_manager)
+    with _chain_lock:
+        state = _load_chain_state()
+        if not settings.backup_incremental or not _can_extend_chain(state, settings.backup_full_every):
+            return _write_full_backup(frames, stem)
+        digests = {name: _row_digests(frame, TABLE_KEYS[name]) for name, frame in frames.items()}
+        if any(current is None for current in digests.values()):
+            return _write_full_backup(frames, stem)
+
+        changed: dict[str, pd.DataFrame] = {}
+        deleted: dict[str, list[str]] = {}
+        for name, frame in frames.items():
+            previous = state["tables"][name]
+            current = digests[name]
+            positions = [index for index, (key, digest) in enumerate(current.items()) if previous.get(key) != digest]
+            changed[name] = frame.iloc[positions]
+            deleted[name] = [key for key in previous if key not in current]
+
+        sequence = int(state["sequence"]) + 1
+        path = _write_backup_archive(
+            changed,
+            _unique_path(f"{stem}_inc", ARCHIVE_SUFFIX),
+            header={"kind": "incremental", "base": state["base"], "parent": state["head"], "sequence": sequence},
+            deleted=deleted,
+        )
+        _save_chain_state(
+            {
+                "head": path.name,
+                "base": state["base"],
+                "sequence": sequence,
+                "tables": digests,
+                "drive": state.get("drive", {}),
+            }
+        )
+        return _WrittenBackup(path)
+
+
+def _chain_for(path: Path) -> list[tuple[Path, dict[str, Any]]]:
+    """(path, manifest) from the full backup up to ``path``, following ``parent`` links."""
+    chain: list[tuple[Path, dict[str, Any]]] = []
+    current = path
+    while True:
+        manifest = read_backup_archive_manifest(current)
+        chain.append((current, manifest))
+        if manifest.get("kind", "full") == "full":
+            break
+        parent = manifest.get("parent")
+        if not parent or any(link.name == parent for link, _ in chain):
+            raise ValueError(f"broken backup chain at {current.name}")
+        current = EXPORT_DIR / parent
+        if not current.exists():
+            raise FileNotFoundError(f"backup chain link missing: {parent}")
+    chain.reverse()
+    return chain
+
+
+def _materialize_chain(chain: list[tuple[Path, dict[str, Any]]]) -> dict[str, pd.DataFrame]:
+    """Tables at the last link of ``chain``: the full backup with every increment replayed in order."""
+    tables = _read_backup_archive(chain[0][0])
+    if len(chain) == 1:
+        return tables
+
+    rows: dict[str, dict[str, dict[str, Any]]] = {}
+    columns: dict[str, list[str]] = {}
+    for name, frame in tables.items():
+        key = TABLE_KEYS.get(name, "id")
+        columns[name] = [str(column) for column in frame.columns]
+        if key not in frame.columns:
+            rows[name] = {}
+            continue
+        rows[name] = {_key_text(record[key]): record for record in frame.to_dict("records")}
+
+    for path, manifest in chain[1:]:
+        increment = _read_backup_archive(path)
+        for entry in manifest["tables"]:
+            name = entry["name"]
+            key = TABLE_KEYS.get(name, "id")
+            table_rows = rows.setdefault(name, {})
+            columns[name] = entry.get("columns") or columns.get(name, [])
+            for deleted_key in entry.get("deleted", []):
+                table_rows.pop(deleted_key, None)
+            # Existing keys are updated in place, new keys keep their backup order at the end
+            for record in increment[name].to_dict("records"):
+                table_rows[_key_text(record[key])] = record
+
+    return {name: pd.DataFrame(list(table_rows.values()), columns=columns[name]) for name, table_rows in rows.items()}
+
+
+def _resolve_backup_path(backup_id: str) -> Path:
+    target = (EXPORT_DIR / backup_id).resolve()
+    if not target.is_relative_to(EXPORT_DIR.resolve()):
+        raise ValueError(f"Invalid backup_id: {backup_id}")
+    if not target.exists():
+        raise FileNotFoundError(f"backup file not found: {backup_id}")
+    return target
+
+
+def _chain_target(backup_id: str | None) -> Path:
+    if backup_id:
+        return _resolve_backup_path(backup_id)
+    state = _load_chain_state()
+    if not state or not state.get("head"):
+        raise FileNotFoundError("no incremental backup chain in exports/")
+    return _resolve_backup_path(state["head"])
+
+
+def verify_backup_chain(backup_id: str | None = None) -> dict[str, Any]:
+    """
+    Check the chain ending at ``backup_id`` (default: the current head): every
+    link present, sequences contiguous, one base, checksums and row counts
+    valid, and the increments replay cleanly. With Google Drive configured,
+    links of the current chain that never reached Drive are reported too
+    (``missing_on_drive``): the chain cannot be restored from Drive alone.
+    """
+    target = _chain_target(backup_id)
+    names: list[str] = []
+    errors: list[str] = []
+    try:
+        chain = _chain_for(target)
+        names = [path.name for path, _ in chain]
+        base = chain[0][0].name
+        for position, (path, manifest) in enumerate(chain):
+            if int(manifest.get("sequence", 0)) != position:
+                errors.append(f"{path.name}: sequence {manifest.get('sequence')} != {position}")
+            if position and manifest.get("base") != base:
+                errors.append(f"{path.name}: base {manifest.get('base')} != {base}")
+        if not errors:
+            _materialize_chain(chain)
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as exc:
+        errors.append(str(exc))
+
+    missing_on_drive: list[str] = []
+    state = _load_chain_state()
+    # Only the current chain records its uploads (older state files have no record)
+    if names and _drive_folder_id() and state and state.get("base") == names[0] and "drive" in state:
+        missing_on_drive = [name for name in names if name not in state["drive"]]
+        if missing_on_drive:
+            errors.append(f"not uploaded to Google Drive: {', '.join(missing_on_drive)}")
+    return {
+        "ok": not errors,
+        "backup_id": target.name,
+        "chain": names,
+        "errors": errors,
+        "missing_on_drive": missing_on_drive,
+    }
+
+
+def compact_backup_chain(backup_id: str | None = None, prune: bool = False) -> dict[str, Any]:
+    """
+    Replay the chain ending at ``backup_id`` (default: the current head) into a
+    new full backup. Compacting the head makes the new file the chain base, so
+    later increments build on it; ``prune`` then deletes the replaced links.
+    """
+    with _chain_lock:
+        target = _chain_target(backup_id)
+        state = _load_chain_state()
+        is_head = bool(state) and state.get("head") == target.name
+        if prune and not is_head:
+            raise ValueError("prune is only allowed when compacting the current chain head")
+
+        chain = _chain_for(target)
+        frames = _materialize_chain(chain)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = _write_backup_archive(frames, _unique_path(f"Fund_Export_{timestamp}_compact", ARCHIVE_SUFFIX))
+        if is_head:
+            # Same data as the head, so the row digests stay valid for the next increment
+            state.update(head=path.name, base=path.name, sequence=0, drive={})
+            _save_chain_state(state)
+
+        pruned: list[str] = []
+        if prune:
+            for link, _ in chain:
+                link.unlink(missing_ok=True)
+                pruned.append(link.name)
+
+    return {"backup_id": path.name, "source": target.name, "chain": [link.name for link, _ in chain], "pruned": pruned}
+
+
+def _write_backup(fund_manager, stem: str, backup_format: str | None = None) -> _WrittenBackup:
+    backup_format = (backup_format or get_settings().backup_format).strip().lower()
+    frames = _backup_frames(fund_manager)
+    if backup_format == "xlsx":
+        return _WrittenBackup(_write_backup_excel(frames, f"{stem}.xlsx"), content_hash=_frames_content_hash(frames))
+    with _chain_lock:
+        return _write_full_backup(frames, stem)
+
+
 def _normalize_drive_folder_id(raw_value: str | None) -> str | None:
     if not raw_value:
         return None
@@ -327,55 +791,56 @@ def _normalize_drive_folder_id(raw_value: str | None) -> str | None:
     return value
 
 
-def _load_google_credentials():
-    token_b64 = (
-        os.getenv("GOOGLE_OAUTH_TOKEN_BASE64")
-        or os.getenv("OAUTH_TOKEN_BASE64")
-        or os.getenv("oauth_token_base64")
-    )
-    token_json_file = Path(__file__).resolve().parents[3] / "token.json"
-
-    creds = None
-    if token_b64:
-        try:
-            from google.oauth2.credentials import Credentials
-
-            token_data = json.loads(base64.b64decode(token_b64.strip()))
-            creds = Credentials.from_authorized_user_info(token_data)
-        except Exception:
-            logger.warning("Failed to load Google credentials from env var")
-            creds = None
-    elif token_json_file.exists():
+def backup_content_hash(path: Path) -> str:
+    """
+    SHA-256 of what a backup holds, not of its bytes: archives hash their table
+    checksums (plus the chain link of an increment), so two backups of the same
+    data match even though their manifests carry different timestamps.
+
+    Workbooks fall back to their bytes; backups written here pass the hash of
+    their frames instead (see ``_frames_content_hash``).
+    """
+    if path.suffix == ARCHIVE_SUFFIX:
+        manifest = read_backup_archive_manifest(path)
+        kind = manifest.get("kind", "full")
+        content = {
+            "kind": kind,
+            "parent": manifest.get("parent") if kind != "full" else None,
+            "tables": [[entry["name"], entry["sha256"], entry.get("deleted", [])] for entry in manifest["tables"]],
+        }
+        return hashlib.sha256(json.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _drive_folder_id() -> str | None:
+    return _normalize_drive_folder_id(os.getenv("GOOGLE_DRIVE_FOLDER_ID") or os.getenv("DRIVE_FOLDER_ID"))
+
+
+def _record_drive_upload(path: Path, drive_result: dict[str, Any]) -> None:
+    """Note an uploaded link of the current chain, for ``verify_backup_chain``."""
+    if path.suffix != ARCHIVE_SUFFIX or not drive_result.get("uploaded"):
+        return
+    with _chain_lock:
+        state = _load_chain_state()
+        if not state or "drive" not in state:
+            return
         try:
-            from google.oauth2.credentials import Credentials
-
-            token_data = json.loads(token_json_file.read_text(encoding="utf-8"))
-            creds = Credentials.from_authorized_user_info(token_data)
-        except Exception:
-            logger.warning("Failed to load Google credentials from token.json")
-            creds = None
-
-    if creds is None:
-        return None, "missing_oauth_token"
-
-    try:
-        from google.auth.transport.requests import Request
-
-        if getattr(creds, "expired", False) and getattr(creds, "refresh_token", None):
-            creds.refresh(Request())
-    except Exception as exc:
-        return None, f"refresh_failed:{exc}"
-
-    if not getattr(creds, "valid", False):
-        return None, "invalid_oauth_token"
-
-    return creds, None
-
-
-def _upload_backup_to_google_drive(local_path: Path) -> dict[str, Any]:
-    folder_id = _normalize_drive_folder_id(
-        os.getenv("GOOGLE_DRIVE_FOLDER_ID") or os.getenv("DRIVE_FOLDER_ID")
-    )
+            base = read_backup_archive_manifest(path).get("base")
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            return
+        # A full archive that did not start a chain is its own base, not a link of this one
+        if base != state.get("base"):
+            return
+        state["drive"][path.name] = drive_result.get("file_id")
+        _save_chain_state(state)
+
+
+def _upload_backup_to_google_drive(backup: _WrittenBackup) -> dict[str, Any]:
+    folder_id = _drive_folder_id()
     if not folder_id:
         return {
             "uploaded": False,
@@ -384,49 +849,21 @@ def _upload_backup_to_google_drive(local_path: Path) -> dict[str, Any]:
             "web_view_link": None,
         }
 
-    creds, error = _load_google_credentials()
-    if creds is None:
-        return {
-            "uploaded": False,
-            "reason": error or "missing_credentials",
-            "file_id": None,
-            "web_view_link": None,
-        }
-
-    try:
-        from googleapiclient.discovery import build
-        from googleapiclient.http import MediaFileUpload
-
-        service = build("drive", "v3", credentials=creds, cache_discovery=False)
-        media = MediaFileUpload(
-            str(local_path),
-            mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            resumable=False,
-        )
-        metadata = {"name": local_path.name, "parents": [folder_id]}
-        uploaded = (
-            service.files()
-            .create(
-                body=metadata,
-                media_body=media,
-                fields="id,name,webViewLink",
-                supportsAllDrives=True,
-            )
-            .execute()
-        )
-        return {
-            "uploaded": True,
-            "reason": None,
-            "file_id": uploaded.get("id"),
-            "web_view_link": uploaded.get("webViewLink"),
-        }
-    except Exception as exc:
-        return {
-            "uploaded": False,
-            "reason": f"upload_failed:{exc}",
-            "file_id": None,
-            "web_view_link": None,
-        }
+    content_hash = backup.content_hash
+    if content_hash is None:
+        try:
+            content_hash = backup_content_hash(backup.path)
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            logger.warning("Could not hash %s, uploading without dedupe", backup.path.name, exc_info=True)
+    drive_result = get_drive_uploader().upload(
+        backup.path,
+        folder_id,
+        mimetype=_MIME_TYPES.get(backup.path.suffix, "application/octet-stream"),
+        content_hash=content_hash,
+        force=backup.chain_base,
+    )
+    _record_drive_upload(backup.path, drive_result)
+    return drive_result
 
 
 def trigger_auto_backup_after_transaction(
@@ -434,40 +871,47 @@ def trigger_auto_backup_after_transaction(
 ) -> dict[str, Any]:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     safe_type = re.sub(r"[^a-zA-Z0-9_-]+", "_", transaction_type).strip("_") or "transaction"
-    filename = f"Fund_Export_{timestamp}_auto_{safe_type}.xlsx"
-
-    local_path = _write_backup_excel(fund_manager, filename)
-    drive_result = _upload_backup_to_google_drive(local_path)
+    stem = f"Fund_Export_{timestamp}_auto_{safe_type}"
+    if get_settings().backup_format.strip().lower() == "xlsx":
+        backup = _write_backup(fund_manager, stem)
+    else:
+        backup = _write_incremental_backup(fund_manager, stem)
+    drive_result = _upload_backup_to_google_drive(backup)
 
     return {
-        "backup_id": local_path.name,
+        "backup_id": backup.path.name,
         "created_at": datetime.now().isoformat(),
         "local_backup": True,
         "google_drive_uploaded": bool(drive_result.get("uploaded")),
         "google_drive_file_id": drive_result.get("file_id"),
+        "google_drive_name": drive_result.get("name"),
         "google_drive_link": drive_result.get("web_view_link"),
         "google_drive_reason": drive_result.get("reason"),
+        "google_drive_skipped": bool(drive_result.get("skipped")),
     }
 
 
-def trigger_manual_backup(fund_manager, description: str = "api_manual") -> dict[str, Any]:
+def trigger_manual_backup(
+    fund_manager, description: str = "api_manual", backup_format: str | None = None
+) -> dict[str, Any]:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     sanitized = re.sub(r"[^a-zA-Z0-9_-]+", "_", description).strip("_")
     suffix = f"_{sanitized}" if sanitized else ""
-    filename = f"Fund_Export_{timestamp}_manual{suffix}.xlsx"
 
-    local_path = _write_backup_excel(fund_manager, filename)
-    drive_result = _upload_backup_to_google_drive(local_path)
+    backup = _write_backup(fund_manager, f"Fund_Export_{timestamp}_manual{suffix}", backup_format)
+    drive_result = _upload_backup_to_google_drive(backup)
 
     return {
-        "backup_id": local_path.name,
+        "backup_id": backup.path.name,
         "backup_type": "manual",
         "created_at": datetime.now().isoformat(),
         "local_backup": True,
         "google_drive_uploaded": bool(drive_result.get("uploaded")),
         "google_drive_file_id": drive_result.get("file_id"),
+        "google_drive_name": drive_result.get("name"),
         "google_drive_link": drive_result.get("web_view_link"),
         "google_drive_reason": drive_result.get("reason"),
+        "google_drive_skipped": bool(drive_result.get("skipped")),
     }
 
 
@@ -477,11 +921,7 @@ def restore_from_local_backup(
     *,
     create_safety_backup: bool = True,
 ) -> dict[str, Any]:
-    target = (EXPORT_DIR / backup_id).resolve()
-    if not target.is_relative_to(EXPORT_DIR.resolve()):
-        raise ValueError(f"Invalid backup_id: {backup_id}")
-    if not target.exists():
-        raise FileNotFoundError(f"backup file not found: {backup_id}")
+    target = _resolve_backup_path(backup_id)
 
     if create_safety_backup:
         try:
@@ -490,7 +930,10 @@ def restore_from_local_backup(
             # Non-blocking: restore can still continue.
             pass
 
-    excel_data = pd.read_excel(target, sheet_name=None)
+    if target.suffix == ARCHIVE_SUFFIX:
+        excel_data = _materialize_chain(_chain_for(target))
+    else:
+        excel_data = pd.read_excel(target, sheet_name=None)
 
     restored_sheets: list[str] = []
 
@@ -669,7 +1112,7 @@ def restore_from_local_backup(
     fund_manager.fee_investor_overrides = fee_investor_overrides
     fund_manager._ensure_fund_manager_exists()
 
-    if not fund_manager.save_data():
+    if not fund_manager.save_data(full_rewrite=True):
         raise RuntimeError("restore save_data failed")
 
     fund_manager.load_data()
@@ -0,0 +1,209 @@
+import logging
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from ..core.config import get_settings
+from .backup_service import trigger_auto_backup_after_transaction
+from .fund_runtime import get_runtime
+
+
+logger = logging.getLogger(__name__)
+
+_TICKET_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+TICKET_HISTORY = 256
+
+
+def _utcnow() -> str:
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+
+
+class AutoBackupWorker:
+    """
+    Background auto backups, coalesced per burst.
+
+    ``request`` only records that a backup is needed and returns the ticket of
+    the pending batch; every request that arrives before the batch starts joins
+    it. A batch runs once no request came in for ``debounce_seconds`` (or at the
+    latest ``max_delay_seconds`` after its first request) and backs up the state
+    at that moment, so one backup covers the whole burst. Requests arriving
+    while a batch runs open the next one.
+    """
+
+    def __init__(
+        self,
+        run_backup: Callable[[str], dict[str, Any]],
+        debounce_seconds: float,
+        max_delay_seconds: float,
+        history: int = TICKET_HISTORY,
+    ) -> None:
+        self._run_backup = run_backup
+        self._debounce = max(0.0, debounce_seconds)
+        self._max_delay = max(self._debounce, max_delay_seconds)
+        self._history = max(1, history)
+        self._cond = threading.Condition()
+        self._tickets: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._pending: dict[str, Any] | None = None
+        self._pending_first = 0.0
+        self._pending_last = 0.0
+        self._running = False
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+        self.requested = 0
+        self.coalesced = 0
+        self.completed = 0
+        self.failed = 0
+
+    def request(self, transaction_type: str) -> dict[str, Any]:
+        now = time.monotonic()
+        with self._cond:
+            if self._stopping:
+                raise RuntimeError("auto backup worker is shut down")
+            ticket = self._pending
+            if ticket is None:
+                ticket = {
+                    "ticket_id": uuid.uuid4().hex,
+                    "status": "queued",
+                    "requests": 0,
+                    "transaction_types": [],
+                    "created_at": _utcnow(),
+                    "started_at": None,
+                    "finished_at": None,
+                    "result": None,
+                    "error": None,
+                }
+                self._pending = ticket
+                self._pending_first = now
+                self._tickets[ticket["ticket_id"]] = ticket
+                while len(self._tickets) > self._history:
+                    self._tickets.popitem(last=False)
+            else:
+                self.coalesced += 1
+            ticket["requests"] += 1
+            if transaction_type not in ticket["transaction_types"]:
+                ticket["transaction_types"].append(transaction_type)
+            self._pending_last = now
+            self.requested += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name="auto-backup", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+            return dict(ticket)
+
+    def _next_batch(self) -> dict[str, Any] | None:
+        with self._cond:
+            while True:
+                if self._pending is None:
+                    if self._stopping:
+                        return None
+                    self._cond.wait()
+                    continue
+                if not self._stopping:
+                    due = min(self._pending_last + self._debounce, self._pending_first + self._max_delay)
+                    remaining = due - time.monotonic()
+                    if remaining > 0:
+                        self._cond.wait(remaining)
+                        continue
+                ticket, self._pending = self._pending, None
+                ticket.update(status="running", started_at=_utcnow())
+                self._running = True
+                return ticket
+
+    def _loop(self) -> None:
+        while True:
+            ticket = self._next_batch()
+            if ticket is None:
+                return
+            types = ticket["transaction_types"]
+            label = types[0] if len(types) == 1 else "batch"
+            try:
+                result = self._run_backup(label)
+            except Exception as exc:
+                logger.exception("Auto backup %s failed", ticket["ticket_id"])
+                with self._cond:
+                    ticket.update(status="failed", error=str(exc) or type(exc).__name__, finished_at=_utcnow())
+                    self.failed += 1
+                    self._running = False
+                    self._cond.notify_all()
+                continue
+            with self._cond:
+                ticket.update(status="done", result=result, finished_at=_utcnow())
+                self.completed += 1
+                self._running = False
+                self._cond.notify_all()
+
+    def get(self, ticket_id: str) -> dict[str, Any] | None:
+        if not _TICKET_ID_PATTERN.match(ticket_id or ""):
+            return None
+        with self._cond:
+            ticket = self._tickets.get(ticket_id)
+            return dict(ticket) if ticket is not None else None
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Block until nothing is queued or running; False when ``timeout`` ran out first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending is not None or self._running:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """Run the pending batch right away (no debounce), then stop the thread."""
+        with self._cond:
+            self._stopping = True
+            thread = self._thread
+            self._cond.notify_all()
+        if thread is not None:
+            thread.join(timeout)
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "pending": int(self._pending is not None),
+                "running": int(self._running),
+                "requested": self.requested,
+                "coalesced": self.coalesced,
+                "completed": self.completed,
+                "failed": self.failed,
+                "debounce_seconds": self._debounce,
+                "max_delay_seconds": self._max_delay,
+            }
+
+
+def _backup_latest_snapshot(transaction_type: str) -> dict[str, Any]:
+    return get_runtime().read(
+        lambda manager: trigger_auto_backup_after_transaction(manager, transaction_type=transaction_type)
+    )
+
+
+_worker: AutoBackupWorker | None = None
+_worker_lock = threading.Lock()
+
+
+def get_auto_backup_worker() -> AutoBackupWorker:
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                settings = get_settings()
+                _worker = AutoBackupWorker(
+                    _backup_latest_snapshot,
+                    debounce_seconds=settings.auto_backup_debounce_seconds,
+                    max_delay_seconds=settings.auto_backup_max_delay_seconds,
+                )
+    return _worker
+
+
+def shutdown_auto_backup_worker(timeout: float | None = 60.0) -> None:
+    global _worker
+    with _worker_lock:
+        worker, _worker = _worker, None
+    if worker is not None:
+        worker.shutdown(timeout)
@@ -0,0 +1,327 @@
+import base64
+import json
+import logging
+import os
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from ..core.config import get_settings
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_PATH = Path(__file__).resolve().parents[3] / "exports" / "drive_upload_state.json"
+# Drive requires resumable chunks to be a multiple of 256 KiB
+CHUNK_ALIGNMENT = 256 * 1024
+# Transient statuses: rate limiting, server errors, request timeout
+RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class DriveUnavailable(RuntimeError):
+    """Drive cannot be reached at all (no credentials, no client library); not retried."""
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
+
+
+def load_google_credentials():
+    token_b64 = (
+        os.getenv("GOOGLE_OAUTH_TOKEN_BASE64")
+        or os.getenv("OAUTH_TOKEN_BASE64")
+        or os.getenv("oauth_token_base64")
+    )
+    token_json_file = Path(__file__).resolve().parents[3] / "token.json"
+
+    creds = None
+    if token_b64:
+        try:
+            from google.oauth2.credentials import Credentials
+
+            token_data = json.loads(base64.b64decode(token_b64.strip()))
+            creds = Credentials.from_authorized_user_info(token_data)
+        except Exception:
+            logger.warning("Failed to load Google credentials from env var")
+            creds = None
+    elif token_json_file.exists():
+        try:
+            from google.oauth2.credentials import Credentials
+
+            token_data = json.loads(token_json_file.read_text(encoding="utf-8"))
+            creds = Credentials.from_authorized_user_info(token_data)
+        except Exception:
+            logger.warning("Failed to load Google credentials from token.json")
+            creds = None
+
+    if creds is None:
+        return None, "missing_oauth_token"
+
+    try:
+        from google.auth.transport.requests import Request
+
+        if getattr(creds, "expired", False) and getattr(creds, "refresh_token", None):
+            creds.refresh(Request())
+    except Exception as exc:
+        return None, f"refresh_failed:{exc}"
+
+    if not getattr(creds, "valid", False):
+        return None, "invalid_oauth_token"
+
+    return creds, None
+
+
+class GoogleDriveApi:
+    """
+    Drive v3 calls used by ``DriveUploader``.
+
+    Credentials and the built service are created once and reused; expired
+    credentials are refreshed in place, and ``reset`` drops both (after an auth
+    error). Any object with the same ``create_upload`` / ``reset`` methods can
+    stand in for it, e.g. a local fake in tests.
+    """
+
+    def __init__(self, credentials_loader: Callable[[], tuple[Any, str | None]] = load_google_credentials) -> None:
+        self._credentials_loader = credentials_loader
+        self._lock = threading.Lock()
+        self._creds = None
+        self._service = None
+
+    def _client(self):
+        with self._lock:
+            creds = self._creds
+            if creds is not None and getattr(creds, "expired", False):
+                try:
+                    from google.auth.transport.requests import Request
+
+                    creds.refresh(Request())
+                except Exception:
+                    logger.warning("Cached Google credentials could not be refreshed", exc_info=True)
+                    creds = None
+            if creds is None or not getattr(creds, "valid", False):
+                creds, error = self._credentials_loader()
+                if creds is None:
+                    raise DriveUnavailable(error or "missing_credentials")
+                self._creds = creds
+                self._service = None
+            if self._service is None:
+                try:
+                    from googleapiclient.discovery import build
+                except ImportError as exc:
+                    raise DriveUnavailable(f"missing_google_api_client:{exc}") from exc
+                self._service = build("drive", "v3", credentials=creds, cache_discovery=False)
+            return self._service
+
+    def create_upload(self, local_path: Path, metadata: dict[str, Any], mimetype: str, chunk_size: int):
+        """A resumable ``files.create`` request; the caller drives it with ``next_chunk()``."""
+        service = self._client()
+        from googleapiclient.http import MediaFileUpload
+
+        media = MediaFileUpload(str(local_path), mimetype=mimetype, chunksize=chunk_size, resumable=True)
+        return service.files().create(
+            body=metadata,
+            media_body=media,
+            fields="id,name,webViewLink",
+            supportsAllDrives=True,
+        )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._creds = None
+            self._service = None
+
+
+def _http_status(exc: Exception) -> int | None:
+    status = getattr(getattr(exc, "resp", None), "status", None)
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _result(uploaded: bool, reason: str | None, file_id=None, web_view_link=None, **extra: Any) -> dict[str, Any]:
+    return {"uploaded": uploaded, "reason": reason, "file_id": file_id, "web_view_link": web_view_link, **extra}
+
+
+class DriveUploader:
+    """
+    Uploads backup files to one Drive folder, one at a time.
+
+    Files go up as chunked resumable uploads. Transient failures (429, 5xx,
+    timeouts, network errors) are retried with exponential backoff plus
+    jitter, resuming from the last acknowledged chunk; a 401 drops the cached
+    client first, an expired upload session (410) restarts the upload. A file
+    whose ``content_hash`` matches the last successful upload to the same
+    folder is not sent again: the result points at the file already on Drive
+    (``name`` tells which). ``force`` uploads regardless, for files that other
+    backups refer to by name.
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        chunk_size: int,
+        max_retries: int,
+        backoff_seconds: float,
+        max_backoff_seconds: float = 60.0,
+        state_path: Path | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.api = api
+        self.chunk_size = max(CHUNK_ALIGNMENT, chunk_size - chunk_size % CHUNK_ALIGNMENT)
+        self.max_retries = max(0, max_retries)
+        self.backoff_seconds = max(0.0, backoff_seconds)
+        self.max_backoff_seconds = max(self.backoff_seconds, max_backoff_seconds)
+        self.state_path = state_path
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._last: dict[str, Any] | None = None
+        self._last_loaded = False
+        self.uploaded = 0
+        self.skipped = 0
+        self.failed = 0
+        self.retries = 0
+
+    def _last_upload(self) -> dict[str, Any] | None:
+        if not self._last_loaded:
+            self._last_loaded = True
+            if self.state_path is not None:
+                try:
+                    self._last = json.loads(self.state_path.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    self._last = None
+        return self._last
+
+    def _remember(self, record: dict[str, Any]) -> None:
+        self._last = record
+        if self.state_path is None:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.state_path.with_name(f".{self.state_path.name}.tmp")
+        temp_path.write_text(json.dumps(record), encoding="utf-8")
+        os.replace(temp_path, self.state_path)
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.max_backoff_seconds, self.backoff_seconds * (2 ** (attempt - 1)))
+        return delay + random.uniform(0, self.backoff_seconds)
+
+    def _send(self, local_path: Path, metadata: dict[str, Any], mimetype: str) -> tuple[dict[str, Any], int]:
+        attempt = 0
+        request = None
+        while True:
+            try:
+                if request is None:
+                    request = self.api.create_upload(local_path, metadata, mimetype, self.chunk_size)
+                response = None
+                while response is None:
+                    _, response = request.next_chunk()
+                return response, attempt
+            except DriveUnavailable:
+                raise
+            except Exception as exc:
+                status = _http_status(exc)
+                retryable = status in RETRYABLE_STATUSES or status in (401, 410) or (
+                    status is None and isinstance(exc, OSError)
+                )
+                if not retryable or attempt >= self.max_retries:
+                    raise
+                if status == 401:
+                    self.api.reset()
+                    request = None
+                elif status == 410:
+                    request = None
+                attempt += 1
+                self.retries += 1
+                delay = self._backoff(attempt)
+                logger.warning("Drive upload of %s failed (%s), retry %d in %.1fs", local_path.name, exc, attempt, delay)
+                self._sleep(delay)
+
+    def upload(
+        self,
+        local_path: Path,
+        folder_id: str,
+        mimetype: str,
+        content_hash: str | None = None,
+        force: bool = False,
+    ) -> dict[str, Any]:
+        with self._lock:
+            last = self._last_upload()
+            if (
+                not force
+                and content_hash
+                and last is not None
+                and last.get("content_hash") == content_hash
+                and last.get("folder_id") == folder_id
+            ):
+                self.skipped += 1
+                return _result(
+                    False,
+                    "unchanged_since_last_upload",
+                    last.get("file_id"),
+                    last.get("web_view_link"),
+                    skipped=True,
+                    name=last.get("name"),
+                )
+
+            metadata = {"name": local_path.name, "parents": [folder_id]}
+            try:
+                response, retries = self._send(local_path, metadata, mimetype)
+            except DriveUnavailable as exc:
+                self.failed += 1
+                return _result(False, exc.reason, skipped=False)
+            except Exception as exc:
+                self.failed += 1
+                return _result(False, f"upload_failed:{exc}", skipped=False)
+
+            self.uploaded += 1
+            self._remember(
+                {
+                    "content_hash": content_hash,
+                    "folder_id": folder_id,
+                    "name": local_path.name,
+                    "file_id": response.get("id"),
+                    "web_view_link": response.get("webViewLink"),
+                    "uploaded_at": datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
+                }
+            )
+            return _result(
+                True,
+                None,
+                response.get("id"),
+                response.get("webViewLink"),
+                skipped=False,
+                attempts=retries + 1,
+                name=local_path.name,
+            )
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "uploaded": self.uploaded,
+                "skipped": self.skipped,
+                "failed": self.failed,
+                "retries": self.retries,
+            }
+
+
+_uploader: DriveUploader | None = None
+_uploader_lock = threading.Lock()
+
+
+def get_drive_uploader() -> DriveUploader:
+    global _uploader
+    if _uploader is None:
+        with _uploader_lock:
+            if _uploader is None:
+                settings = get_settings()
+                _uploader = DriveUploader(
+                    GoogleDriveApi(),
+                    chunk_size=settings.drive_upload_chunk_mb * 1024 * 1024,
+                    max_retries=settings.drive_upload_max_retries,
+                    backoff_seconds=settings.drive_upload_backoff_seconds,
+                    state_path=DEFAULT_STATE_PATH,
+                )
+    return _uploader
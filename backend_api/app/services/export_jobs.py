@@ -0,0 +1,282 @@
+import json
+import multiprocessing
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import date, datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from ..core.config import get_settings
+from .export_service import build_transactions_pdf
+
+
+DEFAULT_JOBS_DIR = Path(__file__).resolve().parents[3] / "exports" / "jobs"
+_JOB_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+ACTIVE_STATUSES = ("queued", "running")
+
+
+class ExportQueueFull(RuntimeError):
+    """Raised when the number of queued + running export jobs is at its limit."""
+
+
+def _utcnow() -> str:
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+
+
+class ExportJobStore:
+    """
+    Local filesystem store: ``<job_id>.json`` holds the job status, ``<job_id>.pdf``
+    the finished artifact. Every write goes through a temp file + ``os.replace``, so
+    readers (API workers, other processes) never see a partial file.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    def _status_path(self, job_id: str) -> Path:
+        return self.root / f"{job_id}.json"
+
+    def artifact_path(self, job_id: str) -> Path:
+        return self.root / f"{job_id}.pdf"
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        if not _JOB_ID_PATTERN.match(job_id or ""):
+            return None
+        try:
+            return json.loads(self._status_path(job_id).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def put(self, job: dict[str, Any]) -> None:
+        self._write_atomic(self._status_path(job["job_id"]), json.dumps(job).encode("utf-8"))
+
+    def update(self, job_id: str, **fields: Any) -> dict[str, Any] | None:
+        job = self.get(job_id)
+        if job is None:
+            return None
+        job.update(fields)
+        self.put(job)
+        return job
+
+    def write_artifact(self, job_id: str, content: bytes) -> None:
+        self._write_atomic(self.artifact_path(job_id), content)
+
+    def fail_active(self, error: str) -> int:
+        """Mark every queued/running job failed with ``error``; returns how many were marked."""
+        if not self.root.exists():
+            return 0
+        failed = 0
+        for status_path in self.root.glob("*.json"):
+            job = self.get(status_path.stem)
+            if job is not None and job.get("status") in ACTIVE_STATUSES:
+                self.update(job["job_id"], status="failed", error=error, finished_at=_utcnow())
+                failed += 1
+        return failed
+
+    def purge(self, max_age_seconds: float) -> int:
+        """Drop finished jobs (status + artifact) older than ``max_age_seconds``."""
+        if not self.root.exists():
+            return 0
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        for status_path in self.root.glob("*.json"):
+            try:
+                if status_path.stat().st_mtime >= cutoff:
+                    continue
+                job = json.loads(status_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if job.get("status") in ACTIVE_STATUSES:
+                continue
+            self.artifact_path(status_path.stem).unlink(missing_ok=True)
+            status_path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+
+def render_pdf_job(store_root: str, job_id: str, payload: dict[str, Any]) -> None:
+    """
+    Process-pool entry point: render the snapshot in ``payload`` into the store.
+
+    Runs in a child process, so it only touches the store and the plain data it
+    was given (no runtime, no database).
+    """
+    store = ExportJobStore(Path(store_root))
+    store.update(job_id, status="running", started_at=_utcnow(), progress=0.0)
+    reported = {"value": 0.0}
+
+    def _progress(value: float) -> None:
+        if value - reported["value"] >= 0.05:
+            reported["value"] = value
+            store.update(job_id, progress=round(min(value, 0.99), 4))
+
+    try:
+        content = build_transactions_pdf(
+            transactions=payload["transactions"],
+            name_map=payload["name_map"],
+            summary=SimpleNamespace(**payload["summary"]),
+            start_date=payload["start_date"],
+            end_date=payload["end_date"],
+            generated_at=payload["generated_at"],
+            progress=_progress,
+        )
+        store.write_artifact(job_id, content)
+    except Exception as exc:
+        store.update(job_id, status="failed", error=str(exc) or type(exc).__name__, finished_at=_utcnow())
+        raise
+    store.update(job_id, status="done", progress=1.0, finished_at=_utcnow(), size_bytes=len(content))
+
+
+class ExportJobQueue:
+    """
+    Submits PDF renders to a process pool and tracks them in an ``ExportJobStore``.
+
+    ``max_workers`` renders run at once; at most ``max_pending`` jobs may be queued
+    or running, further submits raise ``ExportQueueFull``. Jobs are owned by the
+    user that submitted them and are only visible to that owner.
+
+    Jobs still queued or running in the store when the queue starts belonged to
+    a pool that is gone (restart, crash), so they are marked failed; so are jobs
+    cancelled by ``shutdown``.
+    """
+
+    def __init__(self, store: ExportJobStore, max_workers: int, max_pending: int, ttl_seconds: float) -> None:
+        self.store = store
+        self._max_workers = max(1, max_workers)
+        self._max_pending = max(1, max_pending)
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._active: dict[str, Future] = {}
+        self.submitted = 0
+        self.rejected = 0
+        self.store.fail_active("interrupted")
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: children must not inherit the API's threads, locks or DB connections
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def submit(
+        self,
+        owner: str,
+        transactions: list[Any],
+        name_map: dict[int, str],
+        summary: dict[str, Any],
+        start_date: date | None,
+        end_date: date | None,
+    ) -> dict[str, Any]:
+        generated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        job_id = uuid.uuid4().hex
+        job = {
+            "job_id": job_id,
+            "owner": owner,
+            "status": "queued",
+            "progress": 0.0,
+            "total_rows": len(transactions),
+            "filename": f"cnfund-transactions-{generated_at.strftime('%Y-%m-%d')}.pdf",
+            "created_at": generated_at.isoformat(),
+            "started_at": None,
+            "finished_at": None,
+            "error": None,
+            "size_bytes": None,
+        }
+        payload = {
+            "transactions": transactions,
+            "name_map": name_map,
+            "summary": summary,
+            "start_date": start_date,
+            "end_date": end_date,
+            "generated_at": generated_at,
+        }
+        with self._lock:
+            if len(self._active) >= self._max_pending:
+                self.rejected += 1
+                raise ExportQueueFull(f"Too many export jobs in progress (limit {self._max_pending})")
+            self.store.purge(self._ttl_seconds)
+            self.store.put(job)
+            future = self._pool().submit(render_pdf_job, str(self.store.root), job_id, payload)
+            self._active[job_id] = future
+            self.submitted += 1
+        future.add_done_callback(lambda done, job_id=job_id: self._finished(job_id, done))
+        return job
+
+    def _finished(self, job_id: str, future: Future) -> None:
+        with self._lock:
+            self._active.pop(job_id, None)
+        if future.cancelled():
+            error = "cancelled"
+        else:
+            exception = future.exception()
+            if exception is None:
+                return
+            error = str(exception) or type(exception).__name__
+        # The child records its own failures; this covers a cancelled, crashed or killed worker
+        job = self.store.get(job_id)
+        if job is not None and job.get("status") in ACTIVE_STATUSES:
+            self.store.update(job_id, status="failed", error=error, finished_at=_utcnow())
+
+    def get(self, job_id: str, owner: str) -> dict[str, Any] | None:
+        job = self.store.get(job_id)
+        if job is None or job.get("owner") != owner:
+            return None
+        return job
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "active": len(self._active),
+                "max_workers": self._max_workers,
+                "max_pending": self._max_pending,
+                "submitted": self.submitted,
+                "rejected": self.rejected,
+            }
+
+
+_queue: ExportJobQueue | None = None
+_queue_lock = threading.Lock()
+
+
+def get_export_job_queue() -> ExportJobQueue:
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                settings = get_settings()
+                root = Path(settings.export_jobs_dir) if settings.export_jobs_dir else DEFAULT_JOBS_DIR
+                _queue = ExportJobQueue(
+                    ExportJobStore(root),
+                    max_workers=settings.export_job_workers,
+                    max_pending=settings.export_job_max_pending,
+                    ttl_seconds=settings.export_job_ttl_hours * 3600,
+                )
+    return _queue
+
+
+def shutdown_export_job_queue() -> None:
+    global _queue
+    with _queue_lock:
+        queue, _queue = _queue, None
+    if queue is not None:
+        queue.shutdown()
@@ -4,7 +4,7 @@ import csv
 from datetime import date, datetime
 from io import BytesIO, StringIO
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4, landscape
@@ -68,27 +68,51 @@ def _format_range_label(start_date: date | None, end_date: date | None) -> str:
     return "Toàn bộ dữ liệu"
 
 
-def build_transactions_csv(
-    transactions: list[Any],
+CSV_CHUNK_ROWS = 500
+PDF_ROWS_PER_PAGE = 28
+
+
+def _csv_summary_rows(summary: Any, start_date: date | None, end_date: date | None) -> list[list[str]]:
+    return [
+        ["Báo cáo giao dịch CNFund"],
+        ["Khoảng thời gian", _format_range_label(start_date, end_date)],
+        ["Tổng giao dịch", str(getattr(summary, "total_count", 0))],
+        ["Tổng giá trị", _format_number(_safe_float(getattr(summary, "total_volume", 0.0)))],
+        ["Tổng tiền nạp", _format_number(_safe_float(getattr(summary, "total_deposits", 0.0)))],
+        ["Tổng tiền rút", _format_number(_safe_float(getattr(summary, "total_withdrawals", 0.0)))],
+        ["Lãi/Lỗ ròng", _format_number(_safe_float(getattr(summary, "gross_profit_loss", 0.0)))],
+        ["% Lãi/Lỗ", _format_percent(_safe_float(getattr(summary, "gross_profit_loss_percent", 0.0)))],
+        [],
+        ["ID", "Nhà đầu tư", "Loại", "Số tiền", "NAV", "Ngày", "Đơn vị thay đổi"],
+    ]
+
+
+def iter_transactions_csv(
+    transactions: Iterable[Any],
     name_map: dict[int, str],
     summary: Any,
     start_date: date | None,
     end_date: date | None,
-) -> bytes:
+    chunk_rows: int = CSV_CHUNK_ROWS,
+) -> Iterator[bytes]:
+    """
+    CSV report as byte chunks: BOM + summary header first, then ``chunk_rows``
+    transactions per chunk. ``transactions`` is consumed lazily, so memory does
+    not grow with the export size.
+    """
     output = StringIO(newline="")
     writer = csv.writer(output)
 
-    writer.writerow(["Báo cáo giao dịch CNFund"])
-    writer.writerow(["Khoảng thời gian", _format_range_label(start_date, end_date)])
-    writer.writerow(["Tổng giao dịch", str(getattr(summary, "total_count", 0))])
-    writer.writerow(["Tổng giá trị", _format_number(_safe_float(getattr(summary, "total_volume", 0.0)))])
-    writer.writerow(["Tổng tiền nạp", _format_number(_safe_float(getattr(summary, "total_deposits", 0.0)))])
-    writer.writerow(["Tổng tiền rút", _format_number(_safe_float(getattr(summary, "total_withdrawals", 0.0)))])
-    writer.writerow(["Lãi/Lỗ ròng", _format_number(_safe_float(getattr(summary, "gross_profit_loss", 0.0)))])
-    writer.writerow(["% Lãi/Lỗ", _format_percent(_safe_float(getattr(summary, "gross_profit_loss_percent", 0.0)))])
-    writer.writerow([])
-    writer.writerow(["ID", "Nhà đầu tư", "Loại", "Số tiền", "NAV", "Ngày", "Đơn vị thay đổi"])
+    def _drain() -> str:
+        text = output.getvalue()
+        output.seek(0)
+        output.truncate(0)
+        return text
+
+    writer.writerows(_csv_summary_rows(summary, start_date, end_date))
+    yield _drain().encode("utf-8-sig")
 
+    pending = 0
     for tx in transactions:
         writer.writerow(
             [
@@ -101,8 +125,12 @@ def build_transactions_csv(
                 f"{_safe_float(tx.units_change):.6f}",
             ]
         )
-
-    return output.getvalue().encode("utf-8-sig")
+        pending += 1
+        if pending >= chunk_rows:
+            yield _drain().encode("utf-8")
+            pending = 0
+    if pending:
+        yield _drain().encode("utf-8")
 
 
 def build_transactions_pdf(
@@ -112,7 +140,13 @@ def build_transactions_pdf(
     start_date: date | None,
     end_date: date | None,
     generated_at: datetime,
+    progress: Callable[[float], None] | None = None,
 ) -> bytes:
+    """
+    Render the PDF report. ``progress`` (optional) receives a completion ratio in
+    [0, 1]: the first 30% while formatting rows, the rest while reportlab lays
+    out the flowables.
+    """
     font_name = _register_pdf_font()
     buffer = BytesIO()
     doc = SimpleDocTemplate(
@@ -171,7 +205,10 @@ def build_transactions_pdf(
     details_rows: list[list[str]] = [
         ["ID", "Nhà đầu tư", "Loại", "Số tiền", "NAV", "Ngày", "Đơn vị thay đổi"],
     ]
-    for tx in transactions:
+    row_count = max(1, len(transactions))
+    for index, tx in enumerate(transactions, start=1):
+        if progress is not None and index % 500 == 0:
+            progress(0.3 * index / row_count)
         details_rows.append(
             [
                 str(tx.id),
@@ -213,5 +250,19 @@ def build_transactions_pdf(
     elements.append(Spacer(1, 8))
     elements.append(Paragraph(f"Ngày xuất: {generated_at.strftime('%d/%m/%Y %H:%M')}", text_style))
 
+    if progress is not None:
+        progress(0.3)
+        # reportlab reports whole flowables (the details table is one), so layout
+        # progress is estimated from pages started against the expected page count
+        expected_pages = 1 + len(transactions) / PDF_ROWS_PER_PAGE
+
+        def _on_layout(kind: str, value: int) -> None:
+            if kind == "PAGE":
+                progress(0.3 + 0.7 * min(0.99, value / expected_pages))
+
+        doc.setProgressCallBack(_on_layout)
+
     doc.build(elements)
+    if progress is not None:
+        progress(1.0)
     return buffer.getvalue()
@@ -0,0 +1,107 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable
+
+from ..core.config import get_settings
+
+
+@dataclass
+class CachedFeePreview:
+    """A computed fee preview plus the per-investor fee details it was built from."""
+
+    key: Hashable
+    token: str
+    previews: list[Any]
+    fee_calculations: dict[int, dict[str, Any]]
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class FeePreviewCache:
+    """
+    Bounded TTL cache of fee previews, addressable by input key and by confirm token.
+
+    The key covers everything a preview depends on (end date, total NAV, data
+    generation, fee-config snapshot), so an entry can only be reused while the
+    fund data it was computed from is unchanged.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max(1, max_entries)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._by_key: OrderedDict[Hashable, CachedFeePreview] = OrderedDict()
+        self._by_token: dict[str, Hashable] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _expired(self, entry: CachedFeePreview) -> bool:
+        return self._clock() - entry.created_at > self._ttl_seconds
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._by_key.pop(key, None)
+        if entry is not None and self._by_token.get(entry.token) == key:
+            del self._by_token[entry.token]
+
+    def _live(self, key: Hashable | None) -> CachedFeePreview | None:
+        entry = self._by_key.get(key) if key is not None else None
+        if entry is None:
+            return None
+        if self._expired(entry):
+            self._drop(key)
+            return None
+        self._by_key.move_to_end(key)
+        return entry
+
+    def get(self, key: Hashable) -> CachedFeePreview | None:
+        with self._lock:
+            entry = self._live(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return entry
+
+    def get_by_token(self, token: str) -> CachedFeePreview | None:
+        with self._lock:
+            return self._live(self._by_token.get(token))
+
+    def put(self, entry: CachedFeePreview) -> CachedFeePreview:
+        entry.created_at = self._clock()
+        with self._lock:
+            self._drop(entry.key)
+            self._by_key[entry.key] = entry
+            self._by_token[entry.token] = entry.key
+            while len(self._by_key) > self._max_entries:
+                oldest_key = next(iter(self._by_key))
+                self._drop(oldest_key)
+        return entry
+
+    def discard_token(self, token: str) -> None:
+        with self._lock:
+            key = self._by_token.get(token)
+            if key is not None:
+                self._drop(key)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._by_key), "hits": self.hits, "misses": self.misses}
+
+
+_cache: FeePreviewCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_fee_preview_cache() -> FeePreviewCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                settings = get_settings()
+                _cache = FeePreviewCache(
+                    ttl_seconds=settings.fee_preview_cache_ttl_seconds,
+                    max_entries=settings.fee_preview_cache_max_entries,
+                )
+    return _cache
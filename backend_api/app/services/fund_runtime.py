@@ -1,24 +1,42 @@
+import itertools
 import sys
 import threading
+import time
 from datetime import date, datetime
 from pathlib import Path
 from typing import Callable, TypeVar
 
 from ..core.config import get_settings
+from .lock_stats import TimedLock
 
 
 T = TypeVar("T")
 
 
 class FundRuntime:
-    """Thread-safe runtime around existing CNFund business logic."""
+    """
+    Thread-safe runtime around existing CNFund business logic.
+
+    The current manager is published as an immutable snapshot. Readers take the
+    snapshot reference without locking; a mutation works on a private clone and,
+    once its save commits, swaps the clone in as the new snapshot. Read callbacks
+    must therefore never modify the manager they receive.
+
+    Reads reuse the stored data generation for ``generation_check_ttl_seconds``
+    rather than querying it per request; writes always query it.
+    """
 
     def __init__(self) -> None:
-        self._lock = threading.Lock()
+        self._write_lock = TimedLock()
+        self._read_counter = itertools.count(1)
+        self._reads = 0
         self._settings = get_settings()
+        self._generation_ttl = max(0.0, self._settings.generation_check_ttl_seconds)
+        # (monotonic time of the check, stored generation)
+        self._generation_checked: tuple[float, int | None] | None = None
         self._bootstrap_sys_path()
-        self._manager = self._build_manager()
-        self._dirty = False
+        self._handler = self._build_handler()
+        self._snapshot = self._load_manager()
 
     def _bootstrap_sys_path(self) -> None:
         # backend_api/app/services -> backend_api/app -> backend_api -> repo root
@@ -27,7 +45,7 @@ class FundRuntime:
         if repo_root_str not in sys.path:
             sys.path.insert(0, repo_root_str)
 
-    def _build_manager(self):
+    def _build_handler(self):
         database_url = (self._settings.database_url or "").strip()
         if not database_url:
             raise RuntimeError(
@@ -36,33 +54,76 @@ class FundRuntime:
 
         from core.postgres_data_handler import PostgresDataHandler  # type: ignore
 
-        handler = PostgresDataHandler(database_url=database_url)
+        return PostgresDataHandler(database_url=database_url)
 
+    def _load_manager(self):
         from core.services_enhanced import EnhancedFundManager  # type: ignore
 
-        manager = EnhancedFundManager(handler)
+        manager = EnhancedFundManager(self._handler)
         manager.load_data()
         manager._ensure_fund_manager_exists()
         return manager
 
     def refresh(self) -> None:
-        self._manager.load_data()
-        self._manager._ensure_fund_manager_exists()
+        """Reload from the database and publish the result (caller holds the write lock)."""
+        self._snapshot = self._load_manager()
+
+    def _stored_generation(self, max_age: float) -> int | None:
+        """Stored data generation, reusing a check younger than ``max_age`` seconds."""
+        checked = self._generation_checked
+        now = time.monotonic()
+        if checked is not None and now - checked[0] < max_age:
+            return checked[1]
+        generation = self._handler.get_data_generation()
+        self._generation_checked = (now, generation)
+        return generation
+
+    def _is_stale(self, manager, max_age: float = 0.0) -> bool:
+        """True when the stored data generation differs from the snapshot's."""
+        return self._stored_generation(max_age) != manager.data_generation
+
+    def snapshot(self):
+        """Current published manager; treat it as read-only."""
+        return self._snapshot
 
     def read(self, callback: Callable[[object], T]) -> T:
-        with self._lock:
-            if self._dirty:
-                self.refresh()
-                self._dirty = False
-            return callback(self._manager)
+        self._reads = next(self._read_counter)
+        manager = self._snapshot
+        # Another process wrote: reload, unless a local writer is busy (it publishes shortly).
+        if self._is_stale(manager, self._generation_ttl) and self._write_lock.acquire(blocking=False):
+            try:
+                if self._is_stale(self._snapshot):
+                    self.refresh()
+            finally:
+                self._write_lock.release()
+            manager = self._snapshot
+        return callback(manager)
 
     def mutate(self, callback: Callable[[object], T]) -> T:
-        with self._lock:
-            self.refresh()
-            result = callback(self._manager)
-            self._manager.save_data()
-            self._dirty = True
-            return result
+        return self.mutate_with_changes(callback)[0]
+
+    def mutate_with_changes(self, callback: Callable[[object], T]) -> tuple[T, dict]:
+        """Run a mutation and return its result plus the row keys the save touched."""
+        with self._write_lock:
+            if self._is_stale(self._snapshot):
+                self.refresh()
+            working = self._snapshot.clone()
+            result = callback(working)
+            if not working.save_data():
+                raise RuntimeError("Failed to persist fund data")
+            self._snapshot = working
+            if working.data_generation is not None:
+                self._generation_checked = (time.monotonic(), working.data_generation)
+            return result, dict(working.last_saved_changes)
+
+    def lock_stats(self) -> dict:
+        """Writer lock wait-time counters; reads are lock-free and only counted."""
+        return {
+            "write": self._write_lock.wait_stats.as_dict(),
+            "writer_active": self._write_lock.locked(),
+            "snapshot_reads": self._reads,
+            "snapshot_generation": self._snapshot.data_generation,
+        }
 
     @staticmethod
     def as_datetime(tx_date: date | datetime) -> datetime:
@@ -0,0 +1,90 @@
+import heapq
+import threading
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+from ..core.config import get_settings
+from .snapshot_cache import SnapshotCache
+
+
+@dataclass(frozen=True)
+class InvestorValuation:
+    investor: Any
+    units: float
+    cost_basis: float
+    balance: float
+    profit: float
+    profit_percent: float
+
+
+class InvestorValuationTable:
+    """
+    Valuation of every regular investor at one NAV, for one manager snapshot.
+
+    ``rows`` keeps the manager's investor order; ``ranked`` is the same rows by
+    balance, highest first (stable, so equal balances keep investor order),
+    sorted on first use.
+    """
+
+    def __init__(self, nav: float, rows: list[InvestorValuation]) -> None:
+        self.nav = nav
+        self.rows = rows
+
+    @cached_property
+    def ranked(self) -> list[InvestorValuation]:
+        return sorted(self.rows, key=lambda row: row.balance, reverse=True)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def top(self, count: int) -> list[InvestorValuation]:
+        """First ``count`` rows of ``ranked``, by partial selection unless the table is already sorted."""
+        if "ranked" in self.__dict__:
+            return self.ranked[:count]
+        # nlargest breaks ties by input order, same as the stable sort
+        return heapq.nlargest(count, self.rows, key=lambda row: row.balance)
+
+    def page(self, page: int, page_size: int) -> list[InvestorValuation]:
+        start = (page - 1) * page_size
+        return self.ranked[start : start + page_size]
+
+
+def resolve_nav(manager, nav: float | None) -> float:
+    return nav if nav is not None else (manager.get_latest_total_nav() or 0.0)
+
+
+def build_valuation_table(manager, nav: float | None) -> InvestorValuationTable:
+    current_nav = resolve_nav(manager, nav)
+    rows = []
+    for investor in manager.get_regular_investors():
+        balance, profit, profit_percent = manager.get_investor_balance(investor.id, current_nav)
+        rows.append(
+            InvestorValuation(
+                investor=investor,
+                units=manager.get_investor_units(investor.id),
+                cost_basis=manager.get_investor_current_cost_basis(investor.id),
+                balance=balance,
+                profit=profit,
+                profit_percent=profit_percent,
+            )
+        )
+    return InvestorValuationTable(current_nav, rows)
+
+
+_valuation_cache: SnapshotCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_valuation_cache() -> SnapshotCache:
+    global _valuation_cache
+    if _valuation_cache is None:
+        with _cache_lock:
+            if _valuation_cache is None:
+                _valuation_cache = SnapshotCache(max_entries=get_settings().valuation_cache_max_entries)
+    return _valuation_cache
+
+
+def get_valuation_table(manager, nav: float | None) -> InvestorValuationTable:
+    """Cached table for the snapshot; rebuilt after the next committed mutation."""
+    return get_valuation_cache().get_or_build(manager, nav, lambda: build_valuation_table(manager, nav))
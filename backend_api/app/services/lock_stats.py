@@ -0,0 +1,56 @@
+import threading
+import time
+
+
+class LockWaitStats:
+    """Accumulated wait time for one kind of lock acquisition."""
+
+    def __init__(self) -> None:
+        self.acquisitions = 0
+        self.contended = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record(self, waited: float) -> None:
+        self.acquisitions += 1
+        if waited > 0.0005:
+            self.contended += 1
+        self.total_wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def as_dict(self) -> dict:
+        return {
+            "acquisitions": self.acquisitions,
+            "contended": self.contended,
+            "total_wait_ms": round(self.total_wait_seconds * 1000, 3),
+            "avg_wait_ms": round(self.total_wait_seconds * 1000 / self.acquisitions, 3) if self.acquisitions else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+        }
+
+
+class TimedLock:
+    """Mutex that records how long callers waited to acquire it."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.wait_stats = LockWaitStats()
+
+    def acquire(self, blocking: bool = True) -> bool:
+        started = time.perf_counter()
+        acquired = self._lock.acquire(blocking)
+        if acquired:
+            self.wait_stats.record(time.perf_counter() - started)
+        return acquired
+
+    def release(self) -> None:
+        self._lock.release()
+
+    def locked(self) -> bool:
+        return self._lock.locked()
+
+    def __enter__(self) -> "TimedLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
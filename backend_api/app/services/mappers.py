@@ -2,7 +2,7 @@ from datetime import datetime
 
 from ..schemas.fees import FeeRecordDTO
 from ..schemas.investors import InvestorCardDTO, InvestorDTO
-from ..schemas.nav import NavPointDTO
+from ..schemas.nav import NavDailyPointDTO, NavPointDTO
 from ..schemas.transactions import TransactionCardDTO, TransactionDTO
 
 
@@ -75,6 +75,15 @@ def nav_point_to_dto(nav_point: dict) -> NavPointDTO:
     )
 
 
+def nav_daily_point_to_dto(point) -> NavDailyPointDTO:
+    return NavDailyPointDTO(
+        date=point.day.isoformat(),
+        total_nav=point.total_nav,
+        total_units=point.total_units,
+        price_per_unit=point.price_per_unit,
+    )
+
+
 def fee_record_to_dto(record) -> FeeRecordDTO:
     return FeeRecordDTO(
         id=record.id,
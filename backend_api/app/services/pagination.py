@@ -0,0 +1,21 @@
+import base64
+from datetime import datetime
+from typing import Any
+
+
+def encode_cursor(tx: Any) -> str:
+    """Opaque keyset cursor for a transaction: resume strictly after it, newest first."""
+    value = tx.date if isinstance(tx.date, datetime) else datetime.fromisoformat(str(tx.date))
+    raw = f"{value.isoformat()}|{int(tx.id)}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Inverse of ``encode_cursor``; raises ValueError for anything malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        moment, tx_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(moment), int(tx_id)
+    except (UnicodeError, ValueError, TypeError) as exc:
+        raise ValueError("Invalid cursor") from exc
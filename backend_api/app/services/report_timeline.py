@@ -0,0 +1,287 @@
+import heapq
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+from core.models import is_canonical_type, kinds_matching, type_text_matches
+
+
+def _safe_float(value, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def kinds_filter(tx_type: str | None) -> frozenset | None:
+    """Transaction kinds selected by a ``tx_type`` query filter (None = no filter)."""
+    if not tx_type or not tx_type.strip():
+        return None
+    return kinds_matching(tx_type)
+
+
+def transaction_sort_key(tx) -> tuple[datetime, int]:
+    value = tx.date if isinstance(tx.date, datetime) else datetime.fromisoformat(str(tx.date))
+    return value, int(getattr(tx, "id", 0))
+
+
+def _descending(positions: Sequence[int], lo: int, hi: int) -> Iterator[int]:
+    for index in range(hi - 1, lo - 1, -1):
+        yield positions[index]
+
+
+class ReportTimeline:
+    """
+    Cumulative unit/NAV timeline over the transactions of one manager snapshot.
+
+    Transactions are kept in ascending (date, id) order with their calendar
+    dates parsed once. Running totals are accumulated left to right, the same
+    order the report used to replay them, so every snapshot is bit-identical
+    to a full walk while only costing a binary search.
+
+    A "prefix" ``k`` means "after the first ``k`` transactions"; prefix 0 is the
+    empty fund. The same ordering backs the newest-first listings, including
+    keyset pages that resume strictly before a ``(date, id)`` cursor, with
+    positions indexed per investor and per transaction kind. Rows whose stored
+    ``type`` is not the canonical label of their kind (legacy labels) are also
+    indexed, so a ``type_text`` filter can still match them by text.
+    """
+
+    def __init__(self, transactions: list[Any], sort_key: Callable[[Any], tuple[datetime, int]]) -> None:
+        keyed = sorted(((sort_key(tx), tx) for tx in transactions), key=lambda entry: entry[0])
+        self.transactions: list[Any] = [tx for _, tx in keyed]
+        self.keys: list[tuple[datetime, int]] = [key for key, _ in keyed]
+        self.dates: list[date] = [key[0].date() for key, _ in keyed]
+        self.navs: list[float] = []
+        self._total_units: list[float] = [0.0]
+        self._investor_positions: dict[Any, list[int]] = {}
+        self._investor_units: dict[Any, list[float]] = {}
+        # (investor_id or None for the whole fund, transaction kind) -> positions
+        self._kind_positions: dict[tuple[Any, Any], list[int]] = {}
+        # investor_id (None for the whole fund) -> positions of rows with a non-canonical type label
+        self._legacy_positions: dict[Any, list[int]] = {}
+
+        total_units = 0.0
+        for position, tx in enumerate(self.transactions):
+            units_delta = _safe_float(getattr(tx, "units_change", 0.0))
+            total_units += units_delta
+            self._total_units.append(total_units)
+            self.navs.append(_safe_float(getattr(tx, "nav", 0.0)))
+
+            positions = self._investor_positions.setdefault(tx.investor_id, [])
+            running = self._investor_units.setdefault(tx.investor_id, [])
+            positions.append(position)
+            running.append((running[-1] if running else 0.0) + units_delta)
+
+            kind = getattr(tx, "kind", None)
+            self._kind_positions.setdefault((None, kind), []).append(position)
+            self._kind_positions.setdefault((tx.investor_id, kind), []).append(position)
+            if not is_canonical_type(getattr(tx, "type", None), kind):
+                self._legacy_positions.setdefault(None, []).append(position)
+                self._legacy_positions.setdefault(tx.investor_id, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.transactions)
+
+    def prefix_before(self, boundary: date) -> int:
+        """Prefix covering every transaction dated strictly before ``boundary``."""
+        return bisect_left(self.dates, boundary)
+
+    def prefix_through(self, boundary: date) -> int:
+        """Prefix covering every transaction dated on or before ``boundary``."""
+        return bisect_right(self.dates, boundary)
+
+    def total_units_at(self, prefix: int) -> float:
+        return self._total_units[prefix]
+
+    def investor_units_at(self, investor_id: Any, prefix: int) -> float:
+        if investor_id is None:
+            return self._total_units[prefix]
+        positions = self._investor_positions.get(investor_id)
+        if not positions:
+            return 0.0
+        count = bisect_left(positions, prefix)
+        return self._investor_units[investor_id][count - 1] if count else 0.0
+
+    def nav_at(self, prefix: int) -> float | None:
+        """NAV recorded on the last transaction of the prefix (None for the empty prefix)."""
+        return self.navs[prefix - 1] if prefix else None
+
+    def snapshot(self, investor_id: Any, prefix: int) -> tuple[float, float, float | None]:
+        return self.investor_units_at(investor_id, prefix), self.total_units_at(prefix), self.nav_at(prefix)
+
+    def _spans(
+        self,
+        investor_id: Any,
+        kinds: Iterable[Any] | None,
+        start: date | None,
+        end: date | None,
+        before: tuple[datetime, int] | None = None,
+        type_text: str | None = None,
+    ) -> list[tuple[Sequence[int] | None, int, int]]:
+        """
+        One (positions or None for every transaction, lo, hi) per index list that
+        covers the filters: a single list without ``kinds``, else one per kind,
+        plus the legacy-labelled rows of other kinds whose ``type`` contains
+        ``type_text``.
+        """
+        low = self.prefix_before(start) if start else 0
+        high = self.prefix_through(end) if end else len(self.transactions)
+        if before is not None:
+            high = min(high, bisect_left(self.keys, before))
+        if kinds is None:
+            if investor_id is None:
+                return [(None, low, max(low, high))]
+            lists = [self._investor_positions.get(investor_id, [])]
+        else:
+            lists = [self._kind_positions.get((investor_id, kind), []) for kind in sorted(kinds)]
+            if type_text:
+                lists.append(self._legacy_matching(investor_id, kinds, type_text))
+        spans = []
+        for positions in lists:
+            lo = bisect_left(positions, low)
+            spans.append((positions, lo, max(lo, bisect_left(positions, high))))
+        return spans
+
+    def _legacy_matching(self, investor_id: Any, kinds: Iterable[Any], type_text: str) -> list[int]:
+        transactions = self.transactions
+        return [
+            position
+            for position in self._legacy_positions.get(investor_id, [])
+            if transactions[position].kind not in kinds and type_text_matches(transactions[position].type, type_text)
+        ]
+
+    def page_desc(
+        self,
+        investor_id: Any = None,
+        start: date | None = None,
+        end: date | None = None,
+        before: tuple[datetime, int] | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        kinds: Iterable[Any] | None = None,
+        type_text: str | None = None,
+    ) -> tuple[list[Any], int, bool]:
+        """
+        Newest-first page: (items, total matching the filters, has_more).
+
+        Filters (investor, ``kinds``, dates) are all resolved on position indexes,
+        so ``total`` costs a few binary searches. A page within one index list is
+        located by arithmetic; several kinds are merged lazily from the top.
+        ``before`` (a keyset cursor) only narrows the page; ``total`` always
+        counts the whole filtered range.
+        """
+        total = sum(hi - lo for _, lo, hi in self._spans(investor_id, kinds, start, end, type_text=type_text))
+        spans = self._spans(investor_id, kinds, start, end, before, type_text)
+        transactions = self.transactions
+
+        if len(spans) == 1:
+            positions, lo, hi = spans[0]
+            top = hi - offset
+            bottom = max(lo, top - limit)
+            if positions is None:
+                items = [transactions[index] for index in range(top - 1, bottom - 1, -1)]
+            else:
+                items = [transactions[positions[index]] for index in range(top - 1, bottom - 1, -1)]
+            return items, total, bottom > lo
+
+        picked = list(islice(self._iter_spans_desc(spans), offset, offset + limit + 1))
+        return picked[:limit], total, len(picked) > limit
+
+    def _iter_spans_desc(self, spans: list[tuple[Sequence[int] | None, int, int]]) -> Iterator[Any]:
+        transactions = self.transactions
+        if len(spans) == 1 and spans[0][0] is None:
+            _, lo, hi = spans[0]
+            for index in range(hi - 1, lo - 1, -1):
+                yield transactions[index]
+            return
+        for position in heapq.merge(*(_descending(positions, lo, hi) for positions, lo, hi in spans), reverse=True):
+            yield transactions[position]
+
+    def iter_desc(
+        self,
+        investor_id: Any,
+        start: date | None,
+        end: date | None,
+        kinds: Iterable[Any] | None = None,
+        type_text: str | None = None,
+    ) -> Iterator[Any]:
+        """The rows of ``window`` newest first, produced lazily (streamed exports)."""
+        return self._iter_spans_desc(self._spans(investor_id, kinds, start, end, type_text=type_text))
+
+    def window(
+        self,
+        investor_id: Any,
+        start: date | None,
+        end: date | None,
+        kinds: Iterable[Any] | None = None,
+        type_text: str | None = None,
+    ) -> list[Any]:
+        """Transactions dated within [start, end] (either bound optional), ascending."""
+        spans = self._spans(investor_id, kinds, start, end, type_text=type_text)
+        if len(spans) == 1 and spans[0][0] is None:
+            _, lo, hi = spans[0]
+            return self.transactions[lo:hi]
+        positions = heapq.merge(*(positions[lo:hi] for positions, lo, hi in spans))
+        return [self.transactions[position] for position in positions]
+
+
+class ReportTimelineCache:
+    """
+    Holds the timeline of the most recently reported snapshot.
+
+    Entries are keyed by the snapshot's data generation and its transaction list
+    (held by reference, so the identity check cannot be fooled by id reuse). A
+    manager with an unknown generation is never cached.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entry: tuple[int, list[Any], int, ReportTimeline] | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        manager,
+        sort_key: Callable[[Any], tuple[datetime, int]] = transaction_sort_key,
+    ) -> ReportTimeline:
+        generation = getattr(manager, "data_generation", None)
+        transactions = manager.transactions
+        with self._lock:
+            entry = self._entry
+            if (
+                entry is not None
+                and generation is not None
+                and entry[0] == generation
+                and entry[1] is transactions
+                and entry[2] == len(transactions)
+            ):
+                self.hits += 1
+                return entry[3]
+            self.misses += 1
+
+        timeline = ReportTimeline(transactions, sort_key)
+        if generation is not None:
+            with self._lock:
+                self._entry = (generation, transactions, len(transactions), timeline)
+        return timeline
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"entries": int(self._entry is not None), "hits": self.hits, "misses": self.misses}
+
+
+_cache: ReportTimelineCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_report_timeline_cache() -> ReportTimelineCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ReportTimelineCache()
+    return _cache
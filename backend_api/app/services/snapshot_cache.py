@@ -0,0 +1,95 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, TypeVar
+
+from ..core.config import get_settings
+
+
+T = TypeVar("T")
+
+
+class SnapshotCache:
+    """
+    Bounded cache of values derived from one published manager snapshot.
+
+    Entries belong to the snapshot they were built from (held by reference and
+    checked with ``is``, plus its data generation). Every committed mutation
+    publishes a new snapshot, so the first lookup after a commit drops all
+    entries. A snapshot with an unknown generation is never cached.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._snapshot: Any = None
+        self._generation: int | None = None
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _bind(self, manager, generation: int) -> None:
+        if self._snapshot is not manager or self._generation != generation:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._snapshot = manager
+            self._generation = generation
+
+    def get_or_build(self, manager, key: Hashable, builder: Callable[[], T]) -> T:
+        generation = getattr(manager, "data_generation", None)
+        with self._lock:
+            if generation is not None:
+                self._bind(manager, generation)
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return self._entries[key]
+            self.misses += 1
+
+        value = builder()
+        if generation is not None:
+            with self._lock:
+                self._bind(manager, generation)
+                self._entries[key] = value
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._snapshot = None
+            self._generation = None
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            }
+
+
+_dashboard_cache: SnapshotCache | None = None
+_report_summary_cache: SnapshotCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_dashboard_cache() -> SnapshotCache:
+    global _dashboard_cache
+    if _dashboard_cache is None:
+        with _cache_lock:
+            if _dashboard_cache is None:
+                _dashboard_cache = SnapshotCache(max_entries=get_settings().dashboard_cache_max_entries)
+    return _dashboard_cache
+
+
+def get_report_summary_cache() -> SnapshotCache:
+    global _report_summary_cache
+    if _report_summary_cache is None:
+        with _cache_lock:
+            if _report_summary_cache is None:
+                _report_summary_cache = SnapshotCache(max_entries=get_settings().report_summary_cache_max_entries)
+    return _report_summary_cache
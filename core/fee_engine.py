@@ -0,0 +1,162 @@
+"""
+Engine tính phí hiệu suất dạng mảng (NumPy).
+
+Thay vòng lặp ``Tranche.calculate_excess_profit`` / ``calculate_hurdle_price``
+(mỗi lần gọi localize hai datetime bằng pytz và tính ``**``) bằng một lượt tính
+cho toàn bộ tranche của nhiều nhà đầu tư:
+
+    days      = floor((ending_date - entry_date) / 1 ngày)      (cùng múi giờ app)
+    years     = max(0, days / 365.25)
+    hurdle    = entry_nav * (1 + hurdle_rate) ** years
+    threshold = max(hurdle, hwm)
+    excess    = (price - threshold) * units   nếu price > threshold, ngược lại 0
+
+Các tổng theo nhà đầu tư được cộng tuần tự (cumsum) theo đúng thứ tự tranche để
+khớp từng bit với đường tính vô hướng cũ (``tests/test_math_audit.py``).
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pytz
+
+from config import EPSILON
+from utils.timezone_manager import TimezoneManager
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROS_PER_DAY = 86_400 * 1_000_000
+
+
+def _epoch_micros(value: datetime) -> int:
+    delta: timedelta = TimezoneManager.to_app_timezone(value) - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _epoch_micros_each(values: Sequence[datetime]) -> np.ndarray:
+    return np.fromiter((_epoch_micros(value) for value in values), dtype=np.int64, count=len(values))
+
+
+def _epoch_micros_array(values: Sequence[datetime]) -> np.ndarray:
+    """
+    ``_epoch_micros`` cho cả danh sách ngày.
+
+    Ngày naive được chuyển sang datetime64 một lần (qua pandas, nhanh hơn ``np.array``
+    với datetime Python) rồi trừ offset múi giờ app; pytz chỉ được gọi cho ngày nhỏ
+    nhất / lớn nhất. Nếu offset có thể đổi trong khoảng đó (có mốc chuyển giờ) hoặc
+    có ngày mang tzinfo thì tính từng phần tử như cũ.
+    """
+    if not values:
+        return np.empty(0, dtype=np.int64)
+    if any(value.tzinfo is not None for value in values):
+        return _epoch_micros_each(values)
+    try:
+        wall = pd.DatetimeIndex(values).values.astype("datetime64[us]").astype(np.int64)
+    except (ValueError, OverflowError):
+        return _epoch_micros_each(values)
+
+    lowest, highest = values[int(wall.argmin())], values[int(wall.argmax())]
+    offset = int(wall.min()) - _epoch_micros(lowest)
+    if int(wall.max()) - _epoch_micros(highest) == offset and not _has_transition(lowest, highest):
+        return wall - offset
+    return _epoch_micros_each(values)
+
+
+def _has_transition(lowest: datetime, highest: datetime) -> bool:
+    """
+    Múi giờ app có mốc chuyển giờ trong [lowest - 1 ngày, highest + 1 ngày] (giờ UTC) không.
+
+    Đọc danh sách mốc chuyển giờ ``_utc_transition_times`` (thuộc tính nội bộ của
+    ``pytz.tzinfo.DstTzInfo``). Múi giờ pytz cố định (UTC, ``StaticTzInfo``) không có
+    mốc nào; múi giờ khác không có thuộc tính này (zoneinfo, dateutil, pytz đổi cài
+    đặt) thì coi như có mốc để tính từng phần tử.
+    """
+    app_timezone = TimezoneManager.get_app_timezone()
+    if app_timezone is pytz.utc or isinstance(app_timezone, pytz.tzinfo.StaticTzInfo):
+        return False
+    transitions = getattr(app_timezone, "_utc_transition_times", None)
+    if transitions is None:
+        return True
+    margin = timedelta(days=1)
+    try:
+        start, end = lowest - margin, highest + margin
+    except OverflowError:
+        return True
+    return bisect_right(transitions, end) > bisect_left(transitions, start)
+
+
+def _sequential_sum(values: np.ndarray) -> float:
+    """Tổng cộng dồn trái -> phải như ``sum()`` của Python (np.sum dùng pairwise)."""
+    return float(np.cumsum(values)[-1]) if values.size else 0.0
+
+
+class TrancheFeeBatch:
+    """Kết quả tính cho một danh sách tranche đã được nhóm liền nhau theo nhà đầu tư."""
+
+    def __init__(
+        self,
+        groups: Sequence[Tuple[Any, List[Any], float]],
+        ending_date: datetime,
+        current_price: float,
+    ):
+        self.current_price = float(current_price)
+        self.tranches: List[Any] = []
+        self.slices: Dict[Any, slice] = {}
+        rates: List[float] = []
+        for investor_id, tranches, hurdle_rate in groups:
+            start = len(self.tranches)
+            self.tranches.extend(tranches)
+            rates.extend([float(hurdle_rate)] * len(tranches))
+            self.slices[investor_id] = slice(start, len(self.tranches))
+
+        count = len(self.tranches)
+        self.units = np.fromiter((t.units for t in self.tranches), dtype=np.float64, count=count)
+        self.entry_nav = np.fromiter((t.entry_nav for t in self.tranches), dtype=np.float64, count=count)
+        self.hwm = np.fromiter((t.hwm for t in self.tranches), dtype=np.float64, count=count)
+        self.invested_value = np.fromiter(
+            (getattr(t, "invested_value", t.units * t.entry_nav) for t in self.tranches),
+            dtype=np.float64,
+            count=count,
+        )
+        entry_micros = _epoch_micros_array([t.entry_date for t in self.tranches])
+
+        days = (_epoch_micros(ending_date) - entry_micros) // _MICROS_PER_DAY
+        years = np.maximum(days / 365.25, 0.0)
+        self.hurdle_price = self.entry_nav * np.power(1.0 + np.asarray(rates, dtype=np.float64), years)
+        threshold = np.where(self.hurdle_price >= self.hwm, self.hurdle_price, self.hwm)
+        self.excess_profit = np.where(
+            self.current_price > threshold,
+            (self.current_price - threshold) * self.units,
+            0.0,
+        )
+        self.active = self.units >= EPSILON
+
+    def excess_profit_by_tranche(self, investor_id: Any) -> List[Tuple[Any, float]]:
+        part = self.slices.get(investor_id, slice(0, 0))
+        return list(zip(self.tranches[part], self.excess_profit[part].tolist()))
+
+    def investor_totals(self, investor_id: Any, performance_fee_rate: float) -> Dict[str, float]:
+        """Các tổng dùng trong ``calculate_investor_fee`` (chưa làm tròn)."""
+        part = self.slices.get(investor_id, slice(0, 0))
+        active = self.active[part]
+        units = self.units[part]
+        excess = self.excess_profit[part][active]
+        return {
+            "units_before": _sequential_sum(units),
+            "invested_value": _sequential_sum(self.invested_value[part]),
+            "total_fee": _sequential_sum(performance_fee_rate * excess),
+            "hurdle_value": _sequential_sum(self.hurdle_price[part][active] * units[active]),
+            "hwm_value": _sequential_sum(self.hwm[part][active] * units[active]),
+            "excess_profit": _sequential_sum(excess),
+        }
+
+
+def compute_tranche_fees(
+    groups: Iterable[Tuple[Any, List[Any], float]],
+    ending_date: datetime,
+    current_price: float,
+) -> TrancheFeeBatch:
+    """``groups``: (investor_id, tranches theo thứ tự gốc, hurdle_rate_annual)."""
+    return TrancheFeeBatch(list(groups), ending_date, current_price)
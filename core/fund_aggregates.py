@@ -0,0 +1,185 @@
+"""
+Tổng hợp số liệu quỹ được duy trì tăng dần cho EnhancedFundManager.
+
+Giữ tổng units / tổng phí đã trả (cumulative_fees_paid) toàn quỹ và theo từng
+nhà đầu tư, để ``calculate_price_per_unit`` và các helper số dư là O(1).
+
+- Mỗi tranche được nhớ phần đóng góp (investor_id, units, fees) lần cuối; khi
+  manager gọi ``_track_new/_track_modified/_track_removed`` chỉ cộng/trừ chênh lệch.
+- Tổng được cộng tuần tự (``+=``) theo thứ tự tranche như ``sum()``: sau khi dựng lại
+  và khi chỉ thêm tranche mới (cuối danh sách) thì khớp từng bit với ``sum()`` của
+  đường tính cũ; sửa/xóa trừ phần cũ cộng phần mới nên có thể lệch vài ulp (nằm trong
+  dung sai của self check). NĐT không còn tranche nào được đặt lại về đúng 0.
+- Danh sách tranches bị gán lại / đổi độ dài ngoài các hàm tracking được phát
+  hiện qua chữ ký (id, len) và dựng lại khi đọc.
+- ``self_check=True`` (hoặc biến môi trường ``CNFUND_AGGREGATE_SELF_CHECK=1``):
+  mỗi lần đọc so với một lần tính lại toàn bộ và báo lỗi nếu lệch quá dung sai.
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+_SELF_CHECK_TOLERANCE = 1e-9
+
+
+class AggregateMismatchError(RuntimeError):
+    """Tổng duy trì tăng dần lệch với kết quả tính lại (chỉ khi bật self_check)."""
+
+
+def _contribution(tranche: Any) -> Tuple[Any, float, float]:
+    return (
+        tranche.investor_id,
+        float(tranche.units),
+        float(getattr(tranche, "cumulative_fees_paid", 0.0) or 0.0),
+    )
+
+
+class FundAggregates:
+    def __init__(self, self_check: Optional[bool] = None):
+        if self_check is None:
+            self_check = os.getenv("CNFUND_AGGREGATE_SELF_CHECK", "").strip().lower() in {"1", "true", "yes"}
+        self.self_check = self_check
+        # (đóng góp theo id(tranche), units toàn quỹ, phí toàn quỹ, units theo NĐT, phí theo NĐT, chữ ký,
+        #  số tranche theo NĐT)
+        self._state = None
+
+    @staticmethod
+    def _signature_of(source: Any) -> Tuple[int, int]:
+        return id(source.tranches), len(source.tranches)
+
+    def invalidate(self) -> None:
+        self._state = None
+
+    def sync(self, source: Any):
+        state = self._state
+        if state is None or state[5] != self._signature_of(source):
+            contributions: Dict[int, Tuple[Any, float, float]] = {}
+            total_units, total_fees = 0.0, 0.0
+            investor_units: Dict[Any, float] = {}
+            investor_fees: Dict[Any, float] = {}
+            investor_counts: Dict[Any, int] = {}
+            for tranche in source.tranches:
+                item = _contribution(tranche)
+                contributions[id(tranche)] = item
+                investor_id, units, fees = item
+                total_units += units
+                total_fees += fees
+                investor_units[investor_id] = investor_units.get(investor_id, 0.0) + units
+                investor_fees[investor_id] = investor_fees.get(investor_id, 0.0) + fees
+                investor_counts[investor_id] = investor_counts.get(investor_id, 0) + 1
+            state = [
+                contributions,
+                total_units,
+                total_fees,
+                investor_units,
+                investor_fees,
+                self._signature_of(source),
+                investor_counts,
+            ]
+            self._state = state
+        return state
+
+    def copy_for(self, source: Any, target: Any) -> "FundAggregates":
+        """Bản cho ``target`` mà tranches là bản copy (cùng thứ tự) của ``source.tranches`` (manager.clone)."""
+        other = FundAggregates(self_check=self.self_check)
+        state = self._state
+        if state is not None and state[5] == self._signature_of(source):
+            contributions = state[0]
+            other._state = [
+                {id(new): contributions[id(old)] for old, new in zip(source.tranches, target.tranches)},
+                state[1],
+                state[2],
+                dict(state[3]),
+                dict(state[4]),
+                self._signature_of(target),
+                dict(state[6]),
+            ]
+        return other
+
+    # ------------------------------------------------------------------
+    # Cập nhật tăng dần (gọi SAU khi tranche/danh sách đã đổi; sync đã chạy trước đó)
+    # ------------------------------------------------------------------
+    def _apply(self, state, item: Tuple[Any, float, float], sign: float) -> None:
+        investor_id, units, fees = item
+        count = state[6].get(investor_id, 0) + (1 if sign > 0 else -1)
+        state[6][investor_id] = count
+        if count <= 0:
+            # Không còn tranche: đặt lại đúng 0 thay vì giữ phần dư làm tròn
+            state[3][investor_id] = 0.0
+            state[4][investor_id] = 0.0
+        else:
+            state[3][investor_id] = state[3].get(investor_id, 0.0) + sign * units
+            state[4][investor_id] = state[4].get(investor_id, 0.0) + sign * fees
+        if not state[0]:
+            state[1], state[2] = 0.0, 0.0
+        else:
+            state[1] += sign * units
+            state[2] += sign * fees
+
+    def added(self, source: Any, tranche: Any) -> None:
+        state = self._state
+        item = _contribution(tranche)
+        state[0][id(tranche)] = item
+        self._apply(state, item, 1.0)
+        state[5] = self._signature_of(source)
+
+    def modified(self, source: Any, tranche: Any) -> None:
+        state = self.sync(source)
+        previous = state[0].get(id(tranche))
+        if previous is None:
+            return
+        current = _contribution(tranche)
+        if current != previous:
+            self._apply(state, previous, -1.0)
+            self._apply(state, current, 1.0)
+            state[0][id(tranche)] = current
+
+    def removed(self, source: Any, tranches: List[Any]) -> None:
+        state = self._state
+        for tranche in tranches:
+            previous = state[0].pop(id(tranche), None)
+            if previous is not None:
+                self._apply(state, previous, -1.0)
+        state[5] = self._signature_of(source)
+
+    # ------------------------------------------------------------------
+    # Truy vấn
+    # ------------------------------------------------------------------
+    def _read(self, source: Any):
+        state = self.sync(source)
+        if self.self_check:
+            problems = self.verify(source)
+            if problems:
+                raise AggregateMismatchError("; ".join(problems))
+        return state
+
+    def total_units(self, source: Any) -> float:
+        return self._read(source)[1]
+
+    def total_fees_paid(self, source: Any) -> float:
+        return self._read(source)[2]
+
+    def investor_units(self, source: Any, investor_id: Any) -> float:
+        return self._read(source)[3].get(investor_id, 0.0)
+
+    def investor_fees_paid(self, source: Any, investor_id: Any) -> float:
+        return self._read(source)[4].get(investor_id, 0.0)
+
+    def verify(self, source: Any) -> List[str]:
+        """So sánh với một lần tính lại toàn bộ (dung sai tương đối); trả về danh sách sai lệch (rỗng = khớp)."""
+        state = self.sync(source)
+        expected = FundAggregates(self_check=False).sync(source)
+        problems: List[str] = []
+
+        def _check(label: str, actual: float, wanted: float) -> None:
+            if abs(actual - wanted) > _SELF_CHECK_TOLERANCE * max(1.0, abs(wanted)):
+                problems.append(f"{label}: {actual!r} != {wanted!r}")
+
+        if set(state[0]) != set(expected[0]):
+            problems.append("tranche set differs")
+        _check("total_units", state[1], expected[1])
+        _check("total_fees_paid", state[2], expected[2])
+        for investor_id in set(state[3]) | set(expected[3]):
+            _check(f"units[{investor_id}]", state[3].get(investor_id, 0.0), expected[3].get(investor_id, 0.0))
+            _check(f"fees_paid[{investor_id}]", state[4].get(investor_id, 0.0), expected[4].get(investor_id, 0.0))
+        return problems
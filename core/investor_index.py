@@ -0,0 +1,87 @@
+"""
+Chỉ mục theo investor id cho EnhancedFundManager.
+
+Giữ dict ``investor_id -> [bản ghi]`` cho tranches / transactions / fee_records
+(theo đúng thứ tự trong danh sách gốc) và ``id -> Investor``, để các helper theo
+từng nhà đầu tư chỉ duyệt bản ghi của chính nhà đầu tư đó.
+
+Chỉ mục được cập nhật tăng dần qua các hàm ``_track_*`` / ``_remove_where`` của
+manager. Danh sách bị gán lại hoặc đổi độ dài từ bên ngoài (restore, test thêm
+trực tiếp) được phát hiện qua chữ ký (id, len) và dựng lại khi đọc lần sau.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+INDEXED_ENTITIES: Tuple[str, ...] = ("tranches", "transactions", "fee_records")
+_SOURCE_LISTS: Tuple[str, ...] = ("investors",) + INDEXED_ENTITIES
+
+
+class InvestorIndex:
+    def __init__(self):
+        # Toàn bộ trạng thái nằm trong một tuple để reader không khóa luôn thấy
+        # một bản dựng trọn vẹn: (investors, rows, signature)
+        self._state: Optional[Tuple[Dict[Any, Any], Dict[str, Dict[Any, List[Any]]], Dict[str, Tuple[int, int]]]] = None
+
+    @staticmethod
+    def _signature_of(source: Any) -> Dict[str, Tuple[int, int]]:
+        return {name: (id(getattr(source, name)), len(getattr(source, name))) for name in _SOURCE_LISTS}
+
+    def invalidate(self) -> None:
+        self._state = None
+
+    def sync(self, source: Any):
+        """Dựng lại chỉ mục nếu danh sách trên ``source`` đã đổi ngoài các hàm tracking."""
+        state = self._state
+        if state is None or state[2] != self._signature_of(source):
+            investors: Dict[Any, Any] = {}
+            for investor in source.investors:
+                investors.setdefault(investor.id, investor)
+            rows: Dict[str, Dict[Any, List[Any]]] = {}
+            for entity in INDEXED_ENTITIES:
+                buckets: Dict[Any, List[Any]] = {}
+                for obj in getattr(source, entity):
+                    buckets.setdefault(obj.investor_id, []).append(obj)
+                rows[entity] = buckets
+            state = (investors, rows, self._signature_of(source))
+            self._state = state
+        return state
+
+    # ------------------------------------------------------------------
+    # Cập nhật tăng dần (gọi SAU khi danh sách gốc đã đổi, chỉ mục đã sync trước đó)
+    # ------------------------------------------------------------------
+    def added(self, source: Any, entity: str, obj: Any) -> None:
+        investors, rows, signature = self._state
+        if entity == "investors":
+            investors.setdefault(obj.id, obj)
+        else:
+            rows[entity].setdefault(obj.investor_id, []).append(obj)
+        signature[entity] = (id(getattr(source, entity)), len(getattr(source, entity)))
+
+    def removed(self, source: Any, entity: str, objs: List[Any]) -> None:
+        investors, rows, signature = self._state
+        for obj in objs:
+            if entity == "investors":
+                if investors.get(obj.id) is obj:
+                    del investors[obj.id]
+                    # Còn bản trùng id (dữ liệu lỗi) thì trỏ sang bản đó như next(...) cũ
+                    replacement = next((inv for inv in source.investors if inv.id == obj.id), None)
+                    if replacement is not None:
+                        investors[obj.id] = replacement
+                continue
+            bucket = rows[entity].get(obj.investor_id, [])
+            for position, item in enumerate(bucket):
+                if item is obj:
+                    del bucket[position]
+                    break
+            if not bucket:
+                rows[entity].pop(obj.investor_id, None)
+        signature[entity] = (id(getattr(source, entity)), len(getattr(source, entity)))
+
+    # ------------------------------------------------------------------
+    # Truy vấn
+    # ------------------------------------------------------------------
+    def investor(self, source: Any, investor_id: Any) -> Any:
+        return self.sync(source)[0].get(investor_id)
+
+    def rows(self, source: Any, entity: str, investor_id: Any) -> List[Any]:
+        return list(self.sync(source)[1][entity].get(investor_id, ()))
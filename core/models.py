@@ -1,6 +1,9 @@
 from datetime import date, datetime
+from enum import IntEnum
+from functools import lru_cache
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import unicodedata
 from utils.timezone_manager import TimezoneManager
 
 @dataclass
@@ -136,16 +139,106 @@ class Tranche:
         fee_units = fee_amount / current_price if current_price > 0 else 0
         self.units = max(0.0, self.units - fee_units)
 
+class TransactionKind(IntEnum):
+    """
+    Mã loại giao dịch chuẩn (lưu ở cột ``fund_transactions.kind``).
+
+    ``type`` vẫn là nhãn hiển thị tiếng Việt; mọi phép lọc/tổng hợp so sánh
+    ``kind`` để khỏi chuẩn hóa Unicode chuỗi loại ở từng dòng, từng request.
+    """
+
+    OTHER = 0
+    DEPOSIT = 1  # 'Nạp'
+    WITHDRAWAL = 2  # 'Rút'
+    FEE = 3  # 'Phí'
+    FEE_RECEIVED = 4  # 'Phí Nhận'
+    NAV_UPDATE = 5  # 'NAV Update'
+    FUND_MANAGER_WITHDRAWAL = 6  # 'Fund Manager Withdrawal'
+
+
+TRANSACTION_KIND_LABELS = {
+    TransactionKind.DEPOSIT: 'Nạp',
+    TransactionKind.WITHDRAWAL: 'Rút',
+    TransactionKind.FEE: 'Phí',
+    TransactionKind.FEE_RECEIVED: 'Phí Nhận',
+    TransactionKind.NAV_UPDATE: 'NAV Update',
+    TransactionKind.FUND_MANAGER_WITHDRAWAL: 'Fund Manager Withdrawal',
+}
+_KINDS_BY_LABEL = {label: kind for kind, label in TRANSACTION_KIND_LABELS.items()}
+
+DEPOSIT_KINDS = frozenset({TransactionKind.DEPOSIT})
+WITHDRAWAL_KINDS = frozenset({TransactionKind.WITHDRAWAL, TransactionKind.FUND_MANAGER_WITHDRAWAL})
+FEE_KINDS = frozenset({TransactionKind.FEE, TransactionKind.FEE_RECEIVED})
+
+
+def normalize_type_text(value: str) -> str:
+    """Bỏ dấu, chữ thường (so khớp nhãn loại giao dịch không phân biệt dấu)."""
+    normalized = unicodedata.normalize("NFD", str(value)).encode("ascii", "ignore").decode("ascii")
+    return normalized.lower().strip()
+
+
+@lru_cache(maxsize=256)
+def classify_transaction_type(label: str) -> TransactionKind:
+    """
+    Mã chuẩn cho một nhãn loại giao dịch.
+
+    Nhãn chuẩn tra thẳng; nhãn lạ (dữ liệu cũ, file import) được đoán theo từ khóa
+    như các bộ lọc báo cáo trước đây. Có cache theo nhãn nên chỉ chuẩn hóa một lần.
+    """
+    kind = _KINDS_BY_LABEL.get(label)
+    if kind is not None:
+        return kind
+    text = normalize_type_text(label)
+    if "nap" in text or "deposit" in text:
+        return TransactionKind.DEPOSIT
+    if "fund manager" in text and "withdraw" in text:
+        return TransactionKind.FUND_MANAGER_WITHDRAWAL
+    if "rut" in text or "withdraw" in text or "rat" in text:
+        return TransactionKind.WITHDRAWAL
+    if "phi nhan" in text or "fee received" in text:
+        return TransactionKind.FEE_RECEIVED
+    if "phi" in text or "fee" in text:
+        return TransactionKind.FEE
+    if "nav" in text:
+        return TransactionKind.NAV_UPDATE
+    return TransactionKind.OTHER
+
+
+@lru_cache(maxsize=256)
+def kinds_matching(query: str) -> frozenset:
+    """
+    Các mã có nhãn chuẩn chứa ``query`` (không phân biệt dấu), vd 'phi' -> Phí, Phí Nhận.
+
+    Giao dịch lưu nhãn khác nhãn chuẩn (dữ liệu cũ, vd 'Deposit') còn được lọc theo
+    chính ``type`` của nó qua ``type_text_matches``.
+    """
+    wanted = normalize_type_text(query)
+    return frozenset(
+        kind for kind, label in TRANSACTION_KIND_LABELS.items() if wanted in normalize_type_text(label)
+    )
+
+
+def is_canonical_type(label: str, kind: TransactionKind) -> bool:
+    """``label`` đúng là nhãn chuẩn của ``kind`` (khi đó lọc theo mã tương đương lọc theo chữ)."""
+    return TRANSACTION_KIND_LABELS.get(kind) == label
+
+
+def type_text_matches(label: str, query: str) -> bool:
+    """Bộ lọc theo chữ như trước khi có mã: ``query`` nằm trong ``label`` (không phân biệt dấu)."""
+    return normalize_type_text(query) in normalize_type_text(label)
+
+
 @dataclass
 class Transaction:
     """Transaction model with type safety"""
     id: int
     investor_id: int
     date: datetime
-    type: str  # 'Nạp', 'Rút', 'NAV Update', 'Phí', 'Fund Manager Withdrawal'
+    type: str  # 'Nạp', 'Rút', 'NAV Update', 'Phí', 'Phí Nhận', 'Fund Manager Withdrawal'
     amount: float
     nav: float
     units_change: float
+    kind: TransactionKind = field(init=False, default=TransactionKind.OTHER)  # suy ra từ ``type``
     
     def __post_init__(self):
         # Type safety: ensure numeric fields are proper types
@@ -155,6 +248,7 @@ class Transaction:
         self.amount = safe_float_conversion(self.amount)
         self.nav = safe_float_conversion(self.nav)
         self.units_change = safe_float_conversion(self.units_change)
+        self.kind = classify_transaction_type(self.type)
 
 @dataclass
 class FeeRecord:
@@ -0,0 +1,137 @@
+"""
+Chuỗi NAV / units / giá mỗi unit theo ngày (materialized, lưu ở bảng fund_nav_daily).
+
+Mỗi ngày có giao dịch là một điểm, phản ánh trạng thái sau giao dịch cuối cùng
+của ngày đó theo thứ tự ``(date, id)``:
+
+- ``total_units``: tổng ``units_change`` cộng dồn từ đầu (cộng tuần tự)
+- ``total_nav``: NAV ghi trên giao dịch cuối cùng của ngày
+- ``price_per_unit``: ``total_nav / total_units`` (DEFAULT_UNIT_PRICE khi quỹ chưa có units)
+
+Ngày không có giao dịch giữ nguyên điểm trước đó (tra bằng ``as_of``).
+
+Chuỗi là bất biến: ``rebuild_from(transactions, first_day)`` trả về chuỗi mới giữ
+nguyên các điểm trước ``first_day`` và tính lại từ ngày đó, nên snapshot đang được
+đọc không bao giờ thấy chuỗi dở dang. Thêm giao dịch ở ngày mới nhất chỉ tính
+lại một điểm; xóa / undo giao dịch cũ tính lại từ ngày bị ảnh hưởng.
+"""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Iterable, List, Optional, Tuple
+
+from config import DEFAULT_UNIT_PRICE, EPSILON
+
+
+@dataclass(frozen=True)
+class DailyNavPoint:
+    day: date
+    total_nav: float
+    total_units: float
+    price_per_unit: float
+
+
+def as_day(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.fromisoformat(str(value)).date()
+
+
+def transaction_day(transaction: Any) -> date:
+    return as_day(transaction.date)
+
+
+def _sort_key(transaction: Any) -> Tuple[Any, int]:
+    value = transaction.date
+    if isinstance(value, datetime):
+        value = value.replace(tzinfo=None)
+    elif not isinstance(value, date):
+        value = datetime.fromisoformat(str(value)).replace(tzinfo=None)
+    else:
+        value = datetime.combine(value, datetime.min.time())
+    return value, int(transaction.id)
+
+
+def _price(total_nav: float, total_units: float) -> float:
+    if total_units <= EPSILON:
+        return DEFAULT_UNIT_PRICE
+    return total_nav / total_units
+
+
+def build_points(transactions: Iterable[Any], carry: Optional[DailyNavPoint] = None) -> List[DailyNavPoint]:
+    """Các điểm theo ngày cho ``transactions`` (đều sau ``carry.day``), bắt đầu từ trạng thái ``carry``."""
+    total_units = carry.total_units if carry is not None else 0.0
+    points: List[DailyNavPoint] = []
+    current_day: Optional[date] = None
+    current_nav = 0.0
+    for transaction in sorted(transactions, key=_sort_key):
+        day = transaction_day(transaction)
+        if current_day is not None and day != current_day:
+            points.append(DailyNavPoint(current_day, current_nav, total_units, _price(current_nav, total_units)))
+        current_day = day
+        total_units += float(transaction.units_change or 0.0)
+        current_nav = float(transaction.nav or 0.0)
+    if current_day is not None:
+        points.append(DailyNavPoint(current_day, current_nav, total_units, _price(current_nav, total_units)))
+    return points
+
+
+class DailyNavSeries:
+    def __init__(self, points: Optional[List[DailyNavPoint]] = None):
+        self.points: List[DailyNavPoint] = list(points or [])
+        self.days: List[date] = [point.day for point in self.points]
+
+    @classmethod
+    def build(cls, transactions: Iterable[Any]) -> "DailyNavSeries":
+        return cls(build_points(transactions))
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def rebuild_from(
+        self, transactions: Iterable[Any], first_day: Optional[date]
+    ) -> Tuple["DailyNavSeries", List[DailyNavPoint]]:
+        """
+        Chuỗi mới tính lại từ ``first_day`` (None = tính lại toàn bộ).
+
+        Trả về (chuỗi mới, các điểm từ ``first_day`` trở đi) — phần cần ghi lại xuống bảng.
+        """
+        if first_day is None:
+            points = build_points(transactions)
+            return DailyNavSeries(points), points
+        cut = bisect_left(self.days, first_day)
+        carry = self.points[cut - 1] if cut else None
+        points = build_points((tx for tx in transactions if transaction_day(tx) >= first_day), carry)
+        return DailyNavSeries(self.points[:cut] + points), points
+
+    # ------------------------------------------------------------------
+    # Truy vấn
+    # ------------------------------------------------------------------
+    def as_of(self, day: date) -> Optional[DailyNavPoint]:
+        """Điểm cuối cùng có ngày <= ``day``."""
+        position = bisect_right(self.days, day)
+        return self.points[position - 1] if position else None
+
+    def between(self, start: Optional[date] = None, end: Optional[date] = None) -> List[DailyNavPoint]:
+        low = bisect_left(self.days, start) if start else 0
+        high = bisect_right(self.days, end) if end else len(self.days)
+        return self.points[low:high]
+
+    def period_return(self, start: Optional[date] = None, end: Optional[date] = None) -> float:
+        """
+        Tăng trưởng giá mỗi unit trong kỳ [start, end].
+
+        Giá gốc là điểm trước ``start``; nếu quỹ bắt đầu trong kỳ thì gốc là
+        DEFAULT_UNIT_PRICE (giá phát hành ban đầu).
+        """
+        end_point = self.as_of(end) if end else (self.points[-1] if self.points else None)
+        if end_point is None:
+            return 0.0
+        base_position = bisect_left(self.days, start) if start else 0
+        base_price = self.points[base_position - 1].price_per_unit if base_position else DEFAULT_UNIT_PRICE
+        if base_price <= 0:
+            return 0.0
+        return end_point.price_per_unit / base_price - 1.0
@@ -0,0 +1,138 @@
+"""
+Dòng thời gian NAV đã sắp xếp cho EnhancedFundManager.
+
+Giữ các giao dịch có NAV (>= 0) theo khóa ``(ngày đã chuẩn hóa múi giờ, id)``,
+khóa được tính một lần khi thêm. NAV mới nhất là phần tử cuối (O(1)), NAV tại
+một thời điểm là một lần bisect. Có một dãy riêng cho NAV > 0 để phục vụ
+``include_zero_nav=False``.
+
+Giống InvestorIndex: cập nhật tăng dần qua các hàm tracking của manager, dựng lại
+khi danh sách transactions bị gán lại / đổi độ dài từ bên ngoài.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from utils.timezone_manager import TimezoneManager
+
+
+def nav_sort_key(transaction: Any) -> Tuple[datetime, int]:
+    return TimezoneManager.normalize_for_display(transaction.date), transaction.id
+
+
+class _Series:
+    """Hai danh sách song song: khóa đã sắp xếp và giao dịch tương ứng."""
+
+    __slots__ = ("keys", "items")
+
+    def __init__(self, entries: List[Tuple[Tuple[datetime, int], Any]]):
+        self.keys = [key for key, _ in entries]
+        self.items = [tx for _, tx in entries]
+
+    def copy(self) -> "_Series":
+        other = _Series([])
+        other.keys = list(self.keys)
+        other.items = list(self.items)
+        return other
+
+    def insert(self, key, transaction) -> None:
+        if not self.keys or self.keys[-1] <= key:
+            self.keys.append(key)
+            self.items.append(transaction)
+            return
+        position = bisect_right(self.keys, key)
+        self.keys.insert(position, key)
+        self.items.insert(position, transaction)
+
+    def remove(self, key, transaction) -> None:
+        position = bisect_left(self.keys, key)
+        while position < len(self.keys) and self.keys[position] == key:
+            if self.items[position] is transaction:
+                del self.keys[position]
+                del self.items[position]
+                return
+            position += 1
+
+    def last(self) -> Optional[Any]:
+        return self.items[-1] if self.items else None
+
+    def last_at_or_before(self, target: datetime) -> Optional[Any]:
+        # Khóa (target, +inf id): lấy giao dịch cuối cùng có ngày <= target
+        position = bisect_right(self.keys, (target, float("inf")))
+        return self.items[position - 1] if position else None
+
+
+class NavTimeline:
+    def __init__(self):
+        # (tất cả NAV >= 0, chỉ NAV > 0, chữ ký danh sách nguồn) — gán một lần cho reader không khóa
+        self._state: Optional[Tuple[_Series, _Series, Tuple[int, int]]] = None
+
+    @staticmethod
+    def _signature_of(source: Any) -> Tuple[int, int]:
+        return id(source.transactions), len(source.transactions)
+
+    @staticmethod
+    def _has_nav(transaction: Any) -> bool:
+        return transaction.nav is not None and transaction.nav >= 0
+
+    def invalidate(self) -> None:
+        self._state = None
+
+    def sync(self, source: Any):
+        state = self._state
+        if state is None or state[2] != self._signature_of(source):
+            entries = sorted(
+                ((nav_sort_key(tx), tx) for tx in source.transactions if self._has_nav(tx)),
+                key=lambda entry: entry[0],
+            )
+            state = (
+                _Series(entries),
+                _Series([entry for entry in entries if entry[1].nav > 0]),
+                self._signature_of(source),
+            )
+            self._state = state
+        return state
+
+    def copy_for(self, source: Any, target: Any) -> "NavTimeline":
+        """Timeline cho ``target`` có cùng danh sách transactions với ``source`` (manager.clone)."""
+        other = NavTimeline()
+        state = self._state
+        if state is not None and state[2] == self._signature_of(source):
+            all_navs, positive_navs, _ = state
+            other._state = (all_navs.copy(), positive_navs.copy(), self._signature_of(target))
+        return other
+
+    def added(self, source: Any, transaction: Any) -> None:
+        all_navs, positive_navs, _ = self._state
+        if self._has_nav(transaction):
+            key = nav_sort_key(transaction)
+            all_navs.insert(key, transaction)
+            if transaction.nav > 0:
+                positive_navs.insert(key, transaction)
+        self._state = (all_navs, positive_navs, self._signature_of(source))
+
+    def removed(self, source: Any, transactions: List[Any]) -> None:
+        all_navs, positive_navs, _ = self._state
+        for transaction in transactions:
+            if self._has_nav(transaction):
+                key = nav_sort_key(transaction)
+                all_navs.remove(key, transaction)
+                positive_navs.remove(key, transaction)
+        self._state = (all_navs, positive_navs, self._signature_of(source))
+
+    # ------------------------------------------------------------------
+    # Truy vấn
+    # ------------------------------------------------------------------
+    def _series(self, source: Any, include_zero_nav: bool) -> _Series:
+        all_navs, positive_navs, _ = self.sync(source)
+        return all_navs if include_zero_nav else positive_navs
+
+    def latest(self, source: Any, include_zero_nav: bool = True) -> Optional[Any]:
+        return self._series(source, include_zero_nav).last()
+
+    def as_of(self, source: Any, target: datetime, include_zero_nav: bool = True) -> Optional[Any]:
+        return self._series(source, include_zero_nav).last_at_or_before(target)
+
+    def transactions(self, source: Any) -> List[Any]:
+        return list(self._series(source, True).items)
@@ -7,15 +7,22 @@ This handler persists the same domain objects used by EnhancedFundManager:
 - Tranche
 - Transaction
 - FeeRecord
+
+plus the derived daily NAV series (``fund_nav_daily``, see core/nav_series.py).
 """
 
 from __future__ import annotations
 
+import csv
+import gc
+import io
 import os
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import pandas as pd
 from sqlalchemy import (
@@ -24,7 +31,9 @@ from sqlalchemy import (
     DateTime,
     Float,
     Integer,
+    SmallInteger,
     String,
+    bindparam,
     create_engine,
     func,
     inspect,
@@ -33,7 +42,8 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, sessionmaker
 
-from .models import FeeRecord, Investor, Transaction, Tranche
+from .models import FeeRecord, Investor, Transaction, TransactionKind, Tranche, classify_transaction_type
+from .nav_series import DailyNavPoint, build_points
 from utils.type_safety_fixes import safe_float_conversion, safe_int_conversion
 
 
@@ -135,6 +145,8 @@ class TransactionRow(Base):
     amount: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
     nav: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
     units_change: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    # TransactionKind code derived from ``type`` (filters compare integers)
+    kind: Mapped[int] = mapped_column(SmallInteger, index=True, nullable=False, default=0)
 
 
 class FeeRecordRow(Base):
@@ -178,6 +190,222 @@ class FeeInvestorOverrideRow(Base):
     )
 
 
+class NavDailyRow(Base):
+    """Materialized daily NAV / units / unit price (one row per day with transactions)."""
+
+    __tablename__ = "fund_nav_daily"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    total_nav: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    total_units: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    price_per_unit: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+
+class DataGenerationRow(Base):
+    """Single-row counter bumped on every committed save (cross-process change detection)."""
+
+    __tablename__ = "fund_data_generation"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, default=1)
+    generation: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+    )
+
+
+def _investor_row(inv: Investor) -> Dict[str, Any]:
+    return {
+        "id": safe_int_conversion(inv.id),
+        "name": str(inv.name).strip(),
+        "phone": str(getattr(inv, "phone", "") or "").strip(),
+        "address": str(getattr(inv, "address", "") or "").strip(),
+        "province_code": str(getattr(inv, "province_code", "") or "").strip(),
+        "province_name": str(getattr(inv, "province_name", "") or "").strip(),
+        "ward_code": str(getattr(inv, "ward_code", "") or "").strip(),
+        "ward_name": str(getattr(inv, "ward_name", "") or "").strip(),
+        "address_line": str(getattr(inv, "address_line", "") or "").strip(),
+        "email": str(getattr(inv, "email", "") or "").strip(),
+        "join_date": _as_date(getattr(inv, "join_date", None)),
+        "is_fund_manager": bool(getattr(inv, "is_fund_manager", False)),
+    }
+
+
+def _tranche_row(t: Tranche) -> Dict[str, Any]:
+    default_value = safe_float_conversion(t.units) * safe_float_conversion(t.entry_nav)
+    return {
+        "investor_id": safe_int_conversion(t.investor_id),
+        "tranche_id": str(t.tranche_id),
+        "entry_date": _as_datetime(t.entry_date),
+        "entry_nav": safe_float_conversion(t.entry_nav),
+        "units": safe_float_conversion(t.units),
+        "hwm": safe_float_conversion(getattr(t, "hwm", t.entry_nav)),
+        "original_entry_date": _as_datetime(getattr(t, "original_entry_date", t.entry_date)),
+        "original_entry_nav": safe_float_conversion(getattr(t, "original_entry_nav", t.entry_nav)),
+        "cumulative_fees_paid": safe_float_conversion(getattr(t, "cumulative_fees_paid", 0.0)),
+        "original_invested_value": safe_float_conversion(
+            getattr(t, "original_invested_value", default_value)
+        ),
+        "invested_value": safe_float_conversion(getattr(t, "invested_value", default_value)),
+    }
+
+
+def _transaction_row(tx: Transaction) -> Dict[str, Any]:
+    return {
+        "id": safe_int_conversion(tx.id),
+        "investor_id": safe_int_conversion(tx.investor_id),
+        "date": _as_datetime(tx.date),
+        "type": str(tx.type),
+        "amount": safe_float_conversion(tx.amount),
+        "nav": safe_float_conversion(tx.nav),
+        "units_change": safe_float_conversion(tx.units_change),
+        "kind": int(tx.kind),
+    }
+
+
+def _fee_record_row(fr: FeeRecord) -> Dict[str, Any]:
+    return {
+        "id": safe_int_conversion(fr.id),
+        "period": str(fr.period),
+        "investor_id": safe_int_conversion(fr.investor_id),
+        "fee_amount": safe_float_conversion(fr.fee_amount),
+        "fee_units": safe_float_conversion(fr.fee_units),
+        "calculation_date": _as_datetime(fr.calculation_date),
+        "units_before": safe_float_conversion(fr.units_before),
+        "units_after": safe_float_conversion(fr.units_after),
+        "nav_per_unit": safe_float_conversion(fr.nav_per_unit),
+        "description": str(getattr(fr, "description", "") or ""),
+    }
+
+
+def _nav_daily_row(point: DailyNavPoint) -> Dict[str, Any]:
+    return {
+        "day": point.day,
+        "total_nav": float(point.total_nav),
+        "total_units": float(point.total_units),
+        "price_per_unit": float(point.price_per_unit),
+    }
+
+
+# Column order used by the bulk loaders (matches the dataclass field names).
+_INVESTOR_FIELDS = (
+    "id",
+    "name",
+    "phone",
+    "address",
+    "province_code",
+    "province_name",
+    "ward_code",
+    "ward_name",
+    "address_line",
+    "email",
+    "join_date",
+    "is_fund_manager",
+)
+_TRANCHE_COLUMNS = (
+    "investor_id",
+    "tranche_id",
+    "entry_date",
+    "entry_nav",
+    "units",
+    "original_invested_value",
+    "hwm",
+    "original_entry_date",
+    "original_entry_nav",
+    "cumulative_fees_paid",
+    "invested_value",
+)
+_TRANSACTION_FIELDS = ("id", "investor_id", "date", "type", "amount", "nav", "units_change", "kind")
+_FEE_RECORD_FIELDS = (
+    "id",
+    "period",
+    "investor_id",
+    "fee_amount",
+    "fee_units",
+    "calculation_date",
+    "units_before",
+    "units_after",
+    "nav_per_unit",
+    "description",
+)
+_LOAD_CHUNK_SIZE = 5000
+_KIND_BY_CODE = {int(kind): kind for kind in TransactionKind if kind is not TransactionKind.OTHER}
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+# Row -> dataclass builders. Values come from typed, NOT NULL columns, so the
+# per-field coercion in the dataclasses' __post_init__ is skipped on purpose.
+def _investor_from_row(row) -> Investor:
+    investor = Investor.__new__(Investor)
+    values = dict(zip(_INVESTOR_FIELDS, row))
+    for name in ("phone", "address", "province_code", "province_name", "ward_code", "ward_name", "address_line", "email"):
+        values[name] = values[name] or ""
+    values["join_date"] = values["join_date"] or date.today()
+    values["is_fund_manager"] = bool(values["is_fund_manager"])
+    investor.__dict__.update(values)
+    return investor
+
+
+def _tranche_from_row(row) -> Tranche:
+    tranche = Tranche.__new__(Tranche)
+    values = dict(zip(_TRANCHE_COLUMNS, row))
+    values["_invested_value"] = float(values.pop("invested_value"))
+    tranche.__dict__.update(values)
+    return tranche
+
+
+def _transaction_from_row(row) -> Transaction:
+    transaction = Transaction.__new__(Transaction)
+    transaction.__dict__.update(zip(_TRANSACTION_FIELDS, row))
+    transaction.kind = _KIND_BY_CODE.get(transaction.kind) or classify_transaction_type(transaction.type)
+    return transaction
+
+
+def _fee_record_from_row(row) -> FeeRecord:
+    fee_record = FeeRecord.__new__(FeeRecord)
+    fee_record.__dict__.update(zip(_FEE_RECORD_FIELDS, row))
+    fee_record.description = fee_record.description or ""
+    return fee_record
+
+
+def _rows_to_csv(rows: List[Dict[str, Any]], columns: List[str]) -> io.StringIO:
+    """CSV payload for COPY; every field is quoted so empty strings never become NULL."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_ALL, lineterminator="\n")
+    writer.writerows([row[column] for column in columns] for row in rows)
+    buffer.seek(0)
+    return buffer
+
+
+def _copy_from_buffer(cursor, statement: str, buffer: io.StringIO) -> None:
+    if hasattr(cursor, "copy_expert"):  # psycopg2
+        cursor.copy_expert(statement, buffer)
+    else:  # psycopg 3
+        with cursor.copy(statement) as copy:
+            copy.write(buffer.getvalue())
+
+
+# entity name -> (table, key column, row serializer) used by delta saves.
+_ENTITY_TABLES = {
+    "investors": (InvestorRow.__table__, "id", _investor_row),
+    "tranches": (TrancheRow.__table__, "tranche_id", _tranche_row),
+    "transactions": (TransactionRow.__table__, "id", _transaction_row),
+    "fee_records": (FeeRecordRow.__table__, "id", _fee_record_row),
+}
+_DELETE_CHUNK_SIZE = 500
+
+
 class PostgresDataHandler:
     """
     SQL-backed data handler compatible with EnhancedFundManager.
@@ -187,6 +415,8 @@ class PostgresDataHandler:
         self.connected = True
         self._lock = threading.Lock()
         self._session_factory: Optional[sessionmaker] = None
+        # (generation before, generation after) of the last save committed by this handler
+        self.last_generation_bump: Optional[Tuple[int, int]] = None
 
         raw_url = database_url or os.getenv("API_DATABASE_URL") or os.getenv("DATABASE_URL")
         if not raw_url:
@@ -199,6 +429,7 @@ class PostgresDataHandler:
         try:
             Base.metadata.create_all(self.engine)
             self.ensure_schema_migrations()
+            self._ensure_generation_row()
             self._bootstrap_from_csv_if_needed()
         except Exception:
             self.connected = False
@@ -237,12 +468,58 @@ class PostgresDataHandler:
             if column_name not in existing_columns:
                 statements.append(ddl)
 
-        if not statements:
-            return
+        if "fund_transactions" in inspector.get_table_names():
+            transaction_columns = {column["name"] for column in inspector.get_columns("fund_transactions")}
+            if "kind" not in transaction_columns:
+                statements.append("ALTER TABLE fund_transactions ADD COLUMN kind SMALLINT NOT NULL DEFAULT 0")
+                statements.append("CREATE INDEX IF NOT EXISTS ix_fund_transactions_kind ON fund_transactions (kind)")
 
         with self.engine.begin() as conn:
             for ddl in statements:
                 conn.execute(text(ddl))
+            self._backfill_transaction_kinds(conn)
+
+    @staticmethod
+    def _backfill_transaction_kinds(conn) -> None:
+        """Fill ``kind`` on rows written before the column existed (one UPDATE per distinct label)."""
+        table = TransactionRow.__table__
+        other = int(TransactionKind.OTHER)
+        labels = conn.execute(select(table.c.type).where(table.c.kind == other).distinct()).scalars().all()
+        for label in labels:
+            kind = classify_transaction_type(label)
+            if kind is not TransactionKind.OTHER:
+                conn.execute(
+                    table.update().where(table.c.type == label, table.c.kind == other).values(kind=int(kind))
+                )
+
+    def _ensure_generation_row(self) -> None:
+        with self.engine.begin() as conn:
+            exists = conn.execute(
+                select(DataGenerationRow.__table__.c.id).where(DataGenerationRow.__table__.c.id == 1)
+            ).first()
+            if exists is None:
+                conn.execute(DataGenerationRow.__table__.insert(), {"id": 1, "generation": 0})
+
+    def _bump_generation(self, conn) -> None:
+        table = DataGenerationRow.__table__
+        conn.execute(
+            table.update()
+            .where(table.c.id == 1)
+            .values(
+                generation=table.c.generation + 1,
+                updated_at=datetime.now(timezone.utc).replace(tzinfo=None),
+            )
+        )
+        current = int(conn.execute(select(table.c.generation).where(table.c.id == 1)).scalar_one())
+        self.last_generation_bump = (current - 1, current)
+
+    def get_data_generation(self) -> int:
+        """Current committed data generation (0 when nothing has been saved yet)."""
+        with self.engine.connect() as conn:
+            value = conn.execute(
+                select(DataGenerationRow.__table__.c.generation).where(DataGenerationRow.__table__.c.id == 1)
+            ).scalar()
+        return int(value or 0)
 
     def _is_empty(self) -> bool:
         with self._session() as session:
@@ -419,89 +696,95 @@ class PostgresDataHandler:
                 continue
         return rows
 
-    # Load methods
+    # Load methods (Core select -> plain tuples -> dataclasses, no ORM hydration)
+    def _stream_rows(self, statement) -> Iterator[Any]:
+        """Yield result tuples in chunks; uses a server-side cursor on PostgreSQL."""
+        with self.engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=_LOAD_CHUNK_SIZE).execute(statement)
+            for partition in result.partitions():
+                yield from partition
+
     def load_investors(self) -> List[Investor]:
-        with self._session() as session:
-            rows = session.execute(select(InvestorRow).order_by(InvestorRow.id.asc())).scalars().all()
-        return [
-            Investor(
-                id=row.id,
-                name=row.name,
-                phone=row.phone or "",
-                address=row.address or "",
-                province_code=getattr(row, "province_code", "") or "",
-                province_name=getattr(row, "province_name", "") or "",
-                ward_code=getattr(row, "ward_code", "") or "",
-                ward_name=getattr(row, "ward_name", "") or "",
-                address_line=getattr(row, "address_line", "") or "",
-                email=row.email or "",
-                join_date=row.join_date,
-                is_fund_manager=bool(row.is_fund_manager),
-            )
-            for row in rows
-        ]
+        table = InvestorRow.__table__
+        statement = select(*(table.c[name] for name in _INVESTOR_FIELDS)).order_by(table.c.id.asc())
+        return [_investor_from_row(row) for row in self._stream_rows(statement)]
 
     def load_tranches(self) -> List[Tranche]:
-        with self._session() as session:
-            rows = session.execute(
-                select(TrancheRow).order_by(TrancheRow.entry_date.asc(), TrancheRow.id.asc())
-            ).scalars().all()
-        result: List[Tranche] = []
-        for row in rows:
-            tranche = Tranche(
-                investor_id=row.investor_id,
-                tranche_id=row.tranche_id,
-                entry_date=row.entry_date,
-                entry_nav=row.entry_nav,
-                units=row.units,
-                hwm=row.hwm,
-                original_entry_date=row.original_entry_date,
-                original_entry_nav=row.original_entry_nav,
-                cumulative_fees_paid=row.cumulative_fees_paid,
-                original_invested_value=row.original_invested_value,
-            )
-            tranche.invested_value = row.invested_value
-            result.append(tranche)
-        return result
+        table = TrancheRow.__table__
+        statement = select(*(table.c[name] for name in _TRANCHE_COLUMNS)).order_by(
+            table.c.entry_date.asc(), table.c.id.asc()
+        )
+        return [_tranche_from_row(row) for row in self._stream_rows(statement)]
 
     def load_transactions(self) -> List[Transaction]:
-        with self._session() as session:
-            rows = session.execute(
-                select(TransactionRow).order_by(TransactionRow.date.asc(), TransactionRow.id.asc())
-            ).scalars().all()
-        return [
-            Transaction(
-                id=row.id,
-                investor_id=row.investor_id,
-                date=row.date,
-                type=row.type,
-                amount=row.amount,
-                nav=row.nav,
-                units_change=row.units_change,
-            )
-            for row in rows
-        ]
+        table = TransactionRow.__table__
+        statement = select(*(table.c[name] for name in _TRANSACTION_FIELDS)).order_by(
+            table.c.date.asc(), table.c.id.asc()
+        )
+        return [_transaction_from_row(row) for row in self._stream_rows(statement)]
 
     def load_fee_records(self) -> List[FeeRecord]:
-        with self._session() as session:
-            rows = session.execute(
-                select(FeeRecordRow).order_by(FeeRecordRow.id.asc())
-            ).scalars().all()
-        return [
-            FeeRecord(
-                id=row.id,
-                period=row.period,
-                investor_id=row.investor_id,
-                fee_amount=row.fee_amount,
-                fee_units=row.fee_units,
-                calculation_date=row.calculation_date,
-                units_before=row.units_before,
-                units_after=row.units_after,
-                nav_per_unit=row.nav_per_unit,
-                description=row.description or "",
-            )
-            for row in rows
-        ]
+        table = FeeRecordRow.__table__
+        statement = select(*(table.c[name] for name in _FEE_RECORD_FIELDS)).order_by(table.c.id.asc())
+        return [_fee_record_from_row(row) for row in self._stream_rows(statement)]
+
+    def load_all(self) -> Tuple[List[Investor], List[Tranche], List[Transaction], List[FeeRecord]]:
+        """
+        Load all four entities. On a server database the queries run concurrently,
+        each on its own pooled connection, so their round trips overlap. SQLite is
+        in-process (nothing to overlap) and its per-row GIL hand-offs make threads
+        slower, so it loads serially.
+        """
+        loaders = (self.load_investors, self.load_tranches, self.load_transactions, self.load_fee_records)
+        # Allocating ~100k+ acyclic dataclasses triggers repeated full GC passes; skip them.
+        with _gc_paused():
+            if self.engine.dialect.name == "sqlite":
+                investors, tranches, transactions, fee_records = (loader() for loader in loaders)
+                return investors, tranches, transactions, fee_records
+            with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+                futures = [executor.submit(loader) for loader in loaders]
+                investors, tranches, transactions, fee_records = (future.result() for future in futures)
+            return investors, tranches, transactions, fee_records
+
+    def load_nav_daily(self) -> List[DailyNavPoint]:
+        table = NavDailyRow.__table__
+        statement = select(table.c.day, table.c.total_nav, table.c.total_units, table.c.price_per_unit).order_by(
+            table.c.day.asc()
+        )
+        return [DailyNavPoint(*row) for row in self._stream_rows(statement)]
+
+    def replace_nav_daily(self, points: List[DailyNavPoint]) -> bool:
+        """Rewrite the whole daily series (backfill of derived data; no generation bump)."""
+        table = NavDailyRow.__table__
+        try:
+            with self._lock:
+                with self.engine.begin() as conn:
+                    conn.execute(table.delete())
+                    if points:
+                        conn.execute(table.insert(), [_nav_daily_row(point) for point in points])
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _write_nav_daily(conn, from_day: Optional[date], points: List[DailyNavPoint]) -> None:
+        """Make rows with day >= ``from_day`` equal ``points``: update kept days, insert new, delete gone."""
+        table = NavDailyRow.__table__
+        statement = select(table.c.day)
+        if from_day is not None:
+            statement = statement.where(table.c.day >= from_day)
+        existing = set(conn.execute(statement).scalars())
+        wanted = {point.day for point in points}
+
+        stale = sorted(existing - wanted)
+        for start in range(0, len(stale), _DELETE_CHUNK_SIZE):
+            conn.execute(table.delete().where(table.c.day.in_(stale[start : start + _DELETE_CHUNK_SIZE])))
+        updated = [dict(_nav_daily_row(point), match_day=point.day) for point in points if point.day in existing]
+        if updated:
+            conn.execute(table.update().where(table.c.day == bindparam("match_day")), updated)
+        inserted = [_nav_daily_row(point) for point in points if point.day not in existing]
+        if inserted:
+            conn.execute(table.insert(), inserted)
 
     def load_fee_global_config(self) -> Dict[str, Any]:
         with self._session() as session:
@@ -545,114 +828,121 @@ class PostgresDataHandler:
         tranches: List[Tranche],
         transactions: List[Transaction],
         fee_records: List[FeeRecord],
+        nav_points: Optional[List[DailyNavPoint]] = None,
     ) -> bool:
+        """
+        Full rewrite: replace every fund_* table in one transaction (restore / bootstrap / fallback).
+
+        On PostgreSQL rows are streamed with COPY FROM STDIN into temp staging tables
+        and swapped into fund_*; other dialects (SQLite in tests) use executemany.
+        The daily NAV series is rewritten too (built from ``transactions`` when
+        ``nav_points`` is not given).
+        """
+        self.last_generation_bump = None
+        if nav_points is None:
+            nav_points = build_points(transactions)
+        payload = [
+            (InvestorRow.__table__, [_investor_row(inv) for inv in investors]),
+            (TrancheRow.__table__, [_tranche_row(t) for t in tranches]),
+            (TransactionRow.__table__, [_transaction_row(tx) for tx in transactions]),
+            (FeeRecordRow.__table__, [_fee_record_row(fr) for fr in fee_records]),
+            (NavDailyRow.__table__, [_nav_daily_row(point) for point in nav_points]),
+        ]
         try:
             with self._lock:
                 with self.engine.begin() as conn:
-                    conn.execute(text("DELETE FROM fund_fee_records"))
-                    conn.execute(text("DELETE FROM fund_transactions"))
-                    conn.execute(text("DELETE FROM fund_tranches"))
-                    conn.execute(text("DELETE FROM fund_investors"))
-
-                    if investors:
-                        conn.execute(
-                            InvestorRow.__table__.insert(),
-                            [
-                                {
-                                    "id": safe_int_conversion(inv.id),
-                                    "name": str(inv.name).strip(),
-                                    "phone": str(getattr(inv, "phone", "") or "").strip(),
-                                    "address": str(getattr(inv, "address", "") or "").strip(),
-                                    "province_code": str(getattr(inv, "province_code", "") or "").strip(),
-                                    "province_name": str(getattr(inv, "province_name", "") or "").strip(),
-                                    "ward_code": str(getattr(inv, "ward_code", "") or "").strip(),
-                                    "ward_name": str(getattr(inv, "ward_name", "") or "").strip(),
-                                    "address_line": str(getattr(inv, "address_line", "") or "").strip(),
-                                    "email": str(getattr(inv, "email", "") or "").strip(),
-                                    "join_date": _as_date(getattr(inv, "join_date", None)),
-                                    "is_fund_manager": bool(getattr(inv, "is_fund_manager", False)),
-                                }
-                                for inv in investors
-                            ],
-                        )
-
-                    if tranches:
-                        conn.execute(
-                            TrancheRow.__table__.insert(),
-                            [
-                                {
-                                    "investor_id": safe_int_conversion(t.investor_id),
-                                    "tranche_id": str(t.tranche_id),
-                                    "entry_date": _as_datetime(t.entry_date),
-                                    "entry_nav": safe_float_conversion(t.entry_nav),
-                                    "units": safe_float_conversion(t.units),
-                                    "hwm": safe_float_conversion(getattr(t, "hwm", t.entry_nav)),
-                                    "original_entry_date": _as_datetime(
-                                        getattr(t, "original_entry_date", t.entry_date)
-                                    ),
-                                    "original_entry_nav": safe_float_conversion(
-                                        getattr(t, "original_entry_nav", t.entry_nav)
-                                    ),
-                                    "cumulative_fees_paid": safe_float_conversion(
-                                        getattr(t, "cumulative_fees_paid", 0.0)
-                                    ),
-                                    "original_invested_value": safe_float_conversion(
-                                        getattr(
-                                            t,
-                                            "original_invested_value",
-                                            safe_float_conversion(t.units)
-                                            * safe_float_conversion(t.entry_nav),
-                                        )
-                                    ),
-                                    "invested_value": safe_float_conversion(
-                                        getattr(
-                                            t,
-                                            "invested_value",
-                                            safe_float_conversion(t.units)
-                                            * safe_float_conversion(t.entry_nav),
-                                        )
-                                    ),
-                                }
-                                for t in tranches
-                            ],
-                        )
-
-                    if transactions:
-                        conn.execute(
-                            TransactionRow.__table__.insert(),
-                            [
-                                {
-                                    "id": safe_int_conversion(tx.id),
-                                    "investor_id": safe_int_conversion(tx.investor_id),
-                                    "date": _as_datetime(tx.date),
-                                    "type": str(tx.type),
-                                    "amount": safe_float_conversion(tx.amount),
-                                    "nav": safe_float_conversion(tx.nav),
-                                    "units_change": safe_float_conversion(tx.units_change),
-                                }
-                                for tx in transactions
-                            ],
-                        )
-
-                    if fee_records:
-                        conn.execute(
-                            FeeRecordRow.__table__.insert(),
-                            [
-                                {
-                                    "id": safe_int_conversion(fr.id),
-                                    "period": str(fr.period),
-                                    "investor_id": safe_int_conversion(fr.investor_id),
-                                    "fee_amount": safe_float_conversion(fr.fee_amount),
-                                    "fee_units": safe_float_conversion(fr.fee_units),
-                                    "calculation_date": _as_datetime(fr.calculation_date),
-                                    "units_before": safe_float_conversion(fr.units_before),
-                                    "units_after": safe_float_conversion(fr.units_after),
-                                    "nav_per_unit": safe_float_conversion(fr.nav_per_unit),
-                                    "description": str(getattr(fr, "description", "") or ""),
-                                }
-                                for fr in fee_records
-                            ],
-                        )
+                    if self.engine.dialect.name == "postgresql":
+                        cursor = conn.connection.dbapi_connection.cursor()
+                        try:
+                            self._copy_replace_tables(cursor, payload)
+                        finally:
+                            cursor.close()
+                    else:
+                        for table, _rows in reversed(payload):
+                            conn.execute(table.delete())
+                        for table, rows in payload:
+                            if rows:
+                                conn.execute(table.insert(), rows)
+                    self._bump_generation(conn)
+
+            self.connected = True
+            return True
+        except Exception:
+            self.connected = False
+            return False
+
+    @staticmethod
+    def _copy_replace_tables(cursor, payload: List[Tuple[Any, List[Dict[str, Any]]]]) -> None:
+        """Stage each table's rows with COPY, then swap them into fund_* (caller owns the transaction)."""
+        staged = []
+        for table, rows in payload:
+            stage_name = f"stage_{table.name}"
+            cursor.execute(
+                f"CREATE TEMP TABLE {stage_name} (LIKE {table.name} INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            if rows:
+                columns = list(rows[0])
+                column_sql = ", ".join(columns)
+                _copy_from_buffer(
+                    cursor,
+                    f"COPY {stage_name} ({column_sql}) FROM STDIN WITH (FORMAT csv)",
+                    _rows_to_csv(rows, columns),
+                )
+                staged.append((table.name, stage_name, column_sql))
+
+        for table, _rows in reversed(payload):
+            cursor.execute(f"DELETE FROM {table.name}")
+        for table_name, stage_name, column_sql in staged:
+            cursor.execute(f"INSERT INTO {table_name} ({column_sql}) SELECT {column_sql} FROM {stage_name}")
+
+    def save_changes_enhanced(
+        self,
+        changes: Dict[str, Dict[str, list]],
+        nav_update: Optional[Tuple[Optional[date], List[DailyNavPoint]]] = None,
+    ) -> bool:
+        """
+        Delta save: apply only inserted/updated/deleted rows in a single transaction.
+
+        ``changes`` maps an entity name ("investors", "tranches", "transactions",
+        "fee_records") to ``{"inserted": [obj], "updated": [obj], "deleted": [key]}``.
+        Tranches are keyed by ``tranche_id``, every other entity by ``id``.
+        ``nav_update`` is ``(from_day, points)``: daily NAV rows from ``from_day`` on
+        (every row when None) are replaced by ``points`` in the same transaction.
+        """
+        self.last_generation_bump = None
+        if not any(
+            bucket.get("inserted") or bucket.get("updated") or bucket.get("deleted")
+            for bucket in (changes or {}).values()
+        ):
+            return True
+
+        try:
+            with self._lock:
+                with self.engine.begin() as conn:
+                    for entity, (table, key_name, to_row) in _ENTITY_TABLES.items():
+                        bucket = changes.get(entity) or {}
+                        key_column = table.c[key_name]
+
+                        deleted = list(bucket.get("deleted") or [])
+                        for start in range(0, len(deleted), _DELETE_CHUNK_SIZE):
+                            chunk = deleted[start : start + _DELETE_CHUNK_SIZE]
+                            conn.execute(table.delete().where(key_column.in_(chunk)))
+
+                        updated = [to_row(obj) for obj in bucket.get("updated") or []]
+                        if updated:
+                            for row in updated:
+                                row["match_key"] = row[key_name]
+                            conn.execute(
+                                table.update().where(key_column == bindparam("match_key")),
+                                updated,
+                            )
+
+                        inserted = [to_row(obj) for obj in bucket.get("inserted") or []]
+                        if inserted:
+                            conn.execute(table.insert(), inserted)
+                    if nav_update is not None:
+                        self._write_nav_daily(conn, *nav_update)
+                    self._bump_generation(conn)
 
             self.connected = True
             return True
@@ -665,6 +955,7 @@ class PostgresDataHandler:
         global_config: Dict[str, Any],
         investor_overrides: Dict[int, Dict[str, Any]],
     ) -> bool:
+        self.last_generation_bump = None
         try:
             now = datetime.now(timezone.utc).replace(tzinfo=None)
             with self._lock:
@@ -706,6 +997,7 @@ class PostgresDataHandler:
                                 }
                             )
                         conn.execute(FeeInvestorOverrideRow.__table__.insert(), rows)
+                    self._bump_generation(conn)
             self.connected = True
             return True
         except Exception:
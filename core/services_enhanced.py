@@ -4,6 +4,12 @@ from datetime import datetime, date, timezone
 from typing import List, Tuple, Optional, Dict, Any
 from config import HURDLE_RATE_ANNUAL, PERFORMANCE_FEE_RATE, DEFAULT_UNIT_PRICE, EPSILON
 from .models import Investor, Tranche, Transaction, FeeRecord
+from .fee_engine import compute_tranche_fees
+from .fund_aggregates import FundAggregates
+from .investor_index import InvestorIndex
+from .nav_series import DailyNavSeries, as_day, transaction_day
+from .nav_timeline import NavTimeline
+from .unit_of_work import UnitOfWork, summarize_changes
 import logging # Sử dụng logging chuyên nghiệp hơn
 
 # Thiết lập logging (có thể đặt ở đầu file)
@@ -23,7 +29,25 @@ class EnhancedFundManager:
         self.fee_records: List[FeeRecord] = []
         self.fee_global_config: Dict[str, Any] = self._default_fee_config()
         self.fee_investor_overrides: Dict[int, Dict[str, Any]] = {}
+        # Bảng phí hiệu lực theo NĐT, dựng lại khi load / cập nhật cấu hình phí
+        self._fee_config_table: Optional[Tuple[Any, ...]] = None
         self._operation_backups: List[Dict[str, Any]] = []
+        # Theo dõi thay đổi so với lần load/save gần nhất (chưa có baseline = ghi toàn bộ)
+        self.unit_of_work = UnitOfWork()
+        self.last_saved_changes: Dict[str, Dict[str, List[Any]]] = {}
+        # Generation của dữ liệu trong DB mà bộ nhớ đang phản ánh (None = không rõ, cần reload)
+        self.data_generation: Optional[int] = None
+        self._persisted_fee_config: Optional[Tuple[Dict[str, Any], Dict[int, Dict[str, Any]]]] = None
+        # Chỉ mục theo investor id (dựng lại khi danh sách bị thay ngoài các hàm tracking)
+        self.investor_index = InvestorIndex()
+        # Giao dịch có NAV theo thứ tự thời gian (latest O(1), tra theo ngày bằng bisect)
+        self.nav_timeline = NavTimeline()
+        # Tổng units / phí đã trả toàn quỹ và theo NĐT (price-per-unit O(1))
+        self.aggregates = FundAggregates()
+        # Chuỗi NAV / units / giá theo ngày đã lưu (bảng fund_nav_daily); chỉ thay mới khi save
+        self.nav_series = DailyNavSeries()
+        # True khi nav_series được dựng lại lúc load nhưng chưa ghi xuống (ghi ở lần save sau)
+        self._nav_series_unsaved = False
         
         # Backup handled by APIBackupFlow (integrated via legacy UI)
         if enable_snapshots:
@@ -46,11 +70,20 @@ class EnhancedFundManager:
         if not (self.data_handler and getattr(self.data_handler, "connected", False)):
             print("ERROR: Cannot load data: No database connection.")
             return
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            self.investors = executor.submit(self.data_handler.load_investors).result()
-            self.tranches = executor.submit(self.data_handler.load_tranches).result()
-            self.transactions = executor.submit(self.data_handler.load_transactions).result()
-            self.fee_records = executor.submit(self.data_handler.load_fee_records).result()
+        # Đọc generation TRƯỚC khi load: nếu có ghi xen giữa thì lần kiểm tra sau sẽ reload lại.
+        if hasattr(self.data_handler, "get_data_generation"):
+            self.data_generation = self.data_handler.get_data_generation()
+        if hasattr(self.data_handler, "load_all"):
+            self.investors, self.tranches, self.transactions, self.fee_records = self.data_handler.load_all()
+        else:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(self.data_handler.load_investors),
+                    executor.submit(self.data_handler.load_tranches),
+                    executor.submit(self.data_handler.load_transactions),
+                    executor.submit(self.data_handler.load_fee_records),
+                ]
+                self.investors, self.tranches, self.transactions, self.fee_records = [f.result() for f in futures]
         if hasattr(self.data_handler, "load_fee_global_config"):
             loaded_global = self.data_handler.load_fee_global_config() or {}
             self.fee_global_config = self._normalize_global_fee_config(loaded_global)
@@ -61,20 +94,205 @@ class EnhancedFundManager:
             self.fee_investor_overrides = self._normalize_fee_overrides(loaded_overrides)
         else:
             self.fee_investor_overrides = {}
-
-    def save_data(self) -> bool:
-        success = self.data_handler.save_all_data_enhanced(
-            self.investors, self.tranches, self.transactions, self.fee_records
+        self._rebuild_fee_config_table()
+        self.investor_index.invalidate()
+        self.nav_timeline.invalidate()
+        self.aggregates.invalidate()
+        self._load_nav_series()
+        self.unit_of_work.commit(self)
+        self._persisted_fee_config = (
+            cp.deepcopy(self.fee_global_config),
+            cp.deepcopy(self.fee_investor_overrides),
         )
+
+    def save_data(self, full_rewrite: bool = False) -> bool:
+        """
+        Lưu dữ liệu xuống handler.
+
+        Mặc định chỉ ghi phần thay đổi (insert/update/delete) so với lần load/save
+        gần nhất. ``full_rewrite=True`` ghi lại toàn bộ bảng (dùng cho restore).
+        """
+        changes = self.unit_of_work.collect_changes(self)
+        if not full_rewrite and changes is not None and hasattr(self.data_handler, "save_changes_enhanced"):
+            if self._nav_series_unsaved and hasattr(self.data_handler, "replace_nav_daily"):
+                # Chuỗi dựng lại lúc load khớp baseline; ghi bù trước, phần delta ghi tiếp bên dưới
+                if not self.data_handler.replace_nav_daily(self.nav_series.points):
+                    return False
+                self._nav_series_unsaved = False
+            nav_series, nav_update = self._updated_nav_series(changes)
+            if nav_update is None:
+                success = self.data_handler.save_changes_enhanced(changes)
+            else:
+                success = self.data_handler.save_changes_enhanced(changes, nav_update=nav_update)
+        else:
+            nav_series = DailyNavSeries.build(self.transactions)
+            success = self.data_handler.save_all_data_enhanced(
+                self.investors, self.tranches, self.transactions, self.fee_records,
+                nav_points=nav_series.points,
+            )
         if not success:
             return False
+        self.nav_series = nav_series
+        self._nav_series_unsaved = False
+        self._advance_data_generation()
+        self.last_saved_changes = summarize_changes(changes, self.unit_of_work.entity_keys)
+        self.unit_of_work.commit(self, None if full_rewrite else changes)
+
         if hasattr(self.data_handler, "save_fee_config"):
-            return self.data_handler.save_fee_config(
+            fee_config = (
                 self._normalize_global_fee_config(self.fee_global_config),
                 self._normalize_fee_overrides(self.fee_investor_overrides),
             )
+            if full_rewrite or fee_config != self._persisted_fee_config:
+                if not self.data_handler.save_fee_config(*fee_config):
+                    return False
+                self._advance_data_generation()
+                self._persisted_fee_config = cp.deepcopy(fee_config)
         return True
-    
+
+    def _load_nav_series(self) -> None:
+        """
+        Đọc chuỗi NAV theo ngày đã lưu; dựng lại trong bộ nhớ nếu chưa có hoặc lệch ngày cuối.
+
+        Load chạy cả trên đường đọc (refresh của FundRuntime) nên không ghi ở đây: chuỗi
+        dựng lại được ghi bù ở lần ``save_data`` kế tiếp (đường ghi, đã giữ write lock).
+        """
+        points = self.data_handler.load_nav_daily() if hasattr(self.data_handler, "load_nav_daily") else []
+        series = DailyNavSeries(points)
+        # load_all trả transactions theo (date, id) tăng dần
+        last_day = transaction_day(self.transactions[-1]) if self.transactions else None
+        current_last = series.days[-1] if series.days else None
+        if current_last != last_day:
+            series = DailyNavSeries.build(self.transactions)
+        self._nav_series_unsaved = current_last != last_day
+        self.nav_series = series
+
+    def _updated_nav_series(self, changes: Dict[str, Dict[str, list]]):
+        """
+        Chuỗi NAV theo ngày sau ``changes`` và phần cần ghi ``(from_day, points)``.
+
+        Chỉ tính lại từ ngày sớm nhất bị ảnh hưởng (ngày của giao dịch thêm / sửa /
+        xóa, kể cả ngày cũ trước khi sửa); không đổi giao dịch thì không ghi gì.
+        """
+        bucket = changes.get("transactions") or {}
+        affected_days = [transaction_day(tx) for tx in bucket.get("inserted") or []]
+        for tx in bucket.get("updated") or []:
+            affected_days.append(transaction_day(tx))
+            previous = self.unit_of_work.baseline_value("transactions", tx.id, "date")
+            if previous is not None:
+                affected_days.append(as_day(previous))
+        for key in bucket.get("deleted") or []:
+            previous = self.unit_of_work.baseline_value("transactions", key, "date")
+            if previous is not None:
+                affected_days.append(as_day(previous))
+        if not affected_days:
+            return self.nav_series, None
+        first_day = min(affected_days)
+        series, points = self.nav_series.rebuild_from(self.transactions, first_day)
+        return series, (first_day, points)
+
+    def _advance_data_generation(self) -> None:
+        """
+        Cập nhật generation sau một lần ghi. Nếu generation trước khi ghi khác giá trị
+        đang giữ (process khác đã ghi xen vào) thì đánh dấu None để lần đọc sau reload.
+        """
+        bump = getattr(self.data_handler, "last_generation_bump", None)
+        if not bump:
+            return
+        previous, current = bump
+        self.data_generation = current if previous == self.data_generation else None
+
+    def clone(self) -> "EnhancedFundManager":
+        """
+        Bản sao làm việc cho copy-on-write (dùng chung data_handler).
+
+        Investor/Tranche bị sửa tại chỗ nên được copy từng object; Transaction và
+        FeeRecord chỉ được thêm/xóa, không sửa tại chỗ, nên dùng chung object.
+        """
+        other = object.__new__(type(self))
+        other.__dict__.update(self.__dict__)
+        other.investors = [cp.copy(inv) for inv in self.investors]
+        other.tranches = [cp.copy(t) for t in self.tranches]
+        other.transactions = list(self.transactions)
+        other.fee_records = list(self.fee_records)
+        other.fee_global_config = cp.deepcopy(self.fee_global_config)
+        other.fee_investor_overrides = cp.deepcopy(self.fee_investor_overrides)
+        table = self._current_fee_config_table()
+        # Bảng chỉ gồm dict không bị sửa tại chỗ nên dùng chung, chỉ gắn lại với config của bản sao
+        other._fee_config_table = (other.fee_global_config, other.fee_investor_overrides) + table[2:]
+        other._operation_backups = list(self._operation_backups)
+        other.unit_of_work = self.unit_of_work.clone()
+        for entity in ("investors", "tranches"):
+            other.unit_of_work.rebind(entity, getattr(other, entity))
+        other.investor_index = InvestorIndex()
+        # Transaction dùng chung object nên timeline chỉ cần copy danh sách, không dựng lại
+        other.nav_timeline = self.nav_timeline.copy_for(self, other)
+        other.aggregates = self.aggregates.copy_for(self, other)
+        other.last_saved_changes = {}
+        return other
+
+    # ================================
+    # Change tracking
+    # ================================
+    def _sync_indexes(self, entity: str) -> None:
+        self.investor_index.sync(self)
+        if entity == "transactions":
+            self.nav_timeline.sync(self)
+        elif entity == "tranches":
+            self.aggregates.sync(self)
+
+    def _track_new(self, entity: str, obj: Any) -> None:
+        self._sync_indexes(entity)
+        getattr(self, entity).append(obj)
+        self.investor_index.added(self, entity, obj)
+        if entity == "transactions":
+            self.nav_timeline.added(self, obj)
+        elif entity == "tranches":
+            self.aggregates.added(self, obj)
+        self.unit_of_work.register_new(entity, obj)
+
+    def _track_modified(self, entity: str, obj: Any) -> None:
+        if entity == "tranches":
+            self.aggregates.modified(self, obj)
+        self.unit_of_work.register_modified(entity, obj)
+
+    def _track_removed(self, entity: str, obj: Any) -> None:
+        self._sync_indexes(entity)
+        getattr(self, entity).remove(obj)
+        self.investor_index.removed(self, entity, [obj])
+        if entity == "transactions":
+            self.nav_timeline.removed(self, [obj])
+        elif entity == "tranches":
+            self.aggregates.removed(self, [obj])
+        self.unit_of_work.register_removed(entity, obj)
+
+    def _remove_where(self, entity: str, predicate) -> List[Any]:
+        """Xóa (tại chỗ) các phần tử thỏa predicate và ghi nhận chúng là removed."""
+        self._sync_indexes(entity)
+        items = getattr(self, entity)
+        kept, removed = [], []
+        for obj in items:
+            (removed if predicate(obj) else kept).append(obj)
+        if removed:
+            items[:] = kept
+            self.investor_index.removed(self, entity, removed)
+            if entity == "transactions":
+                self.nav_timeline.removed(self, removed)
+            elif entity == "tranches":
+                self.aggregates.removed(self, removed)
+            for obj in removed:
+                self.unit_of_work.register_removed(entity, obj)
+        return removed
+
+    def _restore_entities(self, snapshot: Dict[str, List[Any]], checkpoint) -> None:
+        """Khôi phục danh sách từ snapshot (deepcopy) khi một thao tác bị rollback."""
+        for entity, items in snapshot.items():
+            getattr(self, entity)[:] = items
+        self.investor_index.invalidate()
+        self.nav_timeline.invalidate()
+        self.aggregates.invalidate()
+        self.unit_of_work.restore(checkpoint)
+
     def _auto_backup_if_enabled(self, operation_type: str, description: str = None):
         """
         ULTRA OPTIMIZED: Deferred backup - maximum UI responsiveness
@@ -96,6 +314,7 @@ class EnhancedFundManager:
                 id=0, name="Fund Manager", is_fund_manager=True, join_date=date.today()
             )
             self.investors.insert(0, fund_manager)
+            self.unit_of_work.register_new("investors", fund_manager)
 
     def get_fund_manager(self) -> Optional[Investor]:
         return next((inv for inv in self.investors if inv.is_fund_manager), None)
@@ -119,7 +338,7 @@ class EnhancedFundManager:
         return options
 
     def get_investor_by_id(self, investor_id: int) -> Optional[Investor]:
-        return next((inv for inv in self.investors if inv.id == investor_id), None)
+        return self.investor_index.investor(self, investor_id)
 
     def _default_fee_config(self) -> Dict[str, Any]:
         return {
@@ -179,35 +398,57 @@ class EnhancedFundManager:
             }
         return normalized
 
-    def resolve_fee_config_for_investor(self, investor_id: int) -> Dict[str, Any]:
+    def _rebuild_fee_config_table(self) -> None:
+        """
+        Chuẩn hóa cấu hình phí một lần và dựng bảng tỷ lệ hiệu lực theo nhà đầu tư.
+
+        Chỉ gọi từ load_data và các hàm cập nhật cấu hình phí; nếu fee_global_config /
+        fee_investor_overrides bị gán lại từ bên ngoài (restore) thì bảng tự dựng lại khi đọc.
+        """
         global_config = self._normalize_global_fee_config(self.fee_global_config)
-        override = self._normalize_fee_overrides(self.fee_investor_overrides).get(int(investor_id))
-        if override and (
-            override.get("performance_fee_rate") is not None
-            or override.get("hurdle_rate_annual") is not None
-        ):
-            return {
-                "performance_fee_rate": (
-                    override.get("performance_fee_rate")
-                    if override.get("performance_fee_rate") is not None
-                    else global_config["performance_fee_rate"]
-                ),
-                "hurdle_rate_annual": (
-                    override.get("hurdle_rate_annual")
-                    if override.get("hurdle_rate_annual") is not None
-                    else global_config["hurdle_rate_annual"]
-                ),
-                "fee_source": "override",
-            }
-        return {
+        overrides = self._normalize_fee_overrides(self.fee_investor_overrides)
+        global_resolved = {
             "performance_fee_rate": global_config["performance_fee_rate"],
             "hurdle_rate_annual": global_config["hurdle_rate_annual"],
             "fee_source": "global",
         }
+        resolved: Dict[int, Dict[str, Any]] = {}
+        for investor_id, override in overrides.items():
+            perf_value = override.get("performance_fee_rate")
+            hurdle_value = override.get("hurdle_rate_annual")
+            if perf_value is None and hurdle_value is None:
+                continue
+            resolved[investor_id] = {
+                "performance_fee_rate": perf_value if perf_value is not None else global_config["performance_fee_rate"],
+                "hurdle_rate_annual": hurdle_value if hurdle_value is not None else global_config["hurdle_rate_annual"],
+                "fee_source": "override",
+            }
+        self._fee_config_table = (
+            self.fee_global_config,
+            self.fee_investor_overrides,
+            global_config,
+            overrides,
+            global_resolved,
+            resolved,
+        )
+
+    def _current_fee_config_table(self) -> Tuple[Any, ...]:
+        table = self._fee_config_table
+        if (
+            table is None
+            or table[0] is not self.fee_global_config
+            or table[1] is not self.fee_investor_overrides
+        ):
+            self._rebuild_fee_config_table()
+            table = self._fee_config_table
+        return table
+
+    def resolve_fee_config_for_investor(self, investor_id: int) -> Dict[str, Any]:
+        _, _, _, _, global_resolved, resolved = self._current_fee_config_table()
+        return dict(resolved.get(int(investor_id), global_resolved))
 
     def get_fee_config_bundle(self) -> Dict[str, Any]:
-        global_config = self._normalize_global_fee_config(self.fee_global_config)
-        overrides = self._normalize_fee_overrides(self.fee_investor_overrides)
+        _, _, global_config, overrides, _, _ = self._current_fee_config_table()
         rows = [
             {
                 "investor_id": investor_id,
@@ -217,7 +458,7 @@ class EnhancedFundManager:
             }
             for investor_id, row in sorted(overrides.items(), key=lambda item: item[0])
         ]
-        return {"global_config": global_config, "overrides": rows}
+        return {"global_config": dict(global_config), "overrides": rows}
 
     def get_fee_config_snapshot(self) -> Dict[str, Any]:
         bundle = self.get_fee_config_bundle()
@@ -264,6 +505,7 @@ class EnhancedFundManager:
             "updated_at": datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
         }
         self.fee_global_config = next_config
+        self._rebuild_fee_config_table()
         return next_config
 
     def upsert_investor_fee_override(
@@ -290,6 +532,7 @@ class EnhancedFundManager:
         }
         normalized[int(investor_id)] = updated
         self.fee_investor_overrides = normalized
+        self._rebuild_fee_config_table()
         return {
             "investor_id": int(investor_id),
             "performance_fee_rate": updated["performance_fee_rate"],
@@ -301,6 +544,7 @@ class EnhancedFundManager:
         normalized = self._normalize_fee_overrides(self.fee_investor_overrides)
         removed = normalized.pop(int(investor_id), None)
         self.fee_investor_overrides = normalized
+        self._rebuild_fee_config_table()
         return removed is not None
 
     # ================================
@@ -336,7 +580,7 @@ class EnhancedFundManager:
             email=email.strip(),
             is_fund_manager=False,
         )
-        self.investors.append(investor)
+        self._track_new("investors", investor)
         
         # Auto-backup after adding investor
         self._auto_backup_if_enabled("ADD_INVESTOR", f"Added investor: {investor.display_name}")
@@ -347,16 +591,19 @@ class EnhancedFundManager:
     # Portfolio helpers (per investor)
     # ================================
     def get_investor_tranches(self, investor_id: int) -> List[Tranche]:
-        return [t for t in self.tranches if t.investor_id == investor_id]
+        return self.investor_index.rows(self, "tranches", investor_id)
+
+    def get_investor_transactions(self, investor_id: int) -> List[Transaction]:
+        return self.investor_index.rows(self, "transactions", investor_id)
 
     def get_investor_units(self, investor_id: int) -> float:
-        return sum(t.units for t in self.get_investor_tranches(investor_id))
+        return self.aggregates.investor_units(self, investor_id)
 
     def get_investor_original_investment(self, investor_id: int) -> float:
         deposits = sum(
             t.amount
-            for t in self.transactions
-            if t.investor_id == investor_id and t.type == "Nạp" and t.amount > 0
+            for t in self.get_investor_transactions(investor_id)
+            if t.type == "Nạp" and t.amount > 0
         )
         if deposits > EPSILON:
             return deposits
@@ -374,14 +621,20 @@ class EnhancedFundManager:
         return total
 
     def get_investor_fees_paid(self, investor_id: int) -> float:
-        return sum(getattr(t, "cumulative_fees_paid", 0.0) for t in self.get_investor_tranches(investor_id))
+        return self.aggregates.investor_fees_paid(self, investor_id)
+
+    def get_total_units(self) -> float:
+        return self.aggregates.total_units(self)
+
+    def get_total_fees_paid(self) -> float:
+        return self.aggregates.total_fees_paid(self)
 
     def get_investor_balance(self, investor_id: int, total_nav: float) -> Tuple[float, float, float]:
         tranches = self.get_investor_tranches(investor_id)
         if not tranches or total_nav <= 0:
             return 0.0, 0.0, 0.0
         price_per_unit = self.calculate_price_per_unit(total_nav)
-        balance = sum(t.units for t in tranches) * price_per_unit
+        balance = self.get_investor_units(investor_id) * price_per_unit
         invested_value = sum(getattr(t, "invested_value", t.units * t.entry_nav) for t in tranches)
         profit = balance - invested_value
         profit_perc = (profit / invested_value) if invested_value > 0 else 0.0
@@ -413,7 +666,7 @@ class EnhancedFundManager:
     def calculate_price_per_unit(self, total_nav: float) -> float:
         if not self.tranches:
             return DEFAULT_UNIT_PRICE
-        total_units = sum(t.units for t in self.tranches)
+        total_units = self.get_total_units()
         if total_units <= EPSILON:
             return DEFAULT_UNIT_PRICE
         if total_nav == 0:
@@ -422,10 +675,6 @@ class EnhancedFundManager:
             return DEFAULT_UNIT_PRICE
         return total_nav / total_units
 
-    def _sort_transaction_datetime(self, transaction: Transaction) -> datetime:
-        """Normalize transaction datetime for deterministic sorting/comparison."""
-        return TimezoneManager.normalize_for_display(transaction.date)
-
     def get_latest_total_nav(self, include_zero_nav: bool = True) -> Optional[float]:
         """
         Get the latest Total NAV from the most recent transaction (any type).
@@ -434,74 +683,30 @@ class EnhancedFundManager:
         regardless of transaction type (NAV Update, Nạp, Rút, etc.).
         This ensures we always use the most up-to-date NAV value.
         """
-        if not self.transactions:
-            return None
-
-        nav_transactions = [
-            t for t in self.transactions
-            if t.nav is not None and (t.nav >= 0 if include_zero_nav else t.nav > 0)
-        ]
-        if not nav_transactions:
-            return None
-
-        sorted_transactions = sorted(
-            nav_transactions,
-            key=lambda tx: (self._sort_transaction_datetime(tx), tx.id),
-            reverse=True,
-        )
-        latest_transaction = sorted_transactions[0]
-
-        # Debug: Show which transaction was used for NAV
-        tx_date = self._sort_transaction_datetime(latest_transaction)
-        print(f"📊 Latest NAV: {latest_transaction.nav:,.0f} from transaction:")
-        print(f"   Type: {latest_transaction.type}")
-        print(f"   Date: {tx_date}")
-        print(f"   ID: {latest_transaction.id}")
-
-        return latest_transaction.nav
+        latest_transaction = self.nav_timeline.latest(self, include_zero_nav)
+        return latest_transaction.nav if latest_transaction is not None else None
 
     def get_nav_for_date(self, target_date, include_zero_nav: bool = True) -> Optional[float]:
         """Get NAV for a specific date (most recent NAV on or before that date)"""
-        if not self.transactions:
-            return None
-
         if isinstance(target_date, datetime):
             target_dt = target_date
         else:
             target_dt = datetime.combine(target_date, datetime.max.time())
         target_dt = TimezoneManager.normalize_for_display(target_dt)
 
-        nav_transactions = [
-            t for t in self.transactions
-            if t.nav is not None and (t.nav >= 0 if include_zero_nav else t.nav > 0)
-        ]
-        relevant_transactions = [
-            t for t in nav_transactions
-            if self._sort_transaction_datetime(t) <= target_dt
-        ]
-
-        if not relevant_transactions:
-            return None
+        selected = self.nav_timeline.as_of(self, target_dt, include_zero_nav)
+        return selected.nav if selected is not None else None
 
-        sorted_transactions = sorted(
-            relevant_transactions,
-            key=lambda tx: (self._sort_transaction_datetime(tx), tx.id),
-            reverse=True,
-        )
-        selected = sorted_transactions[0]
+    def get_nav_series(self, start_date: Optional[date] = None, end_date: Optional[date] = None):
+        """Các điểm NAV / units / giá theo ngày trong [start_date, end_date] (đã lưu, không replay giao dịch)."""
+        return self.nav_series.between(start_date, end_date)
 
-        print(
-            f"🎯 get_nav_for_date({target_date}): "
-            f"Using transaction ID:{selected.id}, Date:{selected.date}, NAV:{selected.nav}"
-        )
-        return selected.nav
+    def get_period_return(self, start_date: Optional[date] = None, end_date: Optional[date] = None) -> float:
+        """Tăng trưởng giá mỗi unit trong kỳ, đọc từ chuỗi NAV theo ngày."""
+        return self.nav_series.period_return(start_date, end_date)
 
     def get_nav_history(self) -> List[Dict[str, Any]]:
         """Compatibility helper for UI pages that need NAV timeline data."""
-        nav_transactions = [
-            t for t in self.transactions if t.nav is not None and t.nav >= 0
-        ]
-        nav_transactions.sort(key=lambda tx: (self._sort_transaction_datetime(tx), tx.id))
         return [
             {
                 "id": t.id,
@@ -509,7 +714,7 @@ class EnhancedFundManager:
                 "type": t.type,
                 "nav": t.nav,
             }
-            for t in nav_transactions
+            for t in self.nav_timeline.transactions(self)
         ]
 
     # ================================
@@ -541,7 +746,7 @@ class EnhancedFundManager:
         )
         
         # OPTIMIZED: Remove excessive verification logging
-        self.transactions.append(transaction)
+        self._track_new("transactions", transaction)
 
     def process_deposit(
         self, investor_id: int, amount: float, total_nav_after: float, trans_date: datetime
@@ -577,7 +782,7 @@ class EnhancedFundManager:
         # cập nhật invested_value hiện tại
         tranche.invested_value = tranche.units * tranche.entry_nav
 
-        self.tranches.append(tranche)
+        self._track_new("tranches", tranche)
         self._add_transaction(investor_id, trans_date, "Nạp", amount, round(total_nav_after, 2), units)
         
         # Auto-backup after deposit transaction
@@ -592,7 +797,7 @@ class EnhancedFundManager:
         Giảm units khi rút: full thì xóa hết, partial thì giảm theo tỷ lệ, giữ nguyên original_*.
         """
         if is_full:
-            self.tranches = [t for t in self.tranches if t.investor_id != investor_id]
+            self._remove_where("tranches", lambda t: t.investor_id == investor_id)
         else:
             tranches = self.get_investor_tranches(investor_id)
             total_units = sum(t.units for t in tranches)
@@ -602,7 +807,8 @@ class EnhancedFundManager:
                     if tranche.investor_id == investor_id:
                         tranche.units *= (1 - reduction_ratio)
                         tranche.invested_value = tranche.units * tranche.entry_nav
-            self.tranches = [t for t in self.tranches if t.units >= EPSILON]
+                        self._track_modified("tranches", tranche)
+            self._remove_where("tranches", lambda t: t.units < EPSILON)
         return True
 
     # +++++ THAY THẾ TOÀN BỘ HÀM process_withdrawal BẰNG PHIÊN BẢN HOÀN THIỆN NÀY +++++
@@ -627,7 +833,7 @@ class EnhancedFundManager:
         tranches = self.get_investor_tranches(investor_id)
         if not tranches: return False, "Nhà đầu tư không có vốn."
         
-        balance = sum(t.units for t in tranches) * current_price
+        balance = self.get_investor_units(investor_id) * current_price
 
         # 2. Tính toán phí và số dư thực nhận
         fee_info = self.calculate_investor_fee(investor_id, trans_date, old_total_nav)
@@ -674,7 +880,7 @@ class EnhancedFundManager:
             self._add_transaction(
                 investor_id, trans_date, "Phí", -performance_fee, authoritative_nav_after, -fee_units
             )
-            self.fee_records.append(FeeRecord(
+            self._track_new("fee_records", FeeRecord(
                 id=(max((fr.id for fr in self.fee_records), default=0) + 1),
                 period=f"Withdrawal {trans_date.strftime('%Y-%m-%d')}", investor_id=investor_id,
                 fee_amount=performance_fee, fee_units=fee_units, calculation_date=trans_date,
@@ -691,7 +897,7 @@ class EnhancedFundManager:
 
         # 5. Cập nhật tranches
         if is_full_withdrawal:
-            self.tranches = [t for t in self.tranches if t.investor_id != investor_id]
+            self._remove_where("tranches", lambda t: t.investor_id == investor_id)
             logging.info(f"Investor {investor_id} performed a full withdrawal. All tranches removed.")
         else:
             if performance_fee > EPSILON:
@@ -753,66 +959,66 @@ class EnhancedFundManager:
     def calculate_investor_fee(
         self, investor_id: int, ending_date: datetime, ending_total_nav: float
     ) -> Dict[str, Any]:
-        tranches = self.get_investor_tranches(investor_id)
-        if not tranches or ending_total_nav <= 0:
-            return self._empty_fee_details()
-
-        applied_config = self.resolve_fee_config_for_investor(investor_id)
-        performance_fee_rate = float(applied_config["performance_fee_rate"])
-        hurdle_rate_annual = float(applied_config["hurdle_rate_annual"])
-        fee_source = str(applied_config["fee_source"])
+        return self.calculate_investor_fees([investor_id], ending_date, ending_total_nav)[investor_id]
 
-        current_price = self.calculate_price_per_unit(ending_total_nav)
-        balance = sum(t.units for t in tranches) * current_price
-        invested_value = sum(getattr(t, "invested_value", t.units * t.entry_nav) for t in tranches)
-        profit = balance - invested_value
-        profit_perc = (profit / invested_value) if invested_value > 0 else 0.0
-
-        total_fee = 0.0
-        hurdle_value = 0.0
-        hwm_value = 0.0
-        excess_profit = 0.0
-        units_before = sum(t.units for t in tranches)
+    def calculate_investor_fees(
+        self, investor_ids: List[int], ending_date: datetime, ending_total_nav: float
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Tính chi tiết phí cho nhiều nhà đầu tư trong một lượt (engine NumPy).
 
-        for tranche in tranches:
-            if tranche.units < EPSILON:
+        Kết quả mỗi nhà đầu tư giống hệt ``calculate_investor_fee``.
+        """
+        if not isinstance(ending_date, datetime):
+            ending_date = datetime.combine(ending_date, datetime.min.time())
+        results: Dict[int, Dict[str, Any]] = {}
+        groups = []
+        configs: Dict[int, Dict[str, Any]] = {}
+        for investor_id in investor_ids:
+            tranches = self.get_investor_tranches(investor_id)
+            if not tranches or ending_total_nav <= 0:
+                results[investor_id] = self._empty_fee_details()
                 continue
-            
-            # Sửa đổi: Truyền ending_date vào hàm tính toán
-            tranche_excess_profit = tranche.calculate_excess_profit(
-                current_price,
-                ending_date,
-                hurdle_rate_annual,
-            )
-            hurdle_price = tranche.calculate_hurdle_price(ending_date, hurdle_rate_annual)
-
-            total_fee += performance_fee_rate * tranche_excess_profit
-            hurdle_value += hurdle_price * tranche.units
-            hwm_value += tranche.hwm * tranche.units
-            excess_profit += tranche_excess_profit
-
-        total_fee = round(total_fee, 0)
-        units_to_transfer = (total_fee / current_price) if current_price > 0 else 0.0
-        units_after = units_before - units_to_transfer
+            configs[investor_id] = self.resolve_fee_config_for_investor(investor_id)
+            groups.append((investor_id, tranches, float(configs[investor_id]["hurdle_rate_annual"])))
+        if not groups:
+            return results
 
-        return {
-            "total_fee": total_fee,
-            "fee": total_fee,
-            "balance": round(balance, 2),
-            "invested_value": round(invested_value, 2),
-            "profit": round(profit, 2),
-            "profit_perc": profit_perc,
-            "hurdle_value": round(hurdle_value, 2),
-            "hwm_value": round(hwm_value, 2),
-            "excess_profit": round(excess_profit, 2),
-            "units_before": units_before,
-            "units_after": units_after,
-            "units_to_transfer": units_to_transfer,
-            "current_price": current_price,
-            "applied_performance_fee_rate": performance_fee_rate,
-            "applied_hurdle_rate": hurdle_rate_annual,
-            "fee_source": fee_source,
-        }
+        current_price = self.calculate_price_per_unit(ending_total_nav)
+        batch = compute_tranche_fees(groups, ending_date, current_price)
+        for investor_id, applied_config in configs.items():
+            performance_fee_rate = float(applied_config["performance_fee_rate"])
+            totals = batch.investor_totals(investor_id, performance_fee_rate)
+
+            units_before = totals["units_before"]
+            balance = units_before * current_price
+            invested_value = totals["invested_value"]
+            profit = balance - invested_value
+            profit_perc = (profit / invested_value) if invested_value > 0 else 0.0
+
+            total_fee = round(totals["total_fee"], 0)
+            units_to_transfer = (total_fee / current_price) if current_price > 0 else 0.0
+            units_after = units_before - units_to_transfer
+
+            results[investor_id] = {
+                "total_fee": total_fee,
+                "fee": total_fee,
+                "balance": round(balance, 2),
+                "invested_value": round(invested_value, 2),
+                "profit": round(profit, 2),
+                "profit_perc": profit_perc,
+                "hurdle_value": round(totals["hurdle_value"], 2),
+                "hwm_value": round(totals["hwm_value"], 2),
+                "excess_profit": round(totals["excess_profit"], 2),
+                "units_before": units_before,
+                "units_after": units_after,
+                "units_to_transfer": units_to_transfer,
+                "current_price": current_price,
+                "applied_performance_fee_rate": performance_fee_rate,
+                "applied_hurdle_rate": float(applied_config["hurdle_rate_annual"]),
+                "fee_source": str(applied_config["fee_source"]),
+            }
+        return results
 
     def _apply_fee_to_investor_tranches(
         self, 
@@ -821,6 +1027,11 @@ class EnhancedFundManager:
         fee_date: datetime,
         crystallize: bool
     ) -> bool:
+        # Tranche bị sửa tại chỗ: giữ bản sao để hoàn tác nếu lỗi giữa chừng (không để lại tranche đã trừ một phần)
+        original_state = {
+            "tranches": [cp.deepcopy(t) if t.investor_id == investor_id else t for t in self.tranches]
+        }
+        checkpoint = self.unit_of_work.checkpoint()
         try:
             total_fee = fee_details.get("total_fee", 0.0)
             current_price = fee_details.get("current_price")
@@ -830,35 +1041,27 @@ class EnhancedFundManager:
             if not tranches_original or total_fee <= EPSILON or not current_price:
                 return False
 
-            tranches_with_profit = [
-                t for t in tranches_original 
-                if t.calculate_excess_profit(current_price, fee_date, applied_hurdle_rate) > EPSILON
+            # Excess profit của từng tranche chỉ phụ thuộc chính tranche đó, nên tính một lần trước vòng phân bổ
+            batch = compute_tranche_fees(
+                [(investor_id, tranches_original, applied_hurdle_rate)], fee_date, current_price
+            )
+            profit_by_tranche = [
+                (t, excess) for t, excess in batch.excess_profit_by_tranche(investor_id) if excess > EPSILON
             ]
-            if not tranches_with_profit:
+            if not profit_by_tranche:
                 logging.warning(f"Investor {investor_id} has a total fee but no tranches with excess profit. Skipping fee application.")
                 return False
 
-            total_excess_profit_for_allocation = sum(
-                t.calculate_excess_profit(current_price, fee_date, applied_hurdle_rate)
-                for t in tranches_with_profit
-            )
+            total_excess_profit_for_allocation = sum(excess for _, excess in profit_by_tranche)
             if total_excess_profit_for_allocation < EPSILON: return False
 
-            tranches_copy = cp.deepcopy(tranches_original)
             total_units_to_reduce = round(total_fee / current_price, 8)
             units_reduced_so_far = 0.0
             
-            for i, original_tranche in enumerate(tranches_with_profit):
-                tranche = next(t for t in tranches_copy if t.tranche_id == original_tranche.tranche_id)
-                
-                if i == len(tranches_with_profit) - 1:
+            for i, (tranche, tranche_excess_profit) in enumerate(profit_by_tranche):
+                if i == len(profit_by_tranche) - 1:
                     units_reduction = total_units_to_reduce - units_reduced_so_far
                 else:
-                    tranche_excess_profit = tranche.calculate_excess_profit(
-                        current_price,
-                        fee_date,
-                        applied_hurdle_rate,
-                    )
                     fee_proportion = tranche_excess_profit / total_excess_profit_for_allocation
                     fee_for_this_tranche = total_fee * fee_proportion
                     units_reduction = round(fee_for_this_tranche / current_price, 8)
@@ -879,14 +1082,14 @@ class EnhancedFundManager:
                     tranche.invested_value = tranche.units * current_price
                     tranche.entry_nav = current_price
                     tranche.hwm = current_price
+                self._track_modified("tranches", tranche)
 
-            self.tranches = [t for t in self.tranches if t.investor_id != investor_id]
-            self.tranches.extend(tranches_copy)
-            self.tranches = [t for t in self.tranches if t.units >= EPSILON]
+            self._remove_where("tranches", lambda t: t.units < EPSILON)
             
             return True
         except Exception as e:
             logging.error(f"Error in _apply_fee_to_investor_tranches for investor {investor_id}: {e}", exc_info=True)
+            self._restore_entities(original_state, checkpoint)
             return False
     def _transfer_fee_to_fund_manager(
         self, fee_units: float, current_price: float, fee_date: datetime, total_nav: float, fee_amount: float
@@ -914,7 +1117,7 @@ class EnhancedFundManager:
                 cumulative_fees_paid=0.0,
             )
             fee_tranche.invested_value = fee_tranche.units * fee_tranche.entry_nav
-            self.tranches.append(fee_tranche)
+            self._track_new("tranches", fee_tranche)
 
             # Transaction: Fund Manager receives fee (positive amount)
             self._add_transaction(
@@ -929,9 +1132,17 @@ class EnhancedFundManager:
             return False
 
 
-    def apply_year_end_fees_enhanced(self, fee_date: datetime, total_nav: float) -> Dict[str, Any]:
+    def apply_year_end_fees_enhanced(
+        self,
+        fee_date: datetime,
+        total_nav: float,
+        fee_calculations: Optional[Dict[int, Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
         """
         Tính & áp phí cuối năm, chuyển units phí sang Fund Manager.
+
+        ``fee_calculations``: kết quả ``calculate_investor_fees`` đã tính sẵn cho đúng
+        (fee_date, total_nav) trên dữ liệu hiện tại (ví dụ từ bản preview) để khỏi tính lại.
         """
         try:
             results = {
@@ -953,11 +1164,19 @@ class EnhancedFundManager:
                 return results
 
             current_price = self.calculate_price_per_unit(total_nav)
+            # Tính phí cho mọi nhà đầu tư trong MỘT lượt, trước khi áp dụng cho ai
+            if fee_calculations is None:
+                fee_calculations = self.calculate_investor_fees(
+                    [investor.id for investor in regular_investors], fee_date, total_nav
+                )
+            # Bản sao nông: vòng dưới ghi thêm "current_price" vào từng dict
+            all_fee_calculations = {
+                investor.id: dict(fee_calculations[investor.id]) for investor in regular_investors
+            }
 
             for investor in regular_investors:
                 try:
-                    # Tính toán chi tiết phí MỘT LẦN
-                    fee_calculation = self.calculate_investor_fee(investor.id, fee_date, total_nav)
+                    fee_calculation = all_fee_calculations[investor.id]
                     
                     if fee_calculation["total_fee"] > 1:
                         # Thêm giá vào dictionary để truyền đi
@@ -991,7 +1210,7 @@ class EnhancedFundManager:
                                 nav_per_unit=current_price,
                                 description=f"Performance fee for year {fee_date.year}",
                             )
-                            self.fee_records.append(fee_record)
+                            self._track_new("fee_records", fee_record)
 
                             # Cập nhật kết quả
                             results["total_fees"] += fee_calculation["total_fee"]
@@ -1036,7 +1255,7 @@ class EnhancedFundManager:
         total_wealth = current_value + cash_out
         pnl = total_wealth - cash_in
         """
-        investor_transactions = [t for t in self.transactions if t.investor_id == investor_id]
+        investor_transactions = self.get_investor_transactions(investor_id)
 
         cash_in = sum(t.amount for t in investor_transactions if t.type == "Nạp" and t.amount > 0)
         cash_out = sum(-t.amount for t in investor_transactions if t.type in ["Rút", "Fund Manager Withdrawal"] and t.amount < 0)
@@ -1081,7 +1300,7 @@ class EnhancedFundManager:
                 getattr(t, "original_invested_value", t.units * t.entry_nav)
                 for t in self.get_investor_tranches(investor_id)
             )
-            total_fees_paid = sum(fr.fee_amount for fr in self.fee_records if fr.investor_id == investor_id)
+            total_fees_paid = sum(fr.fee_amount for fr in self.get_fee_history(investor_id))
             current_value = performance["current_value"]
             gross_profit = current_value + total_fees_paid - total_original_invested
             net_profit = current_value - total_original_invested
@@ -1110,7 +1329,7 @@ class EnhancedFundManager:
     def get_fee_history(self, investor_id: Optional[int] = None) -> List[FeeRecord]:
         if investor_id is None:
             return self.fee_records
-        return [record for record in self.fee_records if record.investor_id == investor_id]
+        return self.investor_index.rows(self, "fee_records", investor_id)
 
     # ================================
     # Undo / Delete transactions
@@ -1183,9 +1402,8 @@ class EnhancedFundManager:
 
             # More flexible time window for matching (6 hours instead of 1)
             matching_tranches = [
-                t for t in self.tranches
-                if (t.investor_id == investor_id and 
-                    abs((t.entry_date - deposit_date).total_seconds()) < 21600)  # 6 hours
+                t for t in self.get_investor_tranches(investor_id)
+                if abs((t.entry_date - deposit_date).total_seconds()) < 21600  # 6 hours
             ]
             
             if not matching_tranches:
@@ -1207,8 +1425,8 @@ class EnhancedFundManager:
             remaining_units = self.get_investor_units(investor_id) - tranche_to_remove.units
             print(f"  📊 Investor units after removal: {remaining_units:.6f}")
 
-            self.tranches.remove(tranche_to_remove)
-            self.transactions.remove(original_transaction)
+            self._track_removed("tranches", tranche_to_remove)
+            self._track_removed("transactions", original_transaction)
             
             print(f"  ✅ Removed tranche {tranche_to_remove.tranche_id}")
             return True
@@ -1231,9 +1449,8 @@ class EnhancedFundManager:
 
             # 1. Tìm tất cả các bản ghi liên quan trong bộ nhớ
             fee_txn = next((
-                t for t in self.transactions 
-                if t.investor_id == investor_id and t.type == "Phí" and 
-                abs(safe_total_seconds_between(t.date, trans_date)) < 1
+                t for t in self.get_investor_transactions(investor_id)
+                if t.type == "Phí" and abs(safe_total_seconds_between(t.date, trans_date)) < 1
             ), None)
             
             fm_fee_txns = [
@@ -1242,8 +1459,8 @@ class EnhancedFundManager:
             ]
 
             fee_record_to_undo = next((
-                fr for fr in self.fee_records
-                if fr.investor_id == investor_id and fr.period.startswith("Withdrawal") and 
+                fr for fr in self.get_fee_history(investor_id)
+                if fr.period.startswith("Withdrawal") and 
                 abs((fr.calculation_date - trans_date).total_seconds()) < 1
             ), None)
 
@@ -1274,7 +1491,7 @@ class EnhancedFundManager:
             tranches = self.get_investor_tranches(investor_id)
             if not tranches:
                 # Nếu nhà đầu tư Äã rút hết, tạo lại 1 tranche
-                price = original_transaction.nav / (sum(t.units for t in self.tranches) + units_to_restore)
+                price = original_transaction.nav / (self.get_total_units() + units_to_restore)
                 tranche = Tranche(
                     investor_id=investor_id,
                     tranche_id=str(uuid.uuid4()),
@@ -1282,7 +1499,7 @@ class EnhancedFundManager:
                     original_entry_date=trans_date, original_entry_nav=price,
                     original_invested_value=units_to_restore * price, cumulative_fees_paid=0.0
                 )
-                self.tranches.append(tranche)
+                self._track_new("tranches", tranche)
             else:
                 # Phân bổ lại units
                 total_existing_units = self.get_investor_units(investor_id)
@@ -1290,9 +1507,10 @@ class EnhancedFundManager:
                     proportion = tranche.units / total_existing_units if total_existing_units > 0 else 1.0/len(tranches)
                     tranche.units += units_to_restore * proportion
                     tranche.invested_value += (units_to_restore * proportion) * tranche.entry_nav
+                    self._track_modified("tranches", tranche)
 
             # Xóa transaction rút tiền
-            self.transactions.remove(original_transaction)
+            self._track_removed("transactions", original_transaction)
             
             return True
 
@@ -1306,14 +1524,14 @@ class EnhancedFundManager:
 
     def _undo_nav_update(self, original_transaction) -> bool:
         try:
-            self.transactions.remove(original_transaction)
+            self._track_removed("transactions", original_transaction)
             return True
         except Exception:
             return False
 
     def _simple_transaction_removal(self, transaction) -> bool:
         try:
-            self.transactions.remove(transaction)
+            self._track_removed("transactions", transaction)
             return True
         except Exception:
             return False
@@ -1330,9 +1548,8 @@ class EnhancedFundManager:
 
             # Find related transactions within larger time window (1 hour)
             fee_txn = next((
-                t for t in self.transactions 
-                if t.investor_id == investor_id and t.type == "Phí" and 
-                abs(safe_total_seconds_between(t.date, trans_date)) < 3600
+                t for t in self.get_investor_transactions(investor_id)
+                if t.type == "Phí" and abs(safe_total_seconds_between(t.date, trans_date)) < 3600
             ), None)
             
             fm_fee_txns = [
@@ -1341,8 +1558,8 @@ class EnhancedFundManager:
             ]
 
             fee_record_to_undo = next((
-                fr for fr in self.fee_records
-                if fr.investor_id == investor_id and fr.period.startswith("Withdrawal") and 
+                fr for fr in self.get_fee_history(investor_id)
+                if fr.period.startswith("Withdrawal") and 
                 abs((fr.calculation_date - trans_date).total_seconds()) < 3600
             ), None)
 
@@ -1354,13 +1571,13 @@ class EnhancedFundManager:
                     # For complex withdrawals, we rely on snapshot restore
                     # Just remove the main withdrawal transaction and let snapshot handle the rest
                     try:
-                        self.transactions.remove(original_transaction)
+                        self._track_removed("transactions", original_transaction)
                         if fee_txn:
-                            self.transactions.remove(fee_txn)
+                            self._track_removed("transactions", fee_txn)
                         for fm_fee_txn in fm_fee_txns:
-                            self.transactions.remove(fm_fee_txn)
+                            self._track_removed("transactions", fm_fee_txn)
                         if fee_record_to_undo:
-                            self.fee_records.remove(fee_record_to_undo)
+                            self._track_removed("fee_records", fee_record_to_undo)
                         print("  ✅ Removed complex withdrawal transactions and fee records")
                         print("  💡 Note: Snapshot system will restore full state if any issues occur")
                         return True
@@ -1399,7 +1616,7 @@ class EnhancedFundManager:
                     original_entry_nav=price,
                     cumulative_fees_paid=0.0
                 )
-                self.tranches.append(tranche)
+                self._track_new("tranches", tranche)
                 print(f"  ✅ Created tranche {tranche.tranche_id}")
             else:
                 # Restore units proportionally to existing tranches
@@ -1413,11 +1630,12 @@ class EnhancedFundManager:
                     
                     tranche.units += units_to_add
                     tranche.invested_value += value_to_add
+                    self._track_modified("tranches", tranche)
                     
                     print(f"    🔄 Tranche {tranche.tranche_id}: +{units_to_add:.6f} units")
 
             # Remove the withdrawal transaction
-            self.transactions.remove(original_transaction)
+            self._track_removed("transactions", original_transaction)
             print(f"  ✅ Removed withdrawal transaction {original_transaction.id}")
             
             return True
@@ -1434,7 +1652,7 @@ class EnhancedFundManager:
         """
         try:
             print(f"  🔄 Removing NAV Update transaction {original_transaction.id}")
-            self.transactions.remove(original_transaction)
+            self._track_removed("transactions", original_transaction)
             print(f"  ✅ NAV Update removed successfully")
             return True
         except Exception as e:
@@ -1460,10 +1678,10 @@ class EnhancedFundManager:
                     print(f"  ⚠️  Found {len(related_fee_records)} related fee records")
                     # Remove related fee records as well
                     for fee_record in related_fee_records:
-                        self.fee_records.remove(fee_record)
+                        self._track_removed("fee_records", fee_record)
                         print(f"    🗑️  Removed fee record {fee_record.id}")
             
-            self.transactions.remove(transaction)
+            self._track_removed("transactions", transaction)
             print(f"  ✅ Transaction removed successfully")
             return True
         except Exception as e:
@@ -1607,7 +1825,7 @@ class EnhancedFundManager:
                     issues['errors'].append(f"Tranche {tranche.tranche_id}: {error}")
             
             # Check if investor exists
-            investor_exists = any(inv.id == tranche.investor_id for inv in self.investors)
+            investor_exists = self.get_investor_by_id(tranche.investor_id) is not None
             if not investor_exists:
                 issues['errors'].append(f"Tranche {tranche.tranche_id} tham chiếu nhà đầu tư không tồn tại: {tranche.investor_id}")
             
@@ -1641,7 +1859,7 @@ class EnhancedFundManager:
                     issues['errors'].append(f"Giao dịch {transaction.id}: {error}")
             
             # Check if investor exists
-            investor_exists = any(inv.id == transaction.investor_id for inv in self.investors)
+            investor_exists = self.get_investor_by_id(transaction.investor_id) is not None
             if not investor_exists:
                 issues['errors'].append(f"Giao dịch {transaction.id} tham chiếu nhà đầu tư không tồn tại: {transaction.investor_id}")
         
@@ -1667,7 +1885,7 @@ class EnhancedFundManager:
                     issues['errors'].append(f"Bản ghi phí {fee_record.id}: {error}")
             
             # Check if investor exists
-            investor_exists = any(inv.id == fee_record.investor_id for inv in self.investors)
+            investor_exists = self.get_investor_by_id(fee_record.investor_id) is not None
             if not investor_exists:
                 issues['errors'].append(f"Bản ghi phí {fee_record.id} tham chiếu nhà đầu tư không tồn tại: {fee_record.investor_id}")
         
@@ -1680,7 +1898,7 @@ class EnhancedFundManager:
         # Check consistency between transactions and tranches
         for investor in self.investors:
             investor_tranches = self.get_investor_tranches(investor.id)
-            investor_transactions = [t for t in self.transactions if t.investor_id == investor.id]
+            investor_transactions = self.get_investor_transactions(investor.id)
             
             # Check if investor has transactions but no tranches
             deposit_txns = [t for t in investor_transactions if t.type == "Nạp"]
@@ -1771,7 +1989,7 @@ class EnhancedFundManager:
             elif transaction_to_delete.type in ["Phí", "Fund Manager Withdrawal", "Phí Nhận"]:
                 return self._delete_complex_transaction(transaction_to_delete)
             else:
-                self.transactions.remove(transaction_to_delete)
+                self._track_removed("transactions", transaction_to_delete)
                 return True
 
         except Exception as e:
@@ -1786,8 +2004,8 @@ class EnhancedFundManager:
 
             matching_tranches = [
                 t
-                for t in self.tranches
-                if (t.investor_id == investor_id and abs((t.entry_date - transaction_date).total_seconds()) < 3600)
+                for t in self.get_investor_tranches(investor_id)
+                if abs((t.entry_date - transaction_date).total_seconds()) < 3600
             ]
 
             best_match = None
@@ -1803,9 +2021,9 @@ class EnhancedFundManager:
                         f"Không thể xóa giao dịch nạp {transaction.id}: tranche Äã bị ảnh hưởng bởi phí"
                     )
                     return False
-                self.tranches.remove(best_match)
+                self._track_removed("tranches", best_match)
 
-            self.transactions.remove(transaction)
+            self._track_removed("transactions", transaction)
             return True
 
         except Exception as e:
@@ -1821,10 +2039,11 @@ class EnhancedFundManager:
         if not fund_manager:
             return False
 
-        original_state = cp.deepcopy(self.tranches)
+        original_state = {"tranches": cp.deepcopy(self.tranches)}
+        checkpoint = self.unit_of_work.checkpoint()
         remaining_units = units_to_remove
 
-        fm_tranches = [t for t in self.tranches if t.investor_id == fund_manager.id and t.units > EPSILON]
+        fm_tranches = [t for t in self.get_investor_tranches(fund_manager.id) if t.units > EPSILON]
         fm_tranches.sort(
             key=lambda t: (
                 abs(safe_total_seconds_between(t.entry_date, reference_date)),
@@ -1838,11 +2057,12 @@ class EnhancedFundManager:
             units_delta = min(tranche.units, remaining_units)
             tranche.units -= units_delta
             tranche.invested_value = tranche.units * tranche.entry_nav
+            self._track_modified("tranches", tranche)
             remaining_units -= units_delta
 
-        self.tranches = [t for t in self.tranches if t.units >= EPSILON]
+        self._remove_where("tranches", lambda t: t.units < EPSILON)
         if remaining_units > 1e-8:
-            self.tranches = original_state
+            self._restore_entities(original_state, checkpoint)
             return False
 
         return True
@@ -1881,6 +2101,7 @@ class EnhancedFundManager:
                 deduction = min(current_paid, proportional, rollback_remaining)
 
             tranche.cumulative_fees_paid = max(0.0, current_paid - deduction)
+            self._track_modified("tranches", tranche)
             rollback_remaining -= deduction
             if rollback_remaining <= EPSILON:
                 break
@@ -1894,10 +2115,11 @@ class EnhancedFundManager:
             "transactions": cp.deepcopy(self.transactions),
             "fee_records": cp.deepcopy(self.fee_records),
         }
+        checkpoint = self.unit_of_work.checkpoint()
 
         try:
             investor_id = transaction.investor_id
-            investor_transactions = [t for t in self.transactions if t.investor_id == investor_id]
+            investor_transactions = self.get_investor_transactions(investor_id)
             investor_transactions.sort(key=lambda x: (x.date, x.id), reverse=True)
             if investor_transactions[0].id != transaction.id:
                 print(
@@ -1908,9 +2130,8 @@ class EnhancedFundManager:
             related_fee_txn = next(
                 (
                     t
-                    for t in self.transactions
-                    if t.investor_id == investor_id
-                    and t.type == "Phí"
+                    for t in self.get_investor_transactions(investor_id)
+                    if t.type == "Phí"
                     and abs(safe_total_seconds_between(t.date, transaction.date)) < 3600
                 ),
                 None,
@@ -1923,9 +2144,8 @@ class EnhancedFundManager:
             ]
             related_fee_records = [
                 f
-                for f in self.fee_records
-                if f.investor_id == investor_id
-                and f.period.startswith("Withdrawal")
+                for f in self.get_fee_history(investor_id)
+                if f.period.startswith("Withdrawal")
                 and abs(safe_total_seconds_between(f.calculation_date, transaction.date)) < 3600
             ]
 
@@ -1952,7 +2172,7 @@ class EnhancedFundManager:
                     cumulative_fees_paid=0.0,
                 )
                 tranche.invested_value = tranche.units * tranche.entry_nav
-                self.tranches.append(tranche)
+                self._track_new("tranches", tranche)
             else:
                 total_existing_units = sum(t.units for t in investor_tranches)
                 for tranche in investor_tranches:
@@ -1960,6 +2180,7 @@ class EnhancedFundManager:
                         proportion = tranche.units / total_existing_units
                         tranche.units += units_to_restore * proportion
                         tranche.invested_value = tranche.units * tranche.entry_nav
+                        self._track_modified("tranches", tranche)
 
             if related_fee_txn:
                 fee_amount_to_rollback = abs(related_fee_txn.amount)
@@ -1975,14 +2196,12 @@ class EnhancedFundManager:
                 tx_ids_to_remove.add(related_fee_txn.id)
             tx_ids_to_remove.update(t.id for t in related_fm_fee_txns)
 
-            self.transactions = [t for t in self.transactions if t.id not in tx_ids_to_remove]
-            self.fee_records = [f for f in self.fee_records if f not in related_fee_records]
+            self._remove_where("transactions", lambda t: t.id in tx_ids_to_remove)
+            self._remove_where("fee_records", lambda f: f in related_fee_records)
             return True
 
         except Exception as e:
-            self.tranches = snapshot["tranches"]
-            self.transactions = snapshot["transactions"]
-            self.fee_records = snapshot["fee_records"]
+            self._restore_entities(snapshot, checkpoint)
             print(f"Error deleting withdrawal transaction: {str(e)}")
             return False
 
@@ -1991,7 +2210,7 @@ class EnhancedFundManager:
             latest_nav = self.get_latest_total_nav()
             if latest_nav == transaction.nav:
                 print(f"Cảnh báo: Xóa giao dịch cập nhật NAV {transaction.id} sẽ làm thay đổi NAV mới nhất")
-            self.transactions.remove(transaction)
+            self._track_removed("transactions", transaction)
             return True
         except Exception as e:
             print(f"Error deleting NAV update transaction: {str(e)}")
@@ -2013,7 +2232,7 @@ class EnhancedFundManager:
                     )
                     return False
 
-            self.transactions.remove(transaction)
+            self._track_removed("transactions", transaction)
             return True
 
         except Exception as e:
@@ -2134,8 +2353,8 @@ class EnhancedFundManager:
                     "lifetime_performance": self._empty_performance_stats(),
                     "fee_details": self._empty_fee_details(),
                     "tranches": [],
-                    "transactions": [t for t in self.transactions if t.investor_id == investor_id],
-                    "fee_history": [f for f in self.fee_records if f.investor_id == investor_id],
+                    "transactions": self.get_investor_transactions(investor_id),
+                    "fee_history": self.get_fee_history(investor_id),
                     "report_date": datetime.now(),
                     "current_nav": current_nav,
                     "current_price": self.calculate_price_per_unit(current_nav),
@@ -2159,8 +2378,8 @@ class EnhancedFundManager:
                 print(f"Error calculating fee details for investor {investor_id}: {e}")
                 fee_details = self._empty_fee_details()
 
-            investor_transactions = [t for t in self.transactions if t.investor_id == investor_id]
-            investor_fees = [f for f in self.fee_records if f.investor_id == investor_id]
+            investor_transactions = self.get_investor_transactions(investor_id)
+            investor_fees = self.get_fee_history(investor_id)
 
             report = {
                 "investor": investor,
@@ -0,0 +1,225 @@
+"""
+Unit of work cho EnhancedFundManager.
+
+Ghi nhận các đối tượng domain mới / bị sửa / bị xóa (theo khóa ổn định) giữa hai
+lần lưu, để tầng lưu trữ chỉ ghi phần chênh lệch và API báo được chính xác một
+thao tác đã chạm vào những bản ghi nào.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# (tên danh sách trên manager, thuộc tính khóa ổn định)
+ENTITY_KEYS: Tuple[Tuple[str, str], ...] = (
+    ("investors", "id"),
+    ("tranches", "tranche_id"),
+    ("transactions", "id"),
+    ("fee_records", "id"),
+)
+
+# Entity chỉ bị sửa qua các hàm nghiệp vụ (có register) nên tin được đăng ký khi lưu;
+# investors ít dòng và bị sửa trực tiếp (API cập nhật thông tin) nên luôn so sánh toàn bộ.
+REGISTERED_ENTITIES = frozenset({"tranches", "transactions", "fee_records"})
+
+CHANGE_KINDS = ("new", "modified", "removed")
+
+
+class UnitOfWork:
+    """
+    Theo dõi thay đổi so với trạng thái đã lưu gần nhất.
+
+    - ``register_new/modified/removed`` được các hàm nghiệp vụ gọi khi thay đổi dữ liệu.
+    - ``collect_changes`` dựng tập thay đổi của các entity trong ``registered_entities``
+      từ các đăng ký đó (chỉ chạm vào bản ghi đã đăng ký); entity khác, hoặc khi danh
+      sách không khớp với đăng ký (thêm/xóa trực tiếp không qua register), thì so sánh
+      toàn bộ với baseline để không mất thay đổi.
+    - ``commit`` cập nhật baseline sau khi lưu thành công (chỉ các bản ghi đã ghi).
+    """
+
+    def __init__(
+        self,
+        entity_keys: Iterable[Tuple[str, str]] = ENTITY_KEYS,
+        registered_entities: Iterable[str] = REGISTERED_ENTITIES,
+    ):
+        self.entity_keys: Dict[str, str] = dict(entity_keys)
+        self.registered_entities = frozenset(registered_entities)
+        self._baseline: Optional[Dict[str, Dict[Any, Dict[str, Any]]]] = None
+        self._pending: Dict[str, Dict[str, Dict[Any, Any]]] = self._empty_pending()
+
+    def _empty_pending(self) -> Dict[str, Dict[str, Dict[Any, Any]]]:
+        return {entity: {kind: {} for kind in CHANGE_KINDS} for entity in self.entity_keys}
+
+    @property
+    def has_baseline(self) -> bool:
+        return self._baseline is not None
+
+    def key_of(self, entity: str, obj: Any) -> Any:
+        return getattr(obj, self.entity_keys[entity])
+
+    # ------------------------------------------------------------------
+    # Ghi nhận thay đổi
+    # ------------------------------------------------------------------
+    def register_new(self, entity: str, obj: Any) -> None:
+        key = self.key_of(entity, obj)
+        pending = self._pending[entity]
+        if pending["removed"].pop(key, None) is not None:
+            pending["modified"][key] = obj
+        else:
+            pending["new"][key] = obj
+
+    def register_modified(self, entity: str, obj: Any) -> None:
+        key = self.key_of(entity, obj)
+        pending = self._pending[entity]
+        if key not in pending["new"]:
+            pending["modified"][key] = obj
+
+    def register_removed(self, entity: str, obj: Any) -> None:
+        key = self.key_of(entity, obj)
+        pending = self._pending[entity]
+        pending["modified"].pop(key, None)
+        if pending["new"].pop(key, None) is None:
+            pending["removed"][key] = obj
+
+    def pending(self) -> Dict[str, Dict[str, List[Any]]]:
+        """Khóa các bản ghi đã được đăng ký thay đổi từ lần lưu trước (bỏ entity rỗng)."""
+        report: Dict[str, Dict[str, List[Any]]] = {}
+        for entity, kinds in self._pending.items():
+            if any(kinds.values()):
+                report[entity] = {kind: list(kinds[kind]) for kind in CHANGE_KINDS}
+        return report
+
+    def checkpoint(self) -> Dict[str, Dict[str, Dict[Any, Any]]]:
+        """Bản sao trạng thái đăng ký, dùng để hoàn tác khi một thao tác bị rollback."""
+        return {entity: {kind: dict(items) for kind, items in kinds.items()} for entity, kinds in self._pending.items()}
+
+    def restore(self, checkpoint: Dict[str, Dict[str, Dict[Any, Any]]]) -> None:
+        self._pending = checkpoint
+
+    def clone(self) -> "UnitOfWork":
+        """Bản sao độc lập; baseline dùng chung vì chỉ bị thay thế (commit), không sửa tại chỗ."""
+        other = UnitOfWork(self.entity_keys.items(), self.registered_entities)
+        other._baseline = self._baseline
+        other._pending = self.checkpoint()
+        return other
+
+    def rebind(self, entity: str, objects: Iterable[Any]) -> None:
+        """Trỏ các đăng ký new/modified của ``entity`` sang object cùng khóa trong ``objects`` (bản copy)."""
+        pending = self._pending[entity]
+        if not pending["new"] and not pending["modified"]:
+            return
+        by_key = {self.key_of(entity, obj): obj for obj in objects}
+        for kind in ("new", "modified"):
+            pending[kind] = {key: by_key.get(key, obj) for key, obj in pending[kind].items()}
+
+    # ------------------------------------------------------------------
+    # Baseline / diff
+    # ------------------------------------------------------------------
+    def commit(self, source: Any, changes: Optional[Dict[str, Dict[str, list]]] = None) -> None:
+        """
+        Cập nhật baseline và xóa các đăng ký đang chờ.
+
+        Có ``changes`` (kết quả ``collect_changes`` vừa được ghi) thì chỉ cập nhật các
+        bản ghi trong đó; không có thì chụp lại toàn bộ danh sách trên ``source``.
+        """
+        if changes is None or self._baseline is None:
+            self._baseline = {
+                entity: {getattr(obj, key): dict(vars(obj)) for obj in getattr(source, entity)}
+                for entity, key in self.entity_keys.items()
+            }
+        else:
+            # Baseline có thể dùng chung với bản clone: thay dict của entity, không sửa tại chỗ
+            baseline = dict(self._baseline)
+            for entity, bucket in changes.items():
+                if not any(bucket.values()):
+                    continue
+                key = self.entity_keys[entity]
+                rows = dict(baseline.get(entity, {}))
+                for obj in list(bucket.get("inserted") or []) + list(bucket.get("updated") or []):
+                    rows[getattr(obj, key)] = dict(vars(obj))
+                for obj_key in bucket.get("deleted") or []:
+                    rows.pop(obj_key, None)
+                baseline[entity] = rows
+            self._baseline = baseline
+        self._pending = self._empty_pending()
+
+    def baseline_value(self, entity: str, key: Any, attribute: str) -> Any:
+        """Giá trị ``attribute`` của bản ghi ``key`` tại lần lưu gần nhất (None nếu không có)."""
+        if self._baseline is None:
+            return None
+        previous = self._baseline.get(entity, {}).get(key)
+        return previous.get(attribute) if previous is not None else None
+
+    def collect_changes(self, source: Any) -> Optional[Dict[str, Dict[str, list]]]:
+        """
+        Tập thay đổi so với baseline.
+
+        Trả về ``{entity: {"inserted": [obj], "updated": [obj], "deleted": [key]}}``,
+        hoặc None khi không thể ghi delta an toàn (chưa có baseline hoặc trùng khóa).
+        Entity trong ``registered_entities`` dùng các đăng ký nếu chúng giải thích được
+        độ dài danh sách hiện tại, ngược lại so sánh toàn bộ danh sách với baseline.
+        """
+        if self._baseline is None:
+            return None
+
+        changes: Dict[str, Dict[str, list]] = {}
+        for entity in self.entity_keys:
+            bucket = self._registered_changes(entity, source) if entity in self.registered_entities else None
+            if bucket is None:
+                bucket = self._diff_changes(entity, source)
+            if bucket is None:
+                return None
+            changes[entity] = bucket
+        return changes
+
+    def _registered_changes(self, entity: str, source: Any) -> Optional[Dict[str, list]]:
+        """Thay đổi lấy từ đăng ký; None nếu danh sách đã bị đổi ngoài register."""
+        baseline = self._baseline.get(entity, {})
+        pending = self._pending[entity]
+        new, modified, removed = pending["new"], pending["modified"], pending["removed"]
+        if len(getattr(source, entity)) != len(baseline) + len(new) - len(removed):
+            return None
+        if any(obj_key in baseline for obj_key in new):
+            return None
+        if any(obj_key not in baseline for obj_key in removed) or any(obj_key not in baseline for obj_key in modified):
+            return None
+        return {
+            "inserted": list(new.values()),
+            "updated": [obj for obj_key, obj in modified.items() if baseline[obj_key] != vars(obj)],
+            "deleted": list(removed),
+        }
+
+    def _diff_changes(self, entity: str, source: Any) -> Optional[Dict[str, list]]:
+        """So sánh toàn bộ danh sách với baseline; None nếu trùng khóa."""
+        key = self.entity_keys[entity]
+        baseline = self._baseline.get(entity, {})
+        inserted: List[Any] = []
+        updated: List[Any] = []
+        seen = set()
+        for obj in getattr(source, entity):
+            obj_key = getattr(obj, key)
+            if obj_key in seen:
+                return None
+            seen.add(obj_key)
+            previous = baseline.get(obj_key)
+            if previous is None:
+                inserted.append(obj)
+            elif previous != vars(obj):
+                updated.append(obj)
+        return {
+            "inserted": inserted,
+            "updated": updated,
+            "deleted": [obj_key for obj_key in baseline if obj_key not in seen],
+        }
+
+def summarize_changes(changes: Optional[Dict[str, Dict[str, list]]], entity_keys: Dict[str, str]) -> Dict[str, Dict[str, List[Any]]]:
+    """Rút gọn kết quả ``collect_changes`` thành khóa new/modified/removed theo entity."""
+    summary: Dict[str, Dict[str, List[Any]]] = {}
+    for entity, bucket in (changes or {}).items():
+        key = entity_keys[entity]
+        item = {
+            "new": [getattr(obj, key) for obj in bucket.get("inserted", [])],
+            "modified": [getattr(obj, key) for obj in bucket.get("updated", [])],
+            "removed": list(bucket.get("deleted", [])),
+        }
+        if any(item.values()):
+            summary[entity] = item
+    return summary
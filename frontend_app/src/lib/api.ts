@@ -2,8 +2,10 @@
 
 import type {
   ApiResponse,
+  AutoBackupTicketDTO,
   BackupListItemDTO,
   DashboardDTO,
+  ExportJobDTO,
   FeeConfigBundleDTO,
   FeeGlobalConfigDTO,
   FeeInvestorOverrideDTO,
@@ -15,6 +17,7 @@ import type {
   InvestorReportDTO,
   InvestorCardDTO,
   NavPointDTO,
+  NavSeriesDTO,
   PaginatedResponse,
   TokenPair,
   TransactionCardDTO,
@@ -293,10 +296,43 @@ export const apiClient = {
     });
   },
 
+  async submitExportJob(
+    token: string,
+    params: { start_date?: string; end_date?: string; investor_id?: number; tx_type?: string; mine?: boolean },
+  ): Promise<ExportJobDTO> {
+    const search = new URLSearchParams();
+    if (params.start_date) search.set("start_date", params.start_date);
+    if (params.end_date) search.set("end_date", params.end_date);
+    if (!params.mine && params.investor_id !== undefined) search.set("investor_id", String(params.investor_id));
+    if (params.tx_type) search.set("tx_type", params.tx_type);
+    const base = params.mine ? "/reports/me/transactions/export/jobs" : "/reports/transactions/export/jobs";
+    const query = search.toString();
+    return request<ExportJobDTO>(query ? `${base}?${query}` : base, { method: "POST", token });
+  },
+
+  async exportJobStatus(token: string, jobId: string): Promise<ExportJobDTO> {
+    return request<ExportJobDTO>(`/reports/export-jobs/${encodeURIComponent(jobId)}`, { token });
+  },
+
+  async downloadExportJob(token: string, jobId: string): Promise<Blob> {
+    return requestBlob(`/reports/export-jobs/${encodeURIComponent(jobId)}/download`, {
+      token,
+      accept: "application/pdf",
+    });
+  },
+
   async navHistory(token: string): Promise<NavPointDTO[]> {
     return request<NavPointDTO[]>("/nav/history", { token });
   },
 
+  async navSeries(token: string, params: { start_date?: string; end_date?: string } = {}): Promise<NavSeriesDTO> {
+    const search = new URLSearchParams();
+    if (params.start_date) search.set("start_date", params.start_date);
+    if (params.end_date) search.set("end_date", params.end_date);
+    const query = search.toString();
+    return request<NavSeriesDTO>(query ? `/nav/series?${query}` : "/nav/series", { token });
+  },
+
   async investorCards(token: string): Promise<InvestorCardDTO[]> {
     return request<InvestorCardDTO[]>("/investors/cards", { token });
   },
@@ -500,6 +536,10 @@ export const apiClient = {
     });
   },
 
+  async autoBackupStatus(token: string, ticketId: string): Promise<AutoBackupTicketDTO> {
+    return request<AutoBackupTicketDTO>(`/backups/auto/${encodeURIComponent(ticketId)}`, { token });
+  },
+
   async restoreBackup(
     token: string,
     payload: {
@@ -32,6 +32,7 @@ export type PaginatedResponse<T> = {
   total: number;
   page: number;
   page_size: number;
+  next_cursor?: string | null;
 };
 
 export type UserInfo = {
@@ -92,6 +93,7 @@ export type DashboardKPI = {
   total_fees_paid: number;
   fund_manager_value: number;
   gross_return: number;
+  return_ytd: number;
 };
 
 export type DashboardDTO = {
@@ -161,6 +163,43 @@ export type NavPointDTO = {
   type: string;
 };
 
+export type NavDailyPointDTO = {
+  date: string;
+  total_nav: number;
+  total_units: number;
+  price_per_unit: number;
+};
+
+export type NavSeriesDTO = {
+  points: NavDailyPointDTO[];
+  period_return: number;
+};
+
+export type ExportJobDTO = {
+  job_id: string;
+  status: "queued" | "running" | "done" | "failed";
+  progress: number;
+  total_rows: number;
+  filename: string;
+  created_at: string;
+  started_at?: string | null;
+  finished_at?: string | null;
+  error?: string | null;
+  size_bytes?: number | null;
+};
+
+export type AutoBackupTicketDTO = {
+  ticket_id: string;
+  status: "queued" | "running" | "done" | "failed";
+  requests: number;
+  transaction_types: string[];
+  created_at: string;
+  started_at?: string | null;
+  finished_at?: string | null;
+  result?: Record<string, unknown> | null;
+  error?: string | null;
+};
+
 export type BackupListItemDTO = {
   backup_id: string;
   backup_type: string;
@@ -288,4 +327,5 @@ export type TransactionsReportDTO = {
   total: number;
   page: number;
   page_size: number;
+  next_cursor?: string | null;
 };
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+r"""
+Verify or compact the incremental backup chain in exports/.
+
+Auto backups are written as a full archive followed by increments (changed rows
++ removed keys). `verify` replays a chain and checks every link; `compact`
+replays it into a new full backup.
+
+Usage:
+  .\.venv\Scripts\python scripts\backup_chain.py verify
+  .\.venv\Scripts\python scripts\backup_chain.py verify --backup-id Fund_Export_..._inc.zip
+  .\.venv\Scripts\python scripts\backup_chain.py compact --prune
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Verify or compact the CNFund incremental backup chain")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    verify = subparsers.add_parser("verify", help="Check every link of a chain and replay it")
+    verify.add_argument("--backup-id", default=None, help="Last backup of the chain (default: current head)")
+
+    compact = subparsers.add_parser("compact", help="Replay a chain into a new full backup")
+    compact.add_argument("--backup-id", default=None, help="Last backup of the chain (default: current head)")
+    compact.add_argument(
+        "--prune",
+        action="store_true",
+        help="Delete the compacted links afterwards (current head only)",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+
+    from backend_api.app.services.backup_service import compact_backup_chain, verify_backup_chain
+
+    if args.command == "verify":
+        result = verify_backup_chain(args.backup_id)
+        print(f"Chain ending at {result['backup_id']}: {len(result['chain'])} link(s)")
+        for name in result["chain"]:
+            print(f"  {name}")
+        for error in result["errors"]:
+            print(f"  ERROR {error}", file=sys.stderr)
+        print("OK" if result["ok"] else "FAILED")
+        return 0 if result["ok"] else 1
+
+    result = compact_backup_chain(args.backup_id, prune=args.prune)
+    print(f"Compacted {len(result['chain'])} link(s) ending at {result['source']}")
+    print(f"  Full backup: exports/{result['backup_id']}")
+    if result["pruned"]:
+        print(f"  Pruned: {', '.join(result['pruned'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+r"""
+Benchmark full-load latency of PostgresDataHandler on a synthetic dataset.
+
+Seeds N transactions (plus matching tranches / fee records) into a scratch
+database and compares the bulk Core loader against ORM entity hydration.
+
+Usage:
+  .\.venv\Scripts\python scripts\benchmark_bulk_load.py
+  .\.venv\Scripts\python scripts\benchmark_bulk_load.py --transactions 200000 --database-url "postgresql://..."
+
+WARNING: --database-url must point at a scratch database; the fund_* tables are rewritten.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark CNFund full data load")
+    parser.add_argument("--transactions", type=int, default=120_000, help="Number of transactions to seed")
+    parser.add_argument("--investors", type=int, default=500, help="Number of investors to seed")
+    parser.add_argument("--database-url", default=None, help="Scratch database URL (default: temp SQLite file)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per loader (best is reported)")
+    return parser.parse_args()
+
+
+def _seed(handler, tx_count: int, investor_count: int) -> None:
+    from core.models import FeeRecord, Investor, Transaction, Tranche
+
+    start = datetime(2018, 1, 1)
+    investors = [Investor(id=0, name="Fund Manager", is_fund_manager=True, join_date=date(2018, 1, 1))]
+    investors += [Investor(id=i, name=f"Investor {i}", join_date=date(2018, 1, 1)) for i in range(1, investor_count + 1)]
+
+    transactions = []
+    tranches = []
+    fee_records = []
+    for tx_id in range(1, tx_count + 1):
+        investor_id = (tx_id % investor_count) + 1
+        tx_date = start + timedelta(minutes=37 * tx_id)
+        if tx_id % 4 == 0:
+            transactions.append(Transaction(tx_id, 0, tx_date, "NAV Update", 0.0, 1e9 + tx_id, 0.0))
+            continue
+        transactions.append(Transaction(tx_id, investor_id, tx_date, "Nạp", 1_000_000.0, 1e9 + tx_id, 100.0))
+        tranches.append(
+            Tranche(
+                investor_id=investor_id,
+                tranche_id=str(uuid.uuid4()),
+                entry_date=tx_date,
+                entry_nav=10_000.0,
+                units=100.0,
+                original_invested_value=1_000_000.0,
+            )
+        )
+        if tx_id % 50 == 0:
+            fee_records.append(
+                FeeRecord(len(fee_records) + 1, str(tx_date.year), investor_id, 1000.0, 0.1, tx_date, 100.0, 99.9, 10_000.0)
+            )
+
+    if not handler.save_all_data_enhanced(investors, tranches, transactions, fee_records):
+        raise RuntimeError("Seeding failed")
+
+
+def _load_with_orm(handler):
+    """Reference: the previous ORM-hydration loader (entity rows copied into dataclasses)."""
+    from sqlalchemy import select
+
+    from core.models import Transaction, Tranche
+    from core.postgres_data_handler import TrancheRow, TransactionRow
+
+    with handler._session() as session:
+        tranche_rows = session.execute(
+            select(TrancheRow).order_by(TrancheRow.entry_date.asc(), TrancheRow.id.asc())
+        ).scalars().all()
+        tx_rows = session.execute(
+            select(TransactionRow).order_by(TransactionRow.date.asc(), TransactionRow.id.asc())
+        ).scalars().all()
+    tranches = []
+    for row in tranche_rows:
+        tranche = Tranche(
+            investor_id=row.investor_id,
+            tranche_id=row.tranche_id,
+            entry_date=row.entry_date,
+            entry_nav=row.entry_nav,
+            units=row.units,
+            hwm=row.hwm,
+            original_entry_date=row.original_entry_date,
+            original_entry_nav=row.original_entry_nav,
+            cumulative_fees_paid=row.cumulative_fees_paid,
+            original_invested_value=row.original_invested_value,
+        )
+        tranche.invested_value = row.invested_value
+        tranches.append(tranche)
+    transactions = [
+        Transaction(row.id, row.investor_id, row.date, row.type, row.amount, row.nav, row.units_change)
+        for row in tx_rows
+    ]
+    return tranches, transactions
+
+
+def _best_of(repeat: int, func) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> int:
+    args = _parse_args()
+    from core.postgres_data_handler import PostgresDataHandler
+
+    database_url = args.database_url
+    if not database_url:
+        db_file = Path(tempfile.gettempdir()) / f"cnfund_bench_{uuid.uuid4().hex}.db"
+        database_url = f"sqlite:///{db_file.as_posix()}"
+
+    handler = PostgresDataHandler(database_url=database_url)
+    started = time.perf_counter()
+    _seed(handler, args.transactions, args.investors)
+    print(f"Seeded {args.transactions:,} transactions in {time.perf_counter() - started:.2f}s")
+
+    def _serial():
+        handler.load_investors()
+        handler.load_tranches()
+        handler.load_transactions()
+        handler.load_fee_records()
+
+    results = {
+        "ORM hydration (tranches + transactions only)": _best_of(args.repeat, lambda: _load_with_orm(handler)),
+        "Bulk loader, serial": _best_of(args.repeat, _serial),
+        "Bulk loader, load_all (GC paused; overlapped on server DBs)": _best_of(args.repeat, handler.load_all),
+    }
+    for label, seconds in results.items():
+        print(f"{label:<58} {seconds * 1000:>10.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
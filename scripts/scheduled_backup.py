@@ -88,7 +88,7 @@ def main() -> int:
     manager = EnhancedFundManager(handler, enable_snapshots=False)
     manager.load_data()
 
-    result = trigger_manual_backup(manager, description="scheduled")
+    result = trigger_manual_backup(manager, description="scheduled", backup_format="xlsx")
 
     backup_id = result.get("backup_id", "unknown")
     drive_ok = result.get("google_drive_uploaded", False)
@@ -0,0 +1,18 @@
+import sys
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _no_stray_auto_backups(monkeypatch):
+    """
+    API tests that post transactions would queue debounced auto backups on the
+    shared worker, which outlive the test and write into the repo ``exports/``.
+    Keep them off unless a test enables them, and stop whichever worker the
+    test loaded (tests re-import ``backend_api.app``) before its patches undo.
+    """
+    monkeypatch.setenv("API_AUTO_BACKUP_ON_NEW_TRANSACTION", "false")
+    yield
+    worker_module = sys.modules.get("backend_api.app.services.backup_worker")
+    if worker_module is not None:
+        worker_module.shutdown_auto_backup_worker()
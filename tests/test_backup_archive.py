@@ -0,0 +1,267 @@
+import copy
+from datetime import datetime
+from pathlib import Path
+import sys
+import tempfile
+import uuid
+import zipfile
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from backend_api.app.services import backup_service  # noqa: E402
+from core.models import Investor  # noqa: E402
+from core.postgres_data_handler import PostgresDataHandler  # noqa: E402
+from core.services_enhanced import EnhancedFundManager  # noqa: E402
+
+
+def _build_manager():
+    db_file = Path(tempfile.gettempdir()) / f"cnfund_backup_archive_{uuid.uuid4().hex}.db"
+    handler = PostgresDataHandler(database_url=f"sqlite:///{db_file.as_posix()}")
+    manager = EnhancedFundManager(handler, enable_snapshots=False)
+    manager.load_data()
+    manager._ensure_fund_manager_exists()
+    return manager
+
+
+def _seeded_manager():
+    manager = _build_manager()
+    manager.investors.append(Investor(id=1, name="Archive One", phone="0912345678", email="one@example.com"))
+    manager.investors.append(Investor(id=2, name="Archive Two", address="12 Phố Huế", address_line="12 Phố Huế"))
+    manager.process_deposit(1, 1_000_000, 1_000_000, datetime(2025, 1, 10, 9, 15))
+    manager.process_deposit(2, 2_500_000, 3_500_000, datetime(2025, 2, 1))
+    manager.process_nav_update(3_900_000.123456, datetime(2025, 6, 1))
+    manager.fee_investor_overrides = {2: {"performance_fee_rate": 0.15, "hurdle_rate_annual": None, "updated_at": None}}
+    assert manager.save_data()
+    return manager
+
+
+def _state(manager):
+    return (
+        [vars(inv) for inv in manager.investors],
+        [vars(tranche) for tranche in manager.tranches],
+        [vars(tx) for tx in manager.transactions],
+        [vars(fee) for fee in manager.fee_records],
+    )
+
+
+def test_archive_backup_round_trips_and_is_listed(monkeypatch, tmp_path):
+    monkeypatch.setattr(backup_service, "EXPORT_DIR", tmp_path)
+    source = _seeded_manager()
+
+    backup = backup_service.trigger_manual_backup(source, description="archive_test", backup_format="archive")
+    archive_path = tmp_path / backup["backup_id"]
+    assert archive_path.suffix == ".zip"
+
+    manifest = backup_service.read_backup_archive_manifest(archive_path)
+    rows = {entry["name"]: entry["rows"] for entry in manifest["tables"]}
+    assert rows["Investors"] == len(source.investors)
+    assert rows["Transactions"] == len(source.transactions)
+    assert rows["Fee Config Overrides"] == 1
+
+    listed = {item["backup_id"]: item for item in backup_service.list_local_backups()}
+    assert listed[backup["backup_id"]]["format"] == "archive"
+    assert listed[backup["backup_id"]]["backup_type"] == "manual"
+
+    target = _build_manager()
+    result = backup_service.restore_from_local_backup(target, backup["backup_id"], create_safety_backup=False)
+    assert result["restored_sheets"][:4] == ["Investors", "Tranches", "Transactions", "Fee Records"]
+    assert _state(target) == _state(source)
+    assert target.get_investor_by_id(1).phone == "0912345678"
+    assert target.fee_investor_overrides[2]["performance_fee_rate"] == 0.15
+    assert target.fee_investor_overrides[2]["hurdle_rate_annual"] is None
+
+
+def test_archive_restore_rejects_tampered_members(monkeypatch, tmp_path):
+    monkeypatch.setattr(backup_service, "EXPORT_DIR", tmp_path)
+    source = _seeded_manager()
+    backup = backup_service.trigger_manual_backup(source, description="tamper", backup_format="archive")
+    archive_path = tmp_path / backup["backup_id"]
+
+    with zipfile.ZipFile(archive_path) as archive:
+        members = {name: archive.read(name) for name in archive.namelist()}
+    transactions_member = next(name for name in members if name.startswith("transactions."))
+    members[transactions_member] = members[transactions_member][:-4] + b"\x00\x00\x00\x00"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+
+    with pytest.raises(ValueError, match="checksum mismatch"):
+        backup_service.restore_from_local_backup(_build_manager(), backup["backup_id"], create_safety_backup=False)
+
+
+def _auto_backup_env(monkeypatch, tmp_path, full_every=20):
+    monkeypatch.setattr(backup_service, "EXPORT_DIR", tmp_path)
+    monkeypatch.setenv("API_JWT_SECRET_KEY", "test-secret")
+    monkeypatch.setenv("API_ADMIN_USERNAME", "admin")
+    monkeypatch.setenv("API_ADMIN_PASSWORD", "admin123")
+    monkeypatch.setenv("API_BACKUP_FORMAT", "archive")
+    monkeypatch.setenv("API_BACKUP_FULL_EVERY", str(full_every))
+    monkeypatch.delenv("GOOGLE_DRIVE_FOLDER_ID", raising=False)
+    monkeypatch.delenv("DRIVE_FOLDER_ID", raising=False)
+    backup_service.get_settings.cache_clear()
+
+
+def _chain_state(manager):
+    overrides = {investor_id: config["performance_fee_rate"] for investor_id, config in manager.fee_investor_overrides.items()}
+    return copy.deepcopy((_state(manager), overrides))
+
+
+def _restored_state(backup_id):
+    target = _build_manager()
+    backup_service.restore_from_local_backup(target, backup_id, create_safety_backup=False)
+    return _chain_state(target)
+
+
+def _build_chain(source):
+    """Full backup, an increment with inserts + an update, then one with removals (returns the removed tx id)."""
+    full = backup_service.trigger_auto_backup_after_transaction(source, "deposit")["backup_id"]
+
+    source.process_deposit(1, 500_000, 4_400_000, datetime(2025, 7, 1))
+    source.get_investor_by_id(2).name = "Archive Two Renamed"
+    assert source.save_data()
+    first = backup_service.trigger_auto_backup_after_transaction(source, "deposit")["backup_id"]
+    first_state = _chain_state(source)
+
+    latest = max(source.transactions, key=lambda tx: (tx.date, tx.id))
+    assert source.delete_transaction(latest.id)
+    source.fee_investor_overrides = {}
+    assert source.save_data()
+    second = backup_service.trigger_auto_backup_after_transaction(source, "delete")["backup_id"]
+    return [full, first, second], first_state, latest.id
+
+
+def test_incremental_chain_restores_to_any_point(monkeypatch, tmp_path):
+    _auto_backup_env(monkeypatch, tmp_path)
+    source = _seeded_manager()
+    full_state = _chain_state(source)
+    (full, first, second), first_state, removed_id = _build_chain(source)
+
+    manifests = [backup_service.read_backup_archive_manifest(tmp_path / name) for name in (full, first, second)]
+    assert [manifest["kind"] for manifest in manifests] == ["full", "incremental", "incremental"]
+    assert [manifest["sequence"] for manifest in manifests] == [0, 1, 2]
+    assert manifests[2]["parent"] == first and manifests[2]["base"] == full
+
+    first_tables = {entry["name"]: entry for entry in manifests[1]["tables"]}
+    assert first_tables["Transactions"]["rows"] == 1
+    assert first_tables["Investors"]["rows"] == 1
+    assert first_tables["Fee Records"]["rows"] == 0
+    second_tables = {entry["name"]: entry for entry in manifests[2]["tables"]}
+    assert second_tables["Transactions"]["deleted"] == [str(removed_id)]
+    assert second_tables["Fee Config Overrides"]["deleted"] == ["2"]
+
+    assert _restored_state(full) == full_state
+    assert _restored_state(first) == first_state
+    assert _restored_state(second) == _chain_state(source)
+
+    listed = {item["backup_id"]: item for item in backup_service.list_local_backups()}
+    assert listed[second]["backup_kind"] == "incremental"
+    assert listed[second]["parent"] == first
+
+
+def test_full_backup_every_n_and_after_manual_backup(monkeypatch, tmp_path):
+    _auto_backup_env(monkeypatch, tmp_path, full_every=2)
+    source = _seeded_manager()
+    kinds = []
+    for _ in range(3):
+        backup_id = backup_service.trigger_auto_backup_after_transaction(source, "deposit")["backup_id"]
+        kinds.append(backup_service.read_backup_archive_manifest(tmp_path / backup_id)["kind"])
+    assert kinds == ["full", "incremental", "full"]
+
+    source.process_deposit(1, 500_000, 4_400_000, datetime(2025, 7, 1))
+    assert source.save_data()
+    manual = backup_service.trigger_manual_backup(source, description="base", backup_format="archive")["backup_id"]
+    after = backup_service.trigger_auto_backup_after_transaction(source, "deposit")["backup_id"]
+    manifest = backup_service.read_backup_archive_manifest(tmp_path / after)
+    assert manifest["parent"] == manual
+    assert all(entry["rows"] == 0 for entry in manifest["tables"])
+
+
+def test_verify_and_compact_backup_chain(monkeypatch, tmp_path):
+    _auto_backup_env(monkeypatch, tmp_path)
+    source = _seeded_manager()
+    chain, _, _ = _build_chain(source)
+
+    report = backup_service.verify_backup_chain()
+    assert report["ok"] and report["chain"] == chain
+
+    compacted = backup_service.compact_backup_chain(prune=True)
+    assert compacted["chain"] == chain and compacted["pruned"] == chain
+    assert not any((tmp_path / name).exists() for name in chain)
+    assert backup_service.read_backup_archive_manifest(tmp_path / compacted["backup_id"])["kind"] == "full"
+    assert _restored_state(compacted["backup_id"]) == _chain_state(source)
+
+    # The compacted backup is the new base: an unchanged fund gives an empty increment
+    after = backup_service.trigger_auto_backup_after_transaction(source, "deposit")["backup_id"]
+    manifest = backup_service.read_backup_archive_manifest(tmp_path / after)
+    assert manifest["parent"] == compacted["backup_id"]
+    assert all(entry["rows"] == 0 and entry["deleted"] == [] for entry in manifest["tables"])
+    assert backup_service.verify_backup_chain(after)["chain"] == [compacted["backup_id"], after]
+
+    (tmp_path / compacted["backup_id"]).unlink()
+    broken = backup_service.verify_backup_chain(after)
+    assert not broken["ok"] and "missing" in broken["errors"][0]
+
+
+def test_chain_restarted_by_manual_backup_verifies_and_restores(monkeypatch, tmp_path):
+    _auto_backup_env(monkeypatch, tmp_path)
+    source = _seeded_manager()
+    old_chain, _, _ = _build_chain(source)
+
+    source.process_deposit(2, 700_000, source.get_latest_total_nav() + 700_000, datetime(2025, 8, 1))
+    assert source.save_data()
+    manual = backup_service.trigger_manual_backup(source, description="restart", backup_format="archive")["backup_id"]
+    manual_state = _chain_state(source)
+    # Same rows as the new head: the chain is not restarted again
+    again = backup_service.trigger_manual_backup(source, description="again", backup_format="archive")["backup_id"]
+
+    source.get_investor_by_id(1).name = "Archive One Renamed"
+    assert source.save_data()
+    after = backup_service.trigger_auto_backup_after_transaction(source, "deposit")["backup_id"]
+    manifest = backup_service.read_backup_archive_manifest(tmp_path / after)
+    assert manifest["parent"] == manual and manifest["base"] == manual and manifest["sequence"] == 1
+
+    report = backup_service.verify_backup_chain()
+    assert report["ok"] and report["chain"] == [manual, after] and report["missing_on_drive"] == []
+    assert backup_service.verify_backup_chain(old_chain[-1])["chain"] == old_chain
+    assert backup_service.verify_backup_chain(again)["chain"] == [again]
+    assert _restored_state(again) == manual_state
+    assert _restored_state(after) == _chain_state(source)
+
+
+def test_verify_reports_chain_links_missing_on_drive(monkeypatch, tmp_path):
+    _auto_backup_env(monkeypatch, tmp_path)
+    monkeypatch.setenv("GOOGLE_DRIVE_FOLDER_ID", "folder123")
+    failing: set[str] = set()
+
+    class _Uploader:
+        def upload(self, local_path, folder_id, mimetype, content_hash=None, force=False):
+            if "_manual_" in local_path.name and not failing:
+                failing.add(local_path.name)
+                return {"uploaded": False, "reason": "upload_failed:HTTP 503", "file_id": None, "web_view_link": None}
+            return {"uploaded": True, "reason": None, "file_id": f"id-{local_path.name}", "web_view_link": None}
+
+    monkeypatch.setattr(backup_service, "get_drive_uploader", lambda: _Uploader())
+    source = _seeded_manager()
+    full = backup_service.trigger_auto_backup_after_transaction(source, "deposit")["backup_id"]
+    assert backup_service.verify_backup_chain()["ok"]
+
+    source.process_deposit(1, 500_000, 4_400_000, datetime(2025, 7, 1))
+    assert source.save_data()
+    manual = backup_service.trigger_manual_backup(source, description="restart", backup_format="archive")
+    assert not manual["google_drive_uploaded"]
+    source.get_investor_by_id(2).name = "Archive Two Renamed"
+    assert source.save_data()
+    after = backup_service.trigger_auto_backup_after_transaction(source, "deposit")["backup_id"]
+
+    report = backup_service.verify_backup_chain()
+    assert report["chain"] == [manual["backup_id"], after]
+    assert not report["ok"] and report["missing_on_drive"] == [manual["backup_id"]]
+    assert "not uploaded to Google Drive" in report["errors"][0]
+    # Locally the chain is intact and restores
+    assert _restored_state(after) == _chain_state(source)
+    assert full not in report["chain"]
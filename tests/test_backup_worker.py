@@ -0,0 +1,143 @@
+import importlib
+from pathlib import Path
+import sys
+import tempfile
+import threading
+import uuid
+
+from fastapi.testclient import TestClient
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from backend_api.app.services.backup_worker import AutoBackupWorker  # noqa: E402
+
+
+class _RecordingBackup:
+    """Stand-in for the real backup: records each run, optionally blocks until released."""
+
+    def __init__(self, hold: bool = False, fail: bool = False) -> None:
+        self.labels: list[str] = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        if not hold:
+            self.release.set()
+        self.fail = fail
+
+    def __call__(self, label: str) -> dict:
+        self.labels.append(label)
+        self.started.set()
+        self.release.wait(5)
+        if self.fail:
+            raise OSError("disk full")
+        return {"backup_id": f"backup_{len(self.labels)}"}
+
+
+def test_burst_of_requests_is_coalesced_into_one_backup():
+    backup = _RecordingBackup()
+    worker = AutoBackupWorker(backup, debounce_seconds=0.2, max_delay_seconds=5)
+
+    tickets = [worker.request("deposit") for _ in range(10)]
+    assert {ticket["ticket_id"] for ticket in tickets} == {tickets[0]["ticket_id"]}
+    assert worker.wait_idle(timeout=5)
+
+    status = worker.get(tickets[0]["ticket_id"])
+    assert status["status"] == "done"
+    assert status["requests"] == 10
+    assert status["result"] == {"backup_id": "backup_1"}
+    assert backup.labels == ["deposit"]
+    assert worker.stats()["coalesced"] == 9
+    worker.shutdown(timeout=5)
+
+
+def test_requests_during_a_running_backup_open_the_next_batch():
+    backup = _RecordingBackup(hold=True)
+    worker = AutoBackupWorker(backup, debounce_seconds=0.0, max_delay_seconds=0.0)
+
+    first = worker.request("deposit")
+    assert backup.started.wait(5)
+    second = worker.request("withdraw")
+    third = worker.request("nav_update")
+    assert second["ticket_id"] != first["ticket_id"]
+    assert third["ticket_id"] == second["ticket_id"]
+    assert worker.get(first["ticket_id"])["status"] == "running"
+
+    backup.release.set()
+    assert worker.wait_idle(timeout=5)
+    assert backup.labels == ["deposit", "batch"]
+    assert worker.get(second["ticket_id"])["transaction_types"] == ["withdraw", "nav_update"]
+    worker.shutdown(timeout=5)
+
+
+def test_failed_backup_is_reported_and_shutdown_flushes_pending_batch():
+    failing = AutoBackupWorker(_RecordingBackup(fail=True), debounce_seconds=0.0, max_delay_seconds=0.0)
+    ticket = failing.request("deposit")
+    assert failing.wait_idle(timeout=5)
+    status = failing.get(ticket["ticket_id"])
+    assert status["status"] == "failed" and status["error"] == "disk full"
+    failing.shutdown(timeout=5)
+
+    backup = _RecordingBackup()
+    worker = AutoBackupWorker(backup, debounce_seconds=3600, max_delay_seconds=3600)
+    ticket = worker.request("deposit")
+    worker.shutdown(timeout=5)
+    assert worker.get(ticket["ticket_id"])["status"] == "done"
+    assert worker.get("not-a-ticket") is None
+
+
+def test_create_transaction_returns_ticket_and_status_reports_backup(monkeypatch, tmp_path):
+    db_file = Path(tempfile.gettempdir()) / f"backend_api_backup_worker_{uuid.uuid4().hex}.db"
+    monkeypatch.setenv("API_DATABASE_URL", f"sqlite:///{db_file.as_posix()}")
+    monkeypatch.setenv("API_JWT_SECRET_KEY", "test-secret")
+    monkeypatch.setenv("API_ADMIN_USERNAME", "admin")
+    monkeypatch.setenv("API_ADMIN_PASSWORD", "admin123")
+    monkeypatch.setenv("API_AUTO_BACKUP_ON_NEW_TRANSACTION", "true")
+    monkeypatch.setenv("API_AUTO_BACKUP_DEBOUNCE_SECONDS", "1")
+    monkeypatch.delenv("GOOGLE_DRIVE_FOLDER_ID", raising=False)
+    monkeypatch.delenv("DRIVE_FOLDER_ID", raising=False)
+    for module_name in list(sys.modules):
+        if module_name.startswith("backend_api.app"):
+            del sys.modules[module_name]
+    importlib.import_module("backend_api.app.core.config").get_settings.cache_clear()
+    monkeypatch.setattr(importlib.import_module("backend_api.app.services.backup_service"), "EXPORT_DIR", tmp_path)
+    app = importlib.import_module("backend_api.app.main").app
+    worker_module = importlib.import_module("backend_api.app.services.backup_worker")
+
+    with TestClient(app) as client:
+        login = client.post("/api/v1/auth/login", json={"username": "admin", "password": "admin123"})
+        headers = {"Authorization": f"Bearer {login.json()['data']['access_token']}"}
+        investor = client.post(
+            "/api/v1/investors",
+            headers=headers,
+            json={"name": "Worker Investor", "phone": "0912345678", "join_date": "2026-01-01"},
+        ).json()["data"]["id"]
+
+        tickets = []
+        for day, amount in enumerate([1_000_000, 500_000, 250_000], start=1):
+            response = client.post(
+                "/api/v1/transactions",
+                headers=headers,
+                json={
+                    "transaction_type": "deposit",
+                    "investor_id": investor,
+                    "amount": amount,
+                    "total_nav": 1_000_000 + 750_000 * (day - 1),
+                    "transaction_date": f"2026-02-0{day}",
+                },
+            )
+            assert response.status_code == 200
+            tickets.append(response.json()["data"]["auto_backup"]["ticket_id"])
+        assert len(set(tickets)) == 1
+
+        assert worker_module.get_auto_backup_worker().wait_idle(timeout=30)
+        status = client.get(f"/api/v1/backups/auto/{tickets[0]}", headers=headers)
+        assert status.status_code == 200
+        body = status.json()["data"]
+        assert body["status"] == "done" and body["requests"] == 3
+        backup_id = body["result"]["backup_id"]
+        assert (tmp_path / backup_id).exists()
+
+        listed = client.get("/api/v1/backups", headers=headers).json()["data"]
+        assert [item["backup_id"] for item in listed] == [backup_id]
+        assert client.get(f"/api/v1/backups/auto/{uuid.uuid4().hex}", headers=headers).status_code == 404
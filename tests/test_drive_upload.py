@@ -0,0 +1,214 @@
+from datetime import datetime
+from pathlib import Path
+import sys
+import tempfile
+from types import SimpleNamespace
+import uuid
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from backend_api.app.services import backup_service  # noqa: E402
+from backend_api.app.services.drive_upload import CHUNK_ALIGNMENT, DriveUploader, GoogleDriveApi  # noqa: E402
+from core.models import Investor  # noqa: E402
+from core.postgres_data_handler import PostgresDataHandler  # noqa: E402
+from core.services_enhanced import EnhancedFundManager  # noqa: E402
+
+
+def _build_manager():
+    db_file = Path(tempfile.gettempdir()) / f"cnfund_drive_upload_{uuid.uuid4().hex}.db"
+    manager = EnhancedFundManager(PostgresDataHandler(database_url=f"sqlite:///{db_file.as_posix()}"), enable_snapshots=False)
+    manager.load_data()
+    manager._ensure_fund_manager_exists()
+    return manager
+
+
+class _HttpError(Exception):
+    def __init__(self, status: int) -> None:
+        super().__init__(f"HTTP {status}")
+        self.resp = SimpleNamespace(status=status)
+
+
+class _LocalDrive:
+    """In-memory stand-in for Drive: resumable uploads that keep their offset, scripted failures."""
+
+    def __init__(self, failures=None) -> None:
+        # (upload number, chunk number) -> exception raised instead of sending that chunk
+        self.failures = dict(failures or {})
+        self.files: dict[str, dict] = {}
+        self.created = 0
+        self.resets = 0
+        self.chunk_calls = 0
+
+    def create_upload(self, local_path, metadata, mimetype, chunk_size):
+        self.created += 1
+        return _LocalUpload(self, self.created, Path(local_path).read_bytes(), metadata, chunk_size)
+
+    def reset(self):
+        self.resets += 1
+
+
+class _LocalUpload:
+    def __init__(self, drive, number, data, metadata, chunk_size) -> None:
+        self.drive = drive
+        self.number = number
+        self.data = data
+        self.metadata = metadata
+        self.chunk_size = chunk_size
+        self.offset = 0
+        self.chunks = 0
+
+    def next_chunk(self):
+        self.drive.chunk_calls += 1
+        failure = self.drive.failures.pop((self.number, self.chunks), None)
+        if failure is not None:
+            raise failure
+        self.offset = min(len(self.data), self.offset + self.chunk_size)
+        self.chunks += 1
+        if self.offset < len(self.data):
+            return SimpleNamespace(progress=lambda: self.offset / len(self.data)), None
+        file_id = f"file{len(self.drive.files) + 1}"
+        self.drive.files[file_id] = {"name": self.metadata["name"], "parents": self.metadata["parents"], "data": self.data}
+        return None, {"id": file_id, "name": self.metadata["name"], "webViewLink": f"https://drive.test/{file_id}"}
+
+
+def _uploader(drive, tmp_path, max_retries=3):
+    sleeps: list[float] = []
+    uploader = DriveUploader(
+        drive,
+        chunk_size=CHUNK_ALIGNMENT,
+        max_retries=max_retries,
+        backoff_seconds=0.5,
+        state_path=tmp_path / "drive_upload_state.json",
+        sleep=sleeps.append,
+    )
+    return uploader, sleeps
+
+
+def test_chunked_upload_resumes_after_transient_errors(tmp_path):
+    payload = bytes(range(256)) * (CHUNK_ALIGNMENT * 3 // 256 + 10)
+    local_path = tmp_path / "Fund_Export_big.zip"
+    local_path.write_bytes(payload)
+    drive = _LocalDrive(failures={(1, 1): _HttpError(503), (1, 2): ConnectionResetError("reset by peer")})
+    uploader, sleeps = _uploader(drive, tmp_path)
+
+    result = uploader.upload(local_path, "folder", "application/zip", content_hash="abc")
+
+    assert result["uploaded"] and result["attempts"] == 3
+    assert result["web_view_link"] == f"https://drive.test/{result['file_id']}"
+    stored = drive.files[result["file_id"]]
+    assert stored["data"] == payload and stored["parents"] == ["folder"]
+    # One upload session, four chunks sent, two retried in place
+    assert drive.created == 1 and drive.chunk_calls == 6
+    assert len(sleeps) == 2 and 0.5 <= sleeps[0] <= 1.0 and 1.0 <= sleeps[1] <= 1.5
+    assert uploader.stats() == {"uploaded": 1, "skipped": 0, "failed": 0, "retries": 2}
+
+
+def test_upload_restarts_expired_session_and_gives_up_after_max_retries(tmp_path):
+    local_path = tmp_path / "Fund_Export_small.zip"
+    local_path.write_bytes(b"backup")
+
+    drive = _LocalDrive(failures={(1, 0): _HttpError(401), (2, 0): _HttpError(410)})
+    uploader, _ = _uploader(drive, tmp_path)
+    assert uploader.upload(local_path, "folder", "application/zip")["uploaded"]
+    assert drive.created == 3 and drive.resets == 1
+
+    always_down = _LocalDrive()
+    always_down.create_upload = lambda *args: (_ for _ in ()).throw(_HttpError(503))
+    uploader, sleeps = _uploader(always_down, tmp_path, max_retries=2)
+    result = uploader.upload(local_path, "folder", "application/zip")
+    assert not result["uploaded"] and result["reason"] == "upload_failed:HTTP 503"
+    assert len(sleeps) == 2
+
+    forbidden = _LocalDrive(failures={(1, 0): _HttpError(403)})
+    uploader, sleeps = _uploader(forbidden, tmp_path)
+    assert uploader.upload(local_path, "folder", "application/zip")["reason"] == "upload_failed:HTTP 403"
+    assert sleeps == []
+
+    uploader, _ = _uploader(GoogleDriveApi(credentials_loader=lambda: (None, "missing_oauth_token")), tmp_path)
+    assert uploader.upload(local_path, "folder", "application/zip")["reason"] == "missing_oauth_token"
+
+
+def test_unchanged_backups_are_not_uploaded_again(monkeypatch, tmp_path):
+    monkeypatch.setattr(backup_service, "EXPORT_DIR", tmp_path)
+    monkeypatch.setenv("GOOGLE_DRIVE_FOLDER_ID", "https://drive.google.com/drive/folders/folder123")
+    drive = _LocalDrive()
+    uploader, _ = _uploader(drive, tmp_path)
+    monkeypatch.setattr(backup_service, "get_drive_uploader", lambda: uploader)
+
+    manager = _build_manager()
+    manager.investors.append(Investor(id=1, name="Drive One"))
+    first = backup_service.trigger_manual_backup(manager, description="one", backup_format="archive")
+    second = backup_service.trigger_manual_backup(manager, description="two", backup_format="archive")
+    assert first["google_drive_uploaded"] and not first["google_drive_skipped"]
+    assert not second["google_drive_uploaded"] and second["google_drive_skipped"]
+    assert second["google_drive_reason"] == "unchanged_since_last_upload"
+    assert second["google_drive_file_id"] == first["google_drive_file_id"]
+    assert len(drive.files) == 1
+
+    manager.process_deposit(1, 1_000_000, 1_000_000, datetime(2026, 3, 1))
+    third = backup_service.trigger_manual_backup(manager, description="three", backup_format="archive")
+    assert third["google_drive_uploaded"]
+    assert drive.files[third["google_drive_file_id"]]["parents"] == ["folder123"]
+
+    # The last upload is persisted: a fresh uploader (restart) still skips identical content
+    restarted, _ = _uploader(drive, tmp_path)
+    monkeypatch.setattr(backup_service, "get_drive_uploader", lambda: restarted)
+    fourth = backup_service.trigger_manual_backup(manager, description="four", backup_format="archive")
+    assert fourth["google_drive_skipped"] and len(drive.files) == 2
+
+
+def test_unchanged_xlsx_backups_are_not_uploaded_again(monkeypatch, tmp_path):
+    monkeypatch.setattr(backup_service, "EXPORT_DIR", tmp_path)
+    monkeypatch.setenv("GOOGLE_DRIVE_FOLDER_ID", "folder123")
+    drive = _LocalDrive()
+    uploader, _ = _uploader(drive, tmp_path)
+    monkeypatch.setattr(backup_service, "get_drive_uploader", lambda: uploader)
+
+    manager = _build_manager()
+    manager.investors.append(Investor(id=1, name="Drive One"))
+    first = backup_service.trigger_manual_backup(manager, description="one", backup_format="xlsx")
+    second = backup_service.trigger_manual_backup(manager, description="two", backup_format="xlsx")
+    assert first["backup_id"].endswith(".xlsx") and first["google_drive_uploaded"]
+    assert second["google_drive_skipped"] and second["google_drive_reason"] == "unchanged_since_last_upload"
+    assert len(drive.files) == 1
+
+    manager.process_deposit(1, 1_000_000, 1_000_000, datetime(2026, 3, 1))
+    third = backup_service.trigger_manual_backup(manager, description="three", backup_format="xlsx")
+    assert third["google_drive_uploaded"] and len(drive.files) == 2
+
+
+def test_skipped_full_backup_never_becomes_the_parent_of_an_uploaded_increment(monkeypatch, tmp_path):
+    monkeypatch.setattr(backup_service, "EXPORT_DIR", tmp_path)
+    monkeypatch.setenv("GOOGLE_DRIVE_FOLDER_ID", "folder123")
+    monkeypatch.setenv("API_JWT_SECRET_KEY", "test-secret")
+    monkeypatch.setenv("API_ADMIN_USERNAME", "admin")
+    monkeypatch.setenv("API_ADMIN_PASSWORD", "admin123")
+    monkeypatch.setenv("API_BACKUP_FORMAT", "archive")
+    backup_service.get_settings.cache_clear()
+    drive = _LocalDrive()
+    uploader, _ = _uploader(drive, tmp_path)
+    monkeypatch.setattr(backup_service, "get_drive_uploader", lambda: uploader)
+
+    manager = _build_manager()
+    manager.investors.append(Investor(id=1, name="Drive One"))
+    first = backup_service.trigger_manual_backup(manager, description="one")
+    second = backup_service.trigger_manual_backup(manager, description="two")
+    assert second["google_drive_skipped"] and second["google_drive_name"] == first["backup_id"]
+
+    manager.process_deposit(1, 1_000_000, 1_000_000, datetime(2026, 3, 1))
+    increment = backup_service.trigger_auto_backup_after_transaction(manager, "deposit")
+    assert increment["google_drive_uploaded"]
+
+    on_drive = {stored["name"] for stored in drive.files.values()}
+    assert on_drive == {first["backup_id"], increment["backup_id"]}
+    for name in on_drive:
+        parent = backup_service.read_backup_archive_manifest(tmp_path / name)["parent"]
+        assert parent is None or parent in on_drive
+
+    # A chain base goes up even when its content matches the last upload
+    content_hash = backup_service.backup_content_hash(tmp_path / increment["backup_id"])
+    forced = uploader.upload(tmp_path / increment["backup_id"], "folder123", "application/zip", content_hash, force=True)
+    assert forced["uploaded"] and len(drive.files) == 3
+    backup_service.get_settings.cache_clear()
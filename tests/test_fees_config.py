@@ -280,8 +280,9 @@ def test_fee_config_permissions_for_viewer(monkeypatch):
         assert delete_forbidden.status_code == 403
 
 
-def test_backup_restore_persists_fee_config(monkeypatch):
+def test_backup_restore_persists_fee_config(monkeypatch, tmp_path):
     app = _load_app(monkeypatch)
+    monkeypatch.setattr(importlib.import_module("backend_api.app.services.backup_service"), "EXPORT_DIR", tmp_path)
     with TestClient(app) as client:
         admin_headers = _auth_header(client)
         investor_id = _create_investor(client, admin_headers, f"Investor Backup {uuid.uuid4().hex[:6]}")
@@ -334,3 +335,104 @@ def test_backup_restore_persists_fee_config(monkeypatch):
         overrides = {row["investor_id"]: row for row in payload["overrides"]}
         assert investor_id in overrides
         assert abs(overrides[investor_id]["performance_fee_rate"] - 0.09) < 1e-9
+
+
+def test_fee_apply_reuses_cached_preview_calculations(monkeypatch):
+    app = _load_app(monkeypatch)
+    from core.services_enhanced import EnhancedFundManager
+
+    with TestClient(app) as client:
+        admin_headers = _auth_header(client)
+        _seed_investor_with_profit_case(client, admin_headers, "Investor Cache")
+
+        calls = [0]
+        original = EnhancedFundManager.calculate_investor_fees
+
+        def _counting(self, *args, **kwargs):
+            calls[0] += 1
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(EnhancedFundManager, "calculate_investor_fees", _counting)
+        request = {"end_date": "2027-02-10", "total_nav": 1_500_000}
+        first = client.post("/api/v1/fees/preview", headers=admin_headers, json=request)
+        second = client.post("/api/v1/fees/preview", headers=admin_headers, json=request)
+        assert first.status_code == 200 and second.status_code == 200
+        token = first.json()["data"]["confirm_token"]
+        assert second.json()["data"]["confirm_token"] == token
+        assert first.json()["data"]["summary"]["total_fee_amount"] > 0
+        assert calls[0] == 1
+
+        apply_response = client.post(
+            "/api/v1/fees/apply",
+            headers=admin_headers,
+            json={
+                "year": 2027,
+                **request,
+                "confirm_token": token,
+                "acknowledge_risk": True,
+                "acknowledge_backup": True,
+            },
+        )
+        assert apply_response.status_code == 200
+        assert apply_response.json()["data"]["total_fees"] == first.json()["data"]["summary"]["total_fee_amount"]
+        assert calls[0] == 1
+
+        # Data changed: the same request now computes (and caches) a fresh preview.
+        third = client.post("/api/v1/fees/preview", headers=admin_headers, json=request)
+        assert third.json()["data"]["confirm_token"] != token
+        assert calls[0] == 2
+
+
+def test_fee_preview_cache_expires_and_is_bounded():
+    from backend_api.app.services.fee_preview_cache import CachedFeePreview, FeePreviewCache
+
+    now = [0.0]
+    cache = FeePreviewCache(ttl_seconds=10, max_entries=2, clock=lambda: now[0])
+    for index in range(3):
+        cache.put(CachedFeePreview(key=("k", index), token=f"t{index}", previews=[], fee_calculations={}))
+    assert cache.get(("k", 0)) is None
+    assert cache.get_by_token("t0") is None
+    assert cache.get_by_token("t2").key == ("k", 2)
+
+    now[0] = 11.0
+    assert cache.get(("k", 2)) is None
+    assert cache.stats()["entries"] == 1
+
+
+def test_fee_config_resolution_table_rebuilds_only_on_config_changes(monkeypatch):
+    from core.services_enhanced import EnhancedFundManager
+
+    class _Handler:
+        connected = True
+
+    manager = EnhancedFundManager(_Handler(), enable_snapshots=False)
+    manager.update_global_fee_config(performance_fee_rate=0.15, hurdle_rate_annual=0.05)
+    manager.upsert_investor_fee_override(7, performance_fee_rate=0.1)
+
+    normalize_calls = [0]
+    original = EnhancedFundManager._normalize_fee_overrides
+
+    def _counting(self, payload):
+        normalize_calls[0] += 1
+        return original(self, payload)
+
+    monkeypatch.setattr(EnhancedFundManager, "_normalize_fee_overrides", _counting)
+    for _ in range(50):
+        assert manager.resolve_fee_config_for_investor(7) == {
+            "performance_fee_rate": 0.1,
+            "hurdle_rate_annual": 0.05,
+            "fee_source": "override",
+        }
+        assert manager.resolve_fee_config_for_investor(8)["fee_source"] == "global"
+    assert normalize_calls[0] == 0
+
+    assert manager.delete_investor_fee_override(7)
+    assert manager.resolve_fee_config_for_investor(7)["fee_source"] == "global"
+
+    # Restore assigns new config objects directly; the table follows them.
+    manager.fee_investor_overrides = {"8": {"hurdle_rate_annual": 0.02}}
+    assert manager.resolve_fee_config_for_investor(8) == {
+        "performance_fee_rate": 0.15,
+        "hurdle_rate_annual": 0.02,
+        "fee_source": "override",
+    }
@@ -0,0 +1,89 @@
+from datetime import datetime
+from pathlib import Path
+import sys
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from core.fund_aggregates import AggregateMismatchError, FundAggregates  # noqa: E402
+from core.services_enhanced import EnhancedFundManager  # noqa: E402
+
+
+class DummyHandler:
+    connected = True
+
+    def save_all_data_enhanced(self, *args, **kwargs):
+        return True
+
+
+def _checked_manager():
+    manager = EnhancedFundManager(DummyHandler(), enable_snapshots=False)
+    manager.aggregates = FundAggregates(self_check=True)
+    manager._ensure_fund_manager_exists()
+    manager.add_investor("Alice")
+    manager.add_investor("Bob")
+    return manager, [inv.id for inv in manager.get_regular_investors()]
+
+
+def test_aggregates_track_every_tranche_mutation_under_self_check():
+    manager, (alice, bob) = _checked_manager()
+    fm_id = manager.get_fund_manager().id
+
+    manager.process_deposit(alice, 100_000_000, 100_000_000, datetime(2024, 1, 1, 10))
+    manager.process_deposit(bob, 50_000_000, 150_000_000, datetime(2024, 2, 1, 10))
+    manager.process_nav_update(240_000_000, datetime(2025, 1, 2, 10))
+    ok, _ = manager.process_withdrawal(alice, 20_000_000, 220_000_000, datetime(2025, 1, 3, 10))
+    assert ok
+    assert manager.get_investor_fees_paid(alice) > 0
+
+    results = manager.apply_year_end_fees_enhanced(datetime(2025, 12, 31, 17), 260_000_000)
+    assert results["success"] and results["investors_processed"] >= 1
+
+    withdrawal = next(t for t in manager.get_investor_transactions(alice) if t.type == "Rút")
+    manager.delete_transaction(withdrawal.id)
+    ok, _ = manager.process_withdrawal(bob, 500_000_000, 1, datetime(2026, 1, 5, 10))
+    assert ok and manager.get_investor_units(bob) == 0.0
+
+    assert manager.aggregates.verify(manager) == []
+    for investor_id in (alice, bob, fm_id):
+        assert manager.get_investor_units(investor_id) == pytest.approx(
+            sum(t.units for t in manager.tranches if t.investor_id == investor_id), rel=1e-12, abs=1e-12
+        )
+    assert manager.get_total_units() == pytest.approx(sum(t.units for t in manager.tranches), rel=1e-12)
+    assert manager.get_total_fees_paid() == pytest.approx(
+        sum(t.cumulative_fees_paid for t in manager.tranches), rel=1e-12
+    )
+
+    clone = manager.clone()
+    clone.process_deposit(bob, 10_000_000, 280_000_000, datetime(2026, 2, 1, 10))
+    assert clone.aggregates.verify(clone) == []
+    assert manager.get_investor_units(bob) == 0.0
+
+
+def test_self_check_reports_untracked_in_place_edits():
+    manager, (alice, _bob) = _checked_manager()
+    manager.process_deposit(alice, 100_000_000, 100_000_000, datetime(2024, 1, 1, 10))
+
+    manager.get_investor_tranches(alice)[0].units += 1.0
+    with pytest.raises(AggregateMismatchError):
+        manager.calculate_price_per_unit(100_000_000)
+
+
+def test_totals_match_sequential_sum_bit_for_bit_after_rebuild_and_appends():
+    manager, (alice, bob) = _checked_manager()
+    nav = 0.0
+    for step in range(30):
+        amount = 1_000_000 + step * 333_333.33
+        investor_id = alice if step % 3 else bob
+        manager.process_deposit(investor_id, amount, nav + amount, datetime(2024, 1, 1 + step % 28, 10))
+        nav += amount * 1.01
+
+    assert manager.get_total_units() == sum(t.units for t in manager.tranches)
+    assert manager.get_investor_units(alice) == sum(t.units for t in manager.tranches if t.investor_id == alice)
+
+    manager.aggregates.invalidate()
+    assert manager.get_total_units() == sum(t.units for t in manager.tranches)
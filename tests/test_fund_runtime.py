@@ -0,0 +1,219 @@
+import importlib
+from datetime import datetime
+from pathlib import Path
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+from fastapi.testclient import TestClient
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+def _load_app(monkeypatch, generation_check_ttl=0.5):
+    db_file = Path(tempfile.gettempdir()) / f"backend_api_runtime_{uuid.uuid4().hex}.db"
+    monkeypatch.setenv("API_DATABASE_URL", f"sqlite:///{db_file.as_posix()}")
+    monkeypatch.setenv("API_JWT_SECRET_KEY", "test-secret")
+    monkeypatch.setenv("API_ADMIN_USERNAME", "admin")
+    monkeypatch.setenv("API_ADMIN_PASSWORD", "admin123")
+    monkeypatch.setenv("API_GENERATION_CHECK_TTL_SECONDS", str(generation_check_ttl))
+
+    for module_name in list(sys.modules):
+        if module_name.startswith("backend_api.app"):
+            del sys.modules[module_name]
+
+    config_module = importlib.import_module("backend_api.app.core.config")
+    config_module.get_settings.cache_clear()
+
+    main_module = importlib.import_module("backend_api.app.main")
+    return main_module.app
+
+
+def _auth_header(client: TestClient) -> dict[str, str]:
+    response = client.post(
+        "/api/v1/auth/login",
+        json={"username": "admin", "password": "admin123"},
+    )
+    assert response.status_code == 200
+    access_token = response.json()["data"]["access_token"]
+    return {"Authorization": f"Bearer {access_token}"}
+
+
+def _create_investor(client: TestClient, headers: dict[str, str]) -> int:
+    response = client.post(
+        "/api/v1/investors",
+        headers=headers,
+        json={
+            "name": f"Runtime Investor {uuid.uuid4().hex[:6]}",
+            "phone": "0912345678",
+            "email": f"{uuid.uuid4().hex[:10]}@example.com",
+            "join_date": "2026-01-01",
+        },
+    )
+    assert response.status_code == 200
+    return response.json()["data"]["id"]
+
+
+def _count_reloads(runtime, monkeypatch) -> list[int]:
+    calls = [0]
+    original = runtime.refresh
+
+    def _counting_refresh():
+        calls[0] += 1
+        original()
+
+    monkeypatch.setattr(runtime, "refresh", _counting_refresh)
+    return calls
+
+
+def test_writes_and_reads_do_not_reload_when_generation_unchanged(monkeypatch):
+    app = _load_app(monkeypatch)
+    from backend_api.app.services.fund_runtime import get_runtime
+
+    with TestClient(app) as client:
+        headers = _auth_header(client)
+        investor_id = _create_investor(client, headers)
+        reloads = _count_reloads(get_runtime(), monkeypatch)
+
+        response = client.post(
+            "/api/v1/transactions",
+            headers=headers,
+            json={
+                "transaction_type": "deposit",
+                "investor_id": investor_id,
+                "amount": 1_000_000,
+                "total_nav": 1_000_000,
+                "transaction_date": "2026-01-10",
+            },
+        )
+        assert response.status_code == 200
+        assert response.json()["data"]["changes"]["transactions"]["new"]
+
+        response = client.get("/api/v1/transactions", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["data"]["total"] == 1
+        assert reloads[0] == 0
+
+
+def test_runtime_reloads_after_write_from_another_process(monkeypatch):
+    app = _load_app(monkeypatch, generation_check_ttl=0.2)
+    from backend_api.app.services.fund_runtime import get_runtime
+
+    from core.postgres_data_handler import PostgresDataHandler
+    from core.services_enhanced import EnhancedFundManager
+
+    with TestClient(app) as client:
+        headers = _auth_header(client)
+        investor_id = _create_investor(client, headers)
+        runtime = get_runtime()
+        reloads = _count_reloads(runtime, monkeypatch)
+
+        # A separate handler/manager plays the role of another worker or a script.
+        other = EnhancedFundManager(PostgresDataHandler(runtime._settings.database_url), enable_snapshots=False)
+        other.load_data()
+        ok, _ = other.process_deposit(investor_id, 500_000, 500_000, datetime(2026, 2, 1))
+        assert ok
+        assert other.save_data()
+
+        # Reads reuse the last generation check until it is older than the TTL
+        time.sleep(0.25)
+        response = client.get("/api/v1/transactions", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["data"]["total"] == 1
+        assert reloads[0] == 1
+
+
+def test_reads_reuse_recent_generation_check(monkeypatch):
+    app = _load_app(monkeypatch, generation_check_ttl=60)
+    from backend_api.app.services.fund_runtime import get_runtime
+
+    with TestClient(app) as client:
+        headers = _auth_header(client)
+        _create_investor(client, headers)
+        runtime = get_runtime()
+        queries = [0]
+        get_generation = runtime._handler.get_data_generation
+
+        def _counting_get_generation():
+            queries[0] += 1
+            return get_generation()
+
+        monkeypatch.setattr(runtime._handler, "get_data_generation", _counting_get_generation)
+        for _ in range(5):
+            assert client.get("/api/v1/transactions", headers=headers).status_code == 200
+        assert queries[0] == 0
+
+        # Writes never trust the cached value
+        _create_investor(client, headers)
+        assert queries[0] == 1
+
+
+def test_reads_use_published_snapshot_while_mutation_is_running(monkeypatch):
+    app = _load_app(monkeypatch)
+    from backend_api.app.services.fund_runtime import get_runtime
+
+    with TestClient(app) as client:
+        headers = _auth_header(client)
+        investor_id = _create_investor(client, headers)
+        runtime = get_runtime()
+        inside_mutation = threading.Event()
+        release_mutation = threading.Event()
+
+        def _slow_deposit(manager):
+            ok, _ = manager.process_deposit(investor_id, 1_000_000, 1_000_000, datetime(2026, 1, 10))
+            assert ok
+            inside_mutation.set()
+            assert release_mutation.wait(timeout=5)
+            return True
+
+        writer = threading.Thread(target=runtime.mutate, args=(_slow_deposit,))
+        writer.start()
+        assert inside_mutation.wait(timeout=5)
+
+        # The reader neither blocks nor sees the writer's uncommitted private copy.
+        started = time.perf_counter()
+        assert runtime.read(lambda manager: len(manager.transactions)) == 0
+        assert time.perf_counter() - started < 1.0
+
+        release_mutation.set()
+        writer.join(timeout=5)
+        assert runtime.read(lambda manager: len(manager.transactions)) == 1
+        assert runtime.lock_stats()["write"]["acquisitions"] >= 2
+
+
+def test_failed_mutation_leaves_published_snapshot_untouched(monkeypatch):
+    app = _load_app(monkeypatch)
+    from backend_api.app.services.fund_runtime import get_runtime
+
+    with TestClient(app) as client:
+        headers = _auth_header(client)
+        investor_id = _create_investor(client, headers)
+        runtime = get_runtime()
+
+        def _broken(manager):
+            manager.process_deposit(investor_id, 1_000_000, 1_000_000, datetime(2026, 1, 10))
+            raise ValueError("boom")
+
+        try:
+            runtime.mutate(_broken)
+        except ValueError:
+            pass
+        assert runtime.read(lambda manager: len(manager.transactions)) == 0
+
+
+def test_runtime_stats_endpoint_reports_lock_waits(monkeypatch):
+    app = _load_app(monkeypatch)
+
+    with TestClient(app) as client:
+        headers = _auth_header(client)
+        client.get("/api/v1/transactions", headers=headers)
+
+        response = client.get("/api/v1/system/runtime-stats", headers=headers)
+        assert response.status_code == 200
+        lock_stats = response.json()["data"]["lock"]
+        assert lock_stats["snapshot_reads"] >= 1
+        assert {"total_wait_ms", "avg_wait_ms", "max_wait_ms"} <= set(lock_stats["write"])
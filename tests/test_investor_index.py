@@ -0,0 +1,82 @@
+from datetime import datetime
+from pathlib import Path
+import sys
+import tempfile
+import uuid
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from core.models import Investor, Transaction  # noqa: E402
+from core.postgres_data_handler import PostgresDataHandler  # noqa: E402
+from core.services_enhanced import EnhancedFundManager  # noqa: E402
+
+
+def _build_manager():
+    db_file = Path(tempfile.gettempdir()) / f"cnfund_index_{uuid.uuid4().hex}.db"
+    handler = PostgresDataHandler(database_url=f"sqlite:///{db_file.as_posix()}")
+    manager = EnhancedFundManager(handler, enable_snapshots=False)
+    manager.load_data()
+    manager._ensure_fund_manager_exists()
+    manager.investors.append(Investor(id=1, name="Indexed One"))
+    manager.investors.append(Investor(id=2, name="Indexed Two"))
+    assert manager.save_data()
+    return manager
+
+
+def _assert_index_matches_scan(manager):
+    for investor in manager.investors:
+        investor_id = investor.id
+        assert manager.get_investor_by_id(investor_id) is investor
+        assert manager.get_investor_tranches(investor_id) == [t for t in manager.tranches if t.investor_id == investor_id]
+        assert manager.get_investor_transactions(investor_id) == [
+            t for t in manager.transactions if t.investor_id == investor_id
+        ]
+        assert manager.get_fee_history(investor_id) == [f for f in manager.fee_records if f.investor_id == investor_id]
+    assert manager.get_investor_by_id(999) is None
+
+
+def test_index_stays_consistent_through_mutations_undo_and_delete():
+    manager = _build_manager()
+    manager.process_deposit(1, 1_000_000, 1_000_000, datetime(2025, 1, 10))
+    manager.process_deposit(2, 2_000_000, 3_000_000, datetime(2025, 2, 10))
+    manager.process_nav_update(6_000_000, datetime(2026, 1, 10))
+    _assert_index_matches_scan(manager)
+
+    ok, _ = manager.process_withdrawal(1, 500_000, 6_000_000, datetime(2026, 1, 11))
+    assert ok
+    assert manager.get_fee_history(1)
+    _assert_index_matches_scan(manager)
+
+    withdrawal = next(t for t in manager.get_investor_transactions(1) if t.type == "Rút")
+    assert manager.undo_last_transaction(withdrawal.id)
+    _assert_index_matches_scan(manager)
+
+    deposit = manager.get_investor_transactions(2)[0]
+    assert manager.delete_transaction(deposit.id)
+    assert manager.get_investor_tranches(2) == []
+    _assert_index_matches_scan(manager)
+
+
+def test_index_rebuilds_after_untracked_list_changes():
+    manager = _build_manager()
+    manager.process_deposit(1, 1_000_000, 1_000_000, datetime(2026, 1, 10))
+    assert len(manager.get_investor_transactions(1)) == 1
+
+    manager.transactions.append(
+        Transaction(id=99, investor_id=1, date=datetime(2026, 2, 1), type="Nạp", amount=5, nav=1.0, units_change=0)
+    )
+    assert [t.id for t in manager.get_investor_transactions(1)][-1] == 99
+
+    manager.investors = [Investor(id=7, name="Restored")]
+    manager.tranches = []
+    assert manager.get_investor_by_id(1) is None
+    assert manager.get_investor_by_id(7).name == "Restored"
+    assert manager.get_investor_tranches(1) == []
+
+    clone = manager.clone()
+    clone.investors[0].name = "Changed"
+    assert clone.get_investor_by_id(7) is clone.investors[0]
+    assert manager.get_investor_by_id(7).name == "Restored"
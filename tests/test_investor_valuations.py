@@ -0,0 +1,83 @@
+from datetime import datetime
+from pathlib import Path
+import sys
+import tempfile
+import uuid
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from backend_api.app.services.investor_valuations import (  # noqa: E402
+    InvestorValuation,
+    InvestorValuationTable,
+    build_valuation_table,
+)
+from backend_api.app.services.snapshot_cache import SnapshotCache  # noqa: E402
+from core.models import Investor  # noqa: E402
+from core.postgres_data_handler import PostgresDataHandler  # noqa: E402
+from core.services_enhanced import EnhancedFundManager  # noqa: E402
+
+
+def _build_manager():
+    db_file = Path(tempfile.gettempdir()) / f"cnfund_valuations_{uuid.uuid4().hex}.db"
+    handler = PostgresDataHandler(database_url=f"sqlite:///{db_file.as_posix()}")
+    manager = EnhancedFundManager(handler, enable_snapshots=False)
+    manager.load_data()
+    manager._ensure_fund_manager_exists()
+    nav = 0.0
+    for investor_id in range(1, 8):
+        manager.investors.append(Investor(id=investor_id, name=f"Valued {investor_id}"))
+        amount = 1_000_000 * (investor_id % 4 + 1)
+        nav += amount
+        manager.process_deposit(investor_id, amount, nav, datetime(2026, 1, investor_id))
+    assert manager.save_data()
+    return manager
+
+
+def test_ranked_pages_match_full_sort_of_cards():
+    manager = _build_manager()
+    nav = manager.get_latest_total_nav() * 1.1
+    table = build_valuation_table(manager, nav)
+
+    expected = []
+    for investor in manager.get_regular_investors():
+        balance, profit, profit_percent = manager.get_investor_balance(investor.id, nav)
+        expected.append((investor.id, balance, profit, profit_percent))
+    expected.sort(key=lambda row: row[1], reverse=True)
+
+    top = table.top(4)
+    assert [row.investor.id for row in top] == [row[0] for row in expected[:4]]
+    ranked = [(row.investor.id, row.balance, row.profit, row.profit_percent) for row in table.ranked]
+    assert table.top(4) == top
+    assert ranked == expected
+    assert [row.investor.id for row in table.page(2, 3)] == [row[0] for row in expected[3:6]]
+    assert table.page(4, 3) == []
+    assert [row.investor.id for row in table.rows] == [inv.id for inv in manager.get_regular_investors()]
+    assert table.rows[0].units == manager.get_investor_units(1)
+
+
+def test_top_keeps_ties_in_investor_order():
+    rows = [
+        InvestorValuation(investor=investor_id, units=0.0, cost_basis=0.0, balance=balance, profit=0.0, profit_percent=0.0)
+        for investor_id, balance in enumerate([5.0, 9.0, 5.0, 9.0, 1.0, 5.0])
+    ]
+    table = InvestorValuationTable(1.0, rows)
+    assert [row.investor for row in table.top(4)] == [1, 3, 0, 2]
+    assert table.top(4) == table.ranked[:4]
+
+
+def test_snapshot_cache_rebuilds_after_commit():
+    manager = _build_manager()
+    cache = SnapshotCache(max_entries=2)
+    first = cache.get_or_build(manager, None, lambda: build_valuation_table(manager, None))
+    assert cache.get_or_build(manager, None, lambda: build_valuation_table(manager, None)) is first
+
+    clone = manager.clone()
+    clone.process_deposit(1, 9_000_000, clone.get_latest_total_nav() + 9_000_000, datetime(2026, 2, 1))
+    assert clone.save_data()
+    rebuilt = cache.get_or_build(clone, None, lambda: build_valuation_table(clone, None))
+    assert rebuilt is not first
+    assert rebuilt.ranked[0].investor.id == 1
+    assert cache.stats() == {"entries": 1, "hits": 1, "misses": 2, "invalidations": 1}
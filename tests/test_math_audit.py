@@ -1,4 +1,4 @@
-﻿from datetime import datetime
+﻿from datetime import datetime, timedelta
 
 import pytest
 
@@ -191,3 +191,92 @@ def test_withdrawal_uses_inferred_pre_nav_for_unit_pricing():
 
     assert withdrawal_tx.nav == pytest.approx(105_000_000.0, rel=1e-12)
     assert abs(withdrawal_tx.units_change) == pytest.approx(expected_units, rel=1e-9)
+
+
+def _scalar_investor_fee(manager, investor_id, ending_date, ending_total_nav):
+    """Reference: the per-tranche scalar loop the NumPy fee engine replaced."""
+    tranches = manager.get_investor_tranches(investor_id)
+    config = manager.resolve_fee_config_for_investor(investor_id)
+    rate = float(config["performance_fee_rate"])
+    hurdle_rate = float(config["hurdle_rate_annual"])
+    price = manager.calculate_price_per_unit(ending_total_nav)
+    total_fee = hurdle_value = hwm_value = excess_profit = 0.0
+    for tranche in tranches:
+        if tranche.units < 1e-9:
+            continue
+        tranche_excess = tranche.calculate_excess_profit(price, ending_date, hurdle_rate)
+        total_fee += rate * tranche_excess
+        hurdle_value += tranche.calculate_hurdle_price(ending_date, hurdle_rate) * tranche.units
+        hwm_value += tranche.hwm * tranche.units
+        excess_profit += tranche_excess
+    return {
+        "total_fee": round(total_fee, 0),
+        "hurdle_value": round(hurdle_value, 2),
+        "hwm_value": round(hwm_value, 2),
+        "excess_profit": round(excess_profit, 2),
+        "units_before": sum(t.units for t in tranches),
+    }
+
+
+def test_vectorized_fee_engine_matches_scalar_path():
+    import random
+
+    from core.fee_engine import compute_tranche_fees
+
+    manager = _new_manager()
+    rng = random.Random(11)
+    investor_ids = []
+    for index in range(6):
+        manager.add_investor(f"Investor {index}")
+        investor_ids.append(manager.investors[-1].id)
+    for step in range(40):
+        investor_id = rng.choice(investor_ids)
+        when = datetime(2021 + step // 10, rng.randint(1, 12), rng.randint(1, 28), rng.randint(0, 23))
+        nav = manager.get_latest_total_nav() or 0.0
+        amount = rng.randint(10, 200) * 1_000_000
+        manager.process_deposit(investor_id, amount, nav * rng.uniform(0.9, 1.3) + amount, when)
+    manager.upsert_investor_fee_override(investor_ids[0], performance_fee_rate=0.3, hurdle_rate_annual=0.1)
+    manager.get_investor_tranches(investor_ids[1])[0].hwm *= 3
+
+    ending_date = datetime(2025, 12, 31, 17, 0, 0)
+    ending_nav = manager.get_latest_total_nav() * 1.4
+    batched = manager.calculate_investor_fees(investor_ids, ending_date, ending_nav)
+    for investor_id in investor_ids:
+        expected = _scalar_investor_fee(manager, investor_id, ending_date, ending_nav)
+        for key, value in expected.items():
+            assert batched[investor_id][key] == pytest.approx(value, rel=1e-12, abs=1e-9), key
+        assert batched[investor_id] == manager.calculate_investor_fee(investor_id, ending_date, ending_nav)
+
+    price = manager.calculate_price_per_unit(ending_nav)
+    tranches = manager.get_investor_tranches(investor_ids[2])
+    batch = compute_tranche_fees([(investor_ids[2], tranches, 0.06)], ending_date, price)
+    for tranche, excess in batch.excess_profit_by_tranche(investor_ids[2]):
+        assert excess == pytest.approx(tranche.calculate_excess_profit(price, ending_date, 0.06), rel=1e-12, abs=1e-9)
+
+
+def test_batched_entry_epochs_match_per_date_conversion():
+    import pytz
+
+    from core.fee_engine import _epoch_micros, _epoch_micros_array
+
+    steady = [datetime(2021, 1, 1) + timedelta(hours=7 * step, microseconds=step) for step in range(500)]
+    # 1975-06-13: offset của Asia/Ho_Chi_Minh đổi từ +8 sang +7
+    across_transition = [datetime(1975, 6, 1) + timedelta(days=step) for step in range(30)]
+    mixed = [datetime(2024, 1, 1), pytz.utc.localize(datetime(2024, 1, 2, 3))]
+    for values in (steady, across_transition, mixed, []):
+        assert _epoch_micros_array(values).tolist() == [_epoch_micros(value) for value in values]
+
+
+def test_transition_check_falls_back_without_pytz_transition_table(monkeypatch):
+    from zoneinfo import ZoneInfo
+
+    import pytz
+
+    from core import fee_engine
+    from utils.timezone_manager import TimezoneManager
+
+    lowest, highest = datetime(2021, 1, 1), datetime(2021, 6, 1)
+    assert not fee_engine._has_transition(lowest, highest)
+    for timezone, expected in ((pytz.utc, False), (pytz.timezone("Etc/GMT-7"), False), (ZoneInfo("Asia/Ho_Chi_Minh"), True)):
+        monkeypatch.setattr(TimezoneManager, "get_app_timezone", classmethod(lambda cls, tz=timezone: tz))
+        assert fee_engine._has_transition(lowest, highest) is expected
@@ -0,0 +1,84 @@
+from datetime import date, datetime
+from pathlib import Path
+import sys
+import tempfile
+import uuid
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from config import DEFAULT_UNIT_PRICE  # noqa: E402
+from core.models import Investor  # noqa: E402
+from core.nav_series import DailyNavSeries  # noqa: E402
+from core.postgres_data_handler import PostgresDataHandler  # noqa: E402
+from core.services_enhanced import EnhancedFundManager  # noqa: E402
+
+
+def _build_manager():
+    db_file = Path(tempfile.gettempdir()) / f"cnfund_nav_series_{uuid.uuid4().hex}.db"
+    handler = PostgresDataHandler(database_url=f"sqlite:///{db_file.as_posix()}")
+    manager = EnhancedFundManager(handler, enable_snapshots=False)
+    manager.load_data()
+    manager._ensure_fund_manager_exists()
+    manager.investors.append(Investor(id=1, name="Series One"))
+    manager.investors.append(Investor(id=2, name="Series Two"))
+    assert manager.save_data()
+    return manager
+
+
+def _assert_series_persisted(manager):
+    expected = DailyNavSeries.build(manager.transactions).points
+    assert manager.nav_series.points == expected
+    assert manager.data_handler.load_nav_daily() == expected
+
+
+def test_daily_series_tracks_appends_deletes_and_reloads():
+    manager = _build_manager()
+    manager.process_deposit(1, 1_000_000, 1_000_000, datetime(2025, 1, 10, 9))
+    manager.process_deposit(2, 1_000_000, 2_000_000, datetime(2025, 1, 10, 15))
+    manager.process_nav_update(2_400_000, datetime(2025, 6, 1))
+    assert manager.save_data()
+    _assert_series_persisted(manager)
+    assert [point.day for point in manager.nav_series.points] == [date(2025, 1, 10), date(2025, 6, 1)]
+    assert manager.nav_series.as_of(date(2025, 3, 1)).total_nav == 2_000_000
+
+    # Giao dịch cùng ngày mới nhất: chỉ điểm cuối đổi
+    manager.process_nav_update(2_600_000, datetime(2025, 6, 1, 18))
+    assert manager.save_data()
+    _assert_series_persisted(manager)
+
+    # Xóa giao dịch cũ: tính lại từ ngày bị ảnh hưởng
+    first_deposit = manager.get_investor_transactions(2)[0]
+    assert manager.delete_transaction(first_deposit.id)
+    assert manager.save_data()
+    assert manager.nav_series.as_of(date(2025, 1, 10)).total_units == manager.get_investor_transactions(1)[0].units_change
+    _assert_series_persisted(manager)
+
+    reloaded = EnhancedFundManager(manager.data_handler, enable_snapshots=False)
+    reloaded.load_data()
+    assert reloaded.nav_series.points == manager.nav_series.points
+
+
+def test_series_backfills_when_table_is_empty_and_reads_period_returns():
+    manager = _build_manager()
+    manager.process_deposit(1, 1_000_000, 1_000_000, datetime(2025, 1, 10))
+    manager.process_nav_update(1_100_000, datetime(2025, 12, 31))
+    manager.process_nav_update(1_320_000, datetime(2026, 3, 1))
+    assert manager.save_data()
+
+    assert manager.data_handler.replace_nav_daily([])
+    reloaded = EnhancedFundManager(manager.data_handler, enable_snapshots=False)
+    reloaded.load_data()
+    # Load chỉ dựng lại trong bộ nhớ; lần lưu kế tiếp mới ghi bù
+    assert reloaded.nav_series.points == DailyNavSeries.build(reloaded.transactions).points
+    assert reloaded.data_handler.load_nav_daily() == []
+    assert reloaded.save_data()
+    assert reloaded.data_handler.load_nav_daily() == reloaded.nav_series.points
+
+    start_price = reloaded.nav_series.as_of(date(2025, 12, 31)).price_per_unit
+    end_price = reloaded.nav_series.as_of(date(2026, 3, 1)).price_per_unit
+    assert abs(reloaded.get_period_return(date(2026, 1, 1)) - (end_price / start_price - 1.0)) < 1e-12
+    assert abs(reloaded.get_period_return() - (end_price / DEFAULT_UNIT_PRICE - 1.0)) < 1e-12
+    assert [p.day for p in reloaded.get_nav_series(date(2025, 2, 1), date(2025, 12, 31))] == [date(2025, 12, 31)]
@@ -0,0 +1,85 @@
+from datetime import date, datetime
+from pathlib import Path
+import random
+import sys
+import tempfile
+import uuid
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from core.models import Investor, Transaction  # noqa: E402
+from core.postgres_data_handler import PostgresDataHandler  # noqa: E402
+from core.services_enhanced import EnhancedFundManager  # noqa: E402
+from utils.timezone_manager import TimezoneManager  # noqa: E402
+
+
+def _build_manager():
+    db_file = Path(tempfile.gettempdir()) / f"cnfund_nav_timeline_{uuid.uuid4().hex}.db"
+    handler = PostgresDataHandler(database_url=f"sqlite:///{db_file.as_posix()}")
+    manager = EnhancedFundManager(handler, enable_snapshots=False)
+    manager.load_data()
+    manager._ensure_fund_manager_exists()
+    manager.investors.append(Investor(id=1, name="Timeline Investor"))
+    assert manager.save_data()
+    return manager
+
+
+def _scan_nav_for_date(manager, target_date, include_zero_nav=True):
+    """Reference: the previous filter + sort implementation."""
+    if isinstance(target_date, datetime):
+        target_dt = target_date
+    else:
+        target_dt = datetime.combine(target_date, datetime.max.time())
+    target_dt = TimezoneManager.normalize_for_display(target_dt)
+    candidates = [
+        t
+        for t in manager.transactions
+        if t.nav is not None
+        and (t.nav >= 0 if include_zero_nav else t.nav > 0)
+        and TimezoneManager.normalize_for_display(t.date) <= target_dt
+    ]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda t: (TimezoneManager.normalize_for_display(t.date), t.id)).nav
+
+
+def _tx(tx_id, day, nav, hour=0):
+    return Transaction(id=tx_id, investor_id=1, date=datetime(2026, 1, day, hour), type="NAV Update", amount=0, nav=nav, units_change=0)
+
+
+def test_latest_and_as_of_match_full_scan_under_out_of_order_changes():
+    manager = _build_manager()
+    rng = random.Random(7)
+    for tx_id in range(1, 60):
+        nav = 0.0 if tx_id % 9 == 0 else float(rng.randint(1, 10_000))
+        manager._track_new("transactions", _tx(tx_id, rng.randint(1, 28), nav, rng.choice([0, 12])))
+    for victim in rng.sample(list(manager.transactions), 15):
+        manager._track_removed("transactions", victim)
+
+    for include_zero in (True, False):
+        assert manager.get_latest_total_nav(include_zero) == _scan_nav_for_date(manager, date(2026, 12, 31), include_zero)
+        for day in (1, 5, 14, 28):
+            for target in (date(2026, 1, day), datetime(2026, 1, day, 6)):
+                assert manager.get_nav_for_date(target, include_zero) == _scan_nav_for_date(manager, target, include_zero)
+
+    history_ids = [row["id"] for row in manager.get_nav_history()]
+    assert len(history_ids) == len(manager.transactions)
+
+
+def test_same_timestamp_ties_break_by_id_and_untracked_appends_are_seen():
+    manager = _build_manager()
+    manager._track_new("transactions", _tx(2, 10, 200.0))
+    manager._track_new("transactions", _tx(1, 10, 100.0))
+    assert manager.get_latest_total_nav() == 200.0
+    assert manager.get_nav_for_date(date(2026, 1, 9)) is None
+
+    manager.transactions.append(_tx(3, 11, 300.0))
+    assert manager.get_latest_total_nav() == 300.0
+
+    clone = manager.clone()
+    clone._track_new("transactions", _tx(4, 12, 400.0))
+    assert clone.get_latest_total_nav() == 400.0
+    assert manager.get_latest_total_nav() == 300.0
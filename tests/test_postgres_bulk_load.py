@@ -0,0 +1,170 @@
+from datetime import date, datetime
+from pathlib import Path
+import sys
+import tempfile
+import uuid
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from core.models import FeeRecord, Investor, Transaction, Tranche  # noqa: E402
+from core.postgres_data_handler import PostgresDataHandler  # noqa: E402
+
+
+def _handler() -> PostgresDataHandler:
+    db_file = Path(tempfile.gettempdir()) / f"cnfund_bulk_load_{uuid.uuid4().hex}.db"
+    return PostgresDataHandler(database_url=f"sqlite:///{db_file.as_posix()}")
+
+
+def _sample_data():
+    investors = [
+        Investor(id=0, name="Fund Manager", is_fund_manager=True, join_date=date(2025, 1, 1)),
+        Investor(id=1, name="Bulk Investor", phone="0912345678", email="a@example.com", join_date=date(2025, 2, 1)),
+    ]
+    tranche = Tranche(
+        investor_id=1,
+        tranche_id="t-1",
+        entry_date=datetime(2025, 2, 1, 9, 30),
+        entry_nav=10_000.0,
+        units=100.0,
+        original_invested_value=1_000_000.0,
+        hwm=11_000.0,
+        cumulative_fees_paid=1_234.5,
+    )
+    tranche.invested_value = 950_000.0
+    transactions = [
+        Transaction(id=1, investor_id=1, date=datetime(2025, 2, 1, 9, 30), type="Nạp", amount=1_000_000, nav=1_000_000, units_change=100),
+        Transaction(id=2, investor_id=0, date=datetime(2025, 3, 1), type="NAV Update", amount=0, nav=1_100_000, units_change=0),
+    ]
+    fee_records = [
+        FeeRecord(
+            id=1,
+            period="2025",
+            investor_id=1,
+            fee_amount=1_234.5,
+            fee_units=0.11,
+            calculation_date=datetime(2025, 12, 31),
+            units_before=100.0,
+            units_after=99.89,
+            nav_per_unit=11_000.0,
+            description="Performance fee for year 2025",
+        )
+    ]
+    return investors, [tranche], transactions, fee_records
+
+
+def test_bulk_loaders_round_trip_domain_objects_exactly():
+    handler = _handler()
+    investors, tranches, transactions, fee_records = _sample_data()
+    assert handler.save_all_data_enhanced(investors, tranches, transactions, fee_records)
+
+    loaded = handler.load_all()
+
+    for expected, actual in zip((investors, tranches, transactions, fee_records), loaded):
+        assert [vars(item) for item in actual] == [vars(item) for item in expected]
+    assert loaded[1][0].invested_value == 950_000.0
+    assert loaded[1][0].years_held(datetime(2026, 2, 1)) > 0.99
+
+
+def test_load_all_matches_individual_loaders():
+    handler = _handler()
+    assert handler.save_all_data_enhanced(*_sample_data())
+
+    investors, tranches, transactions, fee_records = handler.load_all()
+    assert investors == handler.load_investors()
+    assert tranches == handler.load_tranches()
+    assert transactions == handler.load_transactions()
+    assert fee_records == handler.load_fee_records()
+
+
+def test_full_rewrite_replaces_rows_and_bumps_generation():
+    handler = _handler()
+    investors, tranches, transactions, fee_records = _sample_data()
+    assert handler.save_all_data_enhanced(investors, tranches, transactions, fee_records)
+    generation = handler.get_data_generation()
+
+    assert handler.save_all_data_enhanced(investors[:1], [], transactions[1:], [])
+
+    assert [inv.id for inv in handler.load_investors()] == [0]
+    assert handler.load_tranches() == []
+    assert [tx.id for tx in handler.load_transactions()] == [2]
+    assert handler.get_data_generation() == generation + 1
+
+
+class _RecordingCursor:
+    """psycopg2-shaped cursor that records statements and COPY payloads."""
+
+    def __init__(self):
+        self.statements = []
+        self.copied = {}
+
+    def execute(self, statement):
+        self.statements.append(statement)
+
+    def copy_expert(self, statement, buffer):
+        self.statements.append(statement)
+        self.copied[statement.split()[1]] = buffer.read()
+
+
+def test_copy_path_stages_rows_then_swaps_tables():
+    investors, tranches, transactions, fee_records = _sample_data()
+    investors[1].name = 'Nguyễn "A", B'
+    from core.postgres_data_handler import InvestorRow, TrancheRow, _investor_row, _tranche_row
+
+    cursor = _RecordingCursor()
+    PostgresDataHandler._copy_replace_tables(
+        cursor,
+        [
+            (InvestorRow.__table__, [_investor_row(inv) for inv in investors]),
+            (TrancheRow.__table__, [_tranche_row(t) for t in tranches]),
+        ],
+    )
+
+    creates = [s for s in cursor.statements if s.startswith("CREATE TEMP TABLE")]
+    assert len(creates) == 2 and all("ON COMMIT DROP" in s for s in creates)
+    deletes = [s for s in cursor.statements if s.startswith("DELETE")]
+    assert deletes == ["DELETE FROM fund_tranches", "DELETE FROM fund_investors"]
+    assert cursor.statements[-1].startswith("INSERT INTO fund_tranches")
+    assert '"Nguyễn ""A"", B"' in cursor.copied["stage_fund_investors"]
+    # Autoincrement surrogate id is never copied; the target table assigns it.
+    copy_tranches = next(s for s in cursor.statements if s.startswith("COPY stage_fund_tranches"))
+    assert "(investor_id, tranche_id" in copy_tranches
+
+
+def test_legacy_transactions_table_gains_indexed_kind_column():
+    from sqlalchemy import create_engine, inspect, text
+
+    from core.models import TransactionKind
+
+    db_file = Path(tempfile.gettempdir()) / f"cnfund_bulk_load_{uuid.uuid4().hex}.db"
+    url = f"sqlite:///{db_file.as_posix()}"
+    legacy = create_engine(url)
+    with legacy.begin() as conn:
+        conn.execute(text("CREATE TABLE fund_investors (id INTEGER PRIMARY KEY, name VARCHAR(255) NOT NULL, join_date DATE NOT NULL)"))
+        conn.execute(
+            text(
+                "CREATE TABLE fund_transactions (id INTEGER PRIMARY KEY, investor_id INTEGER NOT NULL, date DATETIME NOT NULL,"
+                " type VARCHAR(64) NOT NULL, amount FLOAT NOT NULL, nav FLOAT NOT NULL, units_change FLOAT NOT NULL)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO fund_transactions VALUES"
+                " (1, 1, '2025-02-01 09:30:00', 'Nạp', 1000000, 1000000, 100),"
+                " (2, 0, '2025-03-01 00:00:00', 'Phí Nhận', 5000, 1100000, 0.5),"
+                " (3, 1, '2025-04-01 00:00:00', 'Rút', -2000, 1090000, -0.2)"
+            )
+        )
+    legacy.dispose()
+
+    handler = PostgresDataHandler(database_url=url)
+    assert [tx.kind for tx in handler.load_transactions()] == [
+        TransactionKind.DEPOSIT,
+        TransactionKind.FEE_RECEIVED,
+        TransactionKind.WITHDRAWAL,
+    ]
+    with handler.engine.connect() as conn:
+        assert conn.execute(text("SELECT kind FROM fund_transactions ORDER BY id")).scalars().all() == [1, 4, 2]
+    assert any(index["column_names"] == ["kind"] for index in inspect(handler.engine).get_indexes("fund_transactions"))
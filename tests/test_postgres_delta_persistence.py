@@ -0,0 +1,112 @@
+from datetime import datetime
+from pathlib import Path
+import sys
+import tempfile
+import uuid
+
+from sqlalchemy import event
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from core.models import Investor  # noqa: E402
+from core.postgres_data_handler import PostgresDataHandler  # noqa: E402
+from core.services_enhanced import EnhancedFundManager  # noqa: E402
+
+
+def _build_manager():
+    db_file = Path(tempfile.gettempdir()) / f"cnfund_delta_{uuid.uuid4().hex}.db"
+    handler = PostgresDataHandler(database_url=f"sqlite:///{db_file.as_posix()}")
+    manager = EnhancedFundManager(handler, enable_snapshots=False)
+    manager.load_data()
+    manager._ensure_fund_manager_exists()
+    return manager
+
+
+def _reload(manager: EnhancedFundManager) -> EnhancedFundManager:
+    fresh = EnhancedFundManager(manager.data_handler, enable_snapshots=False)
+    fresh.load_data()
+    return fresh
+
+
+def _capture_statements(engine):
+    statements = []
+
+    def _before_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(" ".join(statement.split()).upper())
+
+    event.listen(engine, "before_cursor_execute", _before_execute)
+    return statements
+
+
+def _seed(manager: EnhancedFundManager) -> int:
+    manager.investors.append(Investor(id=1, name="Delta Investor", phone="0912345678"))
+    ok, _ = manager.process_deposit(1, 1_000_000, 1_000_000, datetime(2026, 1, 10))
+    assert ok
+    ok, _ = manager.process_nav_update(1_200_000, datetime(2026, 2, 10))
+    assert ok
+    assert manager.save_data()
+    return 1
+
+
+def test_save_data_writes_only_changed_rows():
+    manager = _build_manager()
+    investor_id = _seed(manager)
+
+    statements = _capture_statements(manager.data_handler.engine)
+    ok, _ = manager.process_deposit(investor_id, 200_000, 1_400_000, datetime(2026, 3, 1))
+    assert ok
+    assert manager.save_data()
+
+    assert not any(stmt.startswith("DELETE") for stmt in statements)
+    assert not any("FUND_FEE_GLOBAL_CONFIG" in stmt for stmt in statements)
+    assert any(stmt.startswith("INSERT") and "FUND_TRANSACTIONS" in stmt for stmt in statements)
+
+    reloaded = _reload(manager)
+    assert len(reloaded.transactions) == len(manager.transactions)
+    assert abs(reloaded.get_investor_units(investor_id) - manager.get_investor_units(investor_id)) < 1e-9
+
+
+def test_save_data_without_changes_skips_database():
+    manager = _build_manager()
+    _seed(manager)
+
+    statements = _capture_statements(manager.data_handler.engine)
+    assert manager.save_data()
+    assert statements == []
+
+
+def test_delta_save_persists_updates_and_deletes():
+    manager = _build_manager()
+    investor_id = _seed(manager)
+    ok, _ = manager.process_withdrawal(investor_id, 300_000, 1_300_000, datetime(2026, 3, 5))
+    assert ok
+    assert manager.save_data()
+
+    withdrawal_id = max(tx.id for tx in manager.transactions)
+    assert manager.delete_transaction(withdrawal_id)
+    manager.investors[1].phone = "0987654321"
+    assert manager.save_data()
+
+    reloaded = _reload(manager)
+    assert {tx.id for tx in reloaded.transactions} == {tx.id for tx in manager.transactions}
+    assert {t.tranche_id for t in reloaded.tranches} == {t.tranche_id for t in manager.tranches}
+    assert len(reloaded.fee_records) == len(manager.fee_records)
+    assert reloaded.get_investor_by_id(investor_id).phone == "0987654321"
+    for tranche in manager.tranches:
+        stored = next(t for t in reloaded.tranches if t.tranche_id == tranche.tranche_id)
+        assert abs(stored.units - tranche.units) < 1e-9
+
+
+def test_full_rewrite_replaces_all_rows():
+    manager = _build_manager()
+    _seed(manager)
+
+    statements = _capture_statements(manager.data_handler.engine)
+    assert manager.save_data(full_rewrite=True)
+
+    assert any(stmt.startswith("DELETE") and "FUND_TRANSACTIONS" in stmt for stmt in statements)
+    reloaded = _reload(manager)
+    assert len(reloaded.transactions) == len(manager.transactions)
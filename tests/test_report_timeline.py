@@ -0,0 +1,167 @@
+from datetime import date, datetime, timedelta
+from pathlib import Path
+import random
+import sys
+from types import SimpleNamespace
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from backend_api.app.services.report_timeline import ReportTimeline, ReportTimelineCache, kinds_filter  # noqa: E402
+from core.models import TransactionKind, classify_transaction_type, type_text_matches  # noqa: E402
+
+
+def _sort_key(tx):
+    return tx.date, tx.id
+
+
+def _replay_snapshot(transactions_asc, investor_id, boundary, include_boundary):
+    total_units = 0.0
+    investor_units = 0.0
+    latest_nav = None
+    for tx in transactions_asc:
+        tx_date = tx.date.date()
+        if (tx_date > boundary) if include_boundary else (tx_date >= boundary):
+            break
+        total_units += tx.units_change
+        if investor_id is None:
+            investor_units = total_units
+        elif tx.investor_id == investor_id:
+            investor_units += tx.units_change
+        latest_nav = float(tx.nav)
+    return investor_units, total_units, latest_nav
+
+
+_TYPES = ("Nạp", "Rút", "Phí", "Phí Nhận", "NAV Update", "Fund Manager Withdrawal")
+
+
+def _random_transactions(count=300, seed=7):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    transactions = []
+    for tx_id in range(1, count + 1):
+        tx_type = rng.choice(_TYPES)
+        transactions.append(
+            SimpleNamespace(
+                id=tx_id,
+                investor_id=rng.randint(1, 6),
+                date=start + timedelta(days=rng.randint(0, 400), hours=rng.randint(0, 23)),
+                units_change=rng.uniform(-50, 120),
+                nav=rng.uniform(1e6, 5e6),
+                type=tx_type,
+                kind=classify_transaction_type(tx_type),
+            )
+        )
+    rng.shuffle(transactions)
+    return transactions
+
+
+def test_timeline_snapshots_match_full_replay():
+    transactions = _random_transactions()
+    timeline = ReportTimeline(transactions, _sort_key)
+    ordered = sorted(transactions, key=_sort_key)
+    assert timeline.transactions == ordered
+
+    boundaries = [date(2023, 12, 31), date(2024, 1, 1), date(2024, 6, 15), date(2025, 2, 4), date(2026, 1, 1)]
+    for investor_id in (None, 1, 3, 6, 42):
+        for boundary in boundaries:
+            assert timeline.snapshot(investor_id, timeline.prefix_before(boundary)) == _replay_snapshot(
+                ordered, investor_id, boundary, include_boundary=False
+            )
+            assert timeline.snapshot(investor_id, timeline.prefix_through(boundary)) == _replay_snapshot(
+                ordered, investor_id, boundary, include_boundary=True
+            )
+
+    window = timeline.window(2, date(2024, 3, 1), date(2024, 9, 30))
+    assert window == [
+        tx for tx in ordered if tx.investor_id == 2 and date(2024, 3, 1) <= tx.date.date() <= date(2024, 9, 30)
+    ]
+
+
+def test_kind_filtered_pages_match_a_full_scan():
+    assert [classify_transaction_type(label) for label in _TYPES] == [
+        TransactionKind.DEPOSIT,
+        TransactionKind.WITHDRAWAL,
+        TransactionKind.FEE,
+        TransactionKind.FEE_RECEIVED,
+        TransactionKind.NAV_UPDATE,
+        TransactionKind.FUND_MANAGER_WITHDRAWAL,
+    ]
+    assert classify_transaction_type("Deposit") is TransactionKind.DEPOSIT
+    assert kinds_filter("phi") == {TransactionKind.FEE, TransactionKind.FEE_RECEIVED}
+    assert kinds_filter("  ") is None
+
+    transactions = _random_transactions()
+    timeline = ReportTimeline(transactions, _sort_key)
+    newest_first = sorted(transactions, key=_sort_key, reverse=True)
+    start, end = date(2024, 2, 1), date(2024, 12, 31)
+    for investor_id in (None, 4):
+        for tx_type in ("phi", "Rút", "withdrawal", "xyz"):
+            kinds = kinds_filter(tx_type)
+            expected = [
+                tx
+                for tx in newest_first
+                if tx.kind in kinds
+                and (investor_id is None or tx.investor_id == investor_id)
+                and start <= tx.date.date() <= end
+            ]
+            assert timeline.window(investor_id, start, end, kinds=kinds)[::-1] == expected
+            for offset in (0, 7, len(expected) - 3):
+                items, total, has_more = timeline.page_desc(
+                    investor_id, start, end, offset=max(offset, 0), limit=5, kinds=kinds
+                )
+                assert total == len(expected)
+                assert items == expected[max(offset, 0) : max(offset, 0) + 5]
+                assert has_more == (max(offset, 0) + 5 < len(expected))
+
+
+def test_legacy_type_labels_still_match_by_text():
+    legacy_types = ("Deposit", "Withdrawal", "Điều chỉnh")
+    transactions = _random_transactions(count=120, seed=3)
+    rng = random.Random(5)
+    for tx in rng.sample(transactions, 40):
+        tx.type = rng.choice(legacy_types)
+        tx.kind = classify_transaction_type(tx.type)
+    timeline = ReportTimeline(transactions, _sort_key)
+    newest_first = sorted(transactions, key=_sort_key, reverse=True)
+
+    def _matches(tx, tx_type):
+        return tx.kind in kinds_filter(tx_type) or type_text_matches(tx.type, tx_type)
+
+    for investor_id in (None, 2):
+        for tx_type in ("deposit", "withdrawal", "dieu chinh", "nap", "phi"):
+            expected = [
+                tx
+                for tx in newest_first
+                if (investor_id is None or tx.investor_id == investor_id) and _matches(tx, tx_type)
+            ]
+            window = timeline.window(investor_id, None, None, kinds=kinds_filter(tx_type), type_text=tx_type)
+            assert window[::-1] == expected
+            items, total, _ = timeline.page_desc(
+                investor_id, limit=len(expected) + 1, kinds=kinds_filter(tx_type), type_text=tx_type
+            )
+            assert items == expected and total == len(expected)
+    # "deposit" matches no canonical label: only the legacy rows are found, by their text
+    deposits = timeline.window(None, None, None, kinds=kinds_filter("deposit"), type_text="deposit")
+    assert deposits and all(tx.type == "Deposit" for tx in deposits)
+
+
+def test_timeline_cache_reuses_until_generation_changes():
+    cache = ReportTimelineCache()
+    manager = SimpleNamespace(data_generation=3, transactions=_random_transactions(count=20))
+
+    first = cache.get(manager, _sort_key)
+    assert cache.get(manager, _sort_key) is first
+
+    manager.data_generation = 4
+    second = cache.get(manager, _sort_key)
+    assert second is not first
+
+    manager.transactions = list(manager.transactions)
+    assert cache.get(manager, _sort_key) is not second
+
+    untracked = SimpleNamespace(data_generation=None, transactions=manager.transactions)
+    assert cache.get(untracked, _sort_key) is not cache.get(untracked, _sort_key)
+    assert cache.stats()["hits"] == 1
@@ -5,8 +5,10 @@ from io import StringIO
 from pathlib import Path
 import sys
 import tempfile
+import time
 import uuid
 
+import pytest
 from fastapi.testclient import TestClient
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -336,3 +338,229 @@ def test_transactions_export_includes_same_profit_percent_as_report(monkeypatch)
         assert pdf_response.headers["content-type"].startswith("application/pdf")
         assert "attachment" in pdf_response.headers.get("content-disposition", "")
         assert pdf_response.content.startswith(b"%PDF")
+
+
+def test_csv_export_streams_header_then_row_chunks(monkeypatch):
+    app = _load_app(monkeypatch)
+    export_service = importlib.import_module("backend_api.app.services.export_service")
+    with TestClient(app) as client:
+        headers = _auth_header(client)
+        _seed_holdings_without_period_transactions(client, headers)
+        _seed_mixed_transactions(client, headers)
+
+        report = client.get(
+            "/api/v1/reports/transactions", headers=headers, params={"page_size": 50, "tx_type": "Nạp"}
+        ).json()["data"]
+        with client.stream(
+            "GET", "/api/v1/reports/transactions/export", headers=headers, params={"tx_type": "Nạp"}
+        ) as response:
+            assert response.status_code == 200
+            assert "content-length" not in response.headers
+            content = response.read()
+
+        rows = list(csv.reader(StringIO(content.decode("utf-8-sig"))))
+        header_index = next(index for index, row in enumerate(rows) if row and row[0] == "ID")
+        assert rows[2] == ["Tổng giao dịch", str(report["summary"]["total_count"])]
+        assert [int(row[0]) for row in rows[header_index + 1 :]] == [item["id"] for item in report["items"]]
+
+    summary = type("Summary", (), {"total_count": 3})()
+    transactions = [
+        type("Tx", (), {"id": tx_id, "investor_id": 1, "type": "Nạp", "amount": 1.0, "nav": 2.0, "date": "2026-01-01", "units_change": 0.5})()
+        for tx_id in (3, 2, 1)
+    ]
+    chunks = list(export_service.iter_transactions_csv(iter(transactions), {1: "A"}, summary, None, None, chunk_rows=2))
+    assert len(chunks) == 3
+    assert chunks[0].startswith(b"\xef\xbb\xbf") and chunks[0].rstrip().endswith("Đơn vị thay đổi".encode("utf-8"))
+    assert [line.split(b",")[0] for chunk in chunks[1:] for line in chunk.splitlines()] == [b"3", b"2", b"1"]
+
+
+def test_dashboard_is_cached_per_snapshot_and_nav(monkeypatch):
+    app = _load_app(monkeypatch)
+    with TestClient(app) as client:
+        headers = _auth_header(client)
+        investor_1, investor_2 = _seed_holdings_without_period_transactions(client, headers)
+        cache = importlib.import_module("backend_api.app.services.snapshot_cache").get_dashboard_cache()
+        before = cache.stats()
+
+        first = client.get("/api/v1/reports/dashboard", headers=headers).json()["data"]
+        again = client.get("/api/v1/reports/dashboard", headers=headers).json()["data"]
+        assert again == first
+        client.get("/api/v1/reports/dashboard?nav=3000000", headers=headers)
+        stats = cache.stats()
+        assert stats["hits"] - before["hits"] == 1
+        assert stats["misses"] - before["misses"] == 2
+        # Equal balances keep investor order, as the previous full sort did
+        assert [row["investor_id"] for row in first["top_investors"]] == [investor_1, investor_2]
+
+        _create_transaction(
+            client,
+            headers,
+            {
+                "transaction_type": "deposit",
+                "investor_id": investor_2,
+                "amount": 5_000_000,
+                "total_nav": 7_200_000,
+                "transaction_date": "2026-02-21",
+            },
+        )
+        after_commit = client.get("/api/v1/reports/dashboard", headers=headers).json()["data"]
+        assert cache.stats()["misses"] - stats["misses"] == 1
+        assert after_commit["kpis"]["total_nav"] == 7_200_000
+        assert [row["investor_id"] for row in after_commit["top_investors"]] == [investor_2, investor_1]
+
+
+def _walk_cursor_pages(client: TestClient, headers: dict[str, str], path: str, params: dict) -> list[int]:
+    ids: list[int] = []
+    cursor = None
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        data = client.get(path, headers=headers, params=query).json()["data"]
+        ids.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            return ids
+
+
+def test_transaction_listings_support_keyset_cursor(monkeypatch):
+    app = _load_app(monkeypatch)
+    with TestClient(app) as client:
+        headers = _auth_header(client)
+        investor_1, investor_2 = _seed_holdings_without_period_transactions(client, headers)
+        _seed_mixed_transactions(client, headers)
+
+        full = client.get("/api/v1/transactions", headers=headers, params={"page_size": 200}).json()["data"]
+        all_ids = [item["id"] for item in full["items"]]
+        assert full["next_cursor"] is None
+        assert len(all_ids) == full["total"] == 6
+
+        assert _walk_cursor_pages(client, headers, "/api/v1/transactions", {"page_size": 2}) == all_ids
+        assert _walk_cursor_pages(client, headers, "/api/v1/transactions/cards", {"page_size": 4}) == all_ids
+        page_two = client.get("/api/v1/transactions", headers=headers, params={"page": 2, "page_size": 2}).json()
+        assert [item["id"] for item in page_two["data"]["items"]] == all_ids[2:4]
+
+        filtered = client.get(
+            "/api/v1/transactions",
+            headers=headers,
+            params={"investor_id": investor_2, "start_date": "2026-01-01", "end_date": "2026-01-31"},
+        ).json()["data"]
+        assert filtered["total"] == 1
+        assert filtered["items"][0]["investor_id"] == investor_2
+
+        report_ids = _walk_cursor_pages(
+            client, headers, "/api/v1/reports/transactions", {"page_size": 1, "tx_type": "Nạp"}
+        )
+        report = client.get(
+            "/api/v1/reports/transactions", headers=headers, params={"page_size": 50, "tx_type": "Nạp"}
+        ).json()["data"]
+        assert report_ids == [item["id"] for item in report["items"]]
+        assert report["total"] == 4
+        assert investor_1 in {item["investor_id"] for item in report["items"]}
+        deposits = client.get(
+            "/api/v1/transactions/cards", headers=headers, params={"page_size": 50, "tx_type": "nap"}
+        ).json()["data"]
+        assert [item["id"] for item in deposits["items"]] == report_ids
+
+        invalid = client.get("/api/v1/transactions", headers=headers, params={"cursor": "not-a-cursor"})
+        assert invalid.status_code == 422
+
+
+def test_pdf_export_job_runs_in_pool_and_serves_artifact(monkeypatch):
+    monkeypatch.setenv("API_EXPORT_JOBS_DIR", str(Path(tempfile.gettempdir()) / f"cnfund_jobs_{uuid.uuid4().hex}"))
+    monkeypatch.setenv("API_EXPORT_JOB_WORKERS", "1")
+    app = _load_app(monkeypatch)
+    with TestClient(app) as client:
+        headers = _auth_header(client)
+        investor_id = _seed_mixed_transactions(client, headers)
+
+        submitted = client.post(
+            "/api/v1/reports/transactions/export/jobs", headers=headers, params={"investor_id": investor_id}
+        )
+        assert submitted.status_code == 202
+        job = submitted.json()["data"]
+        assert job["status"] == "queued" and job["total_rows"] == 2
+
+        deadline = time.monotonic() + 60
+        while job["status"] in ("queued", "running") and time.monotonic() < deadline:
+            time.sleep(0.2)
+            job = client.get(f"/api/v1/reports/export-jobs/{job['job_id']}", headers=headers).json()["data"]
+        assert job["status"] == "done", job
+        assert job["progress"] == 1.0
+
+        download = client.get(f"/api/v1/reports/export-jobs/{job['job_id']}/download", headers=headers)
+        assert download.status_code == 200
+        assert download.headers["content-type"].startswith("application/pdf")
+        assert download.content.startswith(b"%PDF")
+        assert len(download.content) == job["size_bytes"]
+
+        assert client.get("/api/v1/reports/export-jobs/../../etc", headers=headers).status_code == 404
+        assert client.get(f"/api/v1/reports/export-jobs/{uuid.uuid4().hex}", headers=headers).status_code == 404
+
+
+def test_export_job_queue_limits_pending_jobs(tmp_path):
+    from concurrent.futures import Future
+
+    export_jobs = importlib.import_module("backend_api.app.services.export_jobs")
+
+    class _HeldExecutor:
+        def __init__(self):
+            self.calls = []
+
+        def submit(self, fn, *args):
+            future = Future()
+            self.calls.append((future, fn, args))
+            return future
+
+        def run_all(self):
+            for future, fn, args in self.calls:
+                future.set_result(fn(*args))
+
+    queue = export_jobs.ExportJobQueue(export_jobs.ExportJobStore(tmp_path), max_workers=1, max_pending=1, ttl_seconds=3600)
+    queue._executor = _HeldExecutor()
+    summary = {"total_count": 0}
+    job = queue.submit("user:1", [], {}, summary, None, None)
+    with pytest.raises(export_jobs.ExportQueueFull):
+        queue.submit("user:1", [], {}, summary, None, None)
+
+    queue._executor.run_all()
+    assert queue.get(job["job_id"], "user:2") is None
+    finished = queue.get(job["job_id"], "user:1")
+    assert finished["status"] == "done"
+    assert queue.store.artifact_path(job["job_id"]).read_bytes().startswith(b"%PDF")
+    assert queue.stats()["active"] == 0 and queue.stats()["rejected"] == 1
+
+
+def test_export_jobs_left_pending_are_marked_failed(tmp_path):
+    from concurrent.futures import Future
+
+    export_jobs = importlib.import_module("backend_api.app.services.export_jobs")
+
+    class _PendingExecutor:
+        def __init__(self):
+            self.futures = []
+
+        def submit(self, fn, *args):
+            future = Future()
+            self.futures.append(future)
+            return future
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            if cancel_futures:
+                for future in self.futures:
+                    future.cancel()
+
+    store = export_jobs.ExportJobStore(tmp_path)
+    queue = export_jobs.ExportJobQueue(store, max_workers=1, max_pending=4, ttl_seconds=0)
+    queue._executor = _PendingExecutor()
+    summary = {"total_count": 0}
+    cancelled = queue.submit("user:1", [], {}, summary, None, None)
+    queue.shutdown()
+    job = queue.get(cancelled["job_id"], "user:1")
+    assert job["status"] == "failed" and job["error"] == "cancelled"
+    assert queue.stats()["active"] == 0
+
+    # A job left queued/running by a previous process fails when the next queue starts
+    orphan = {**cancelled, "job_id": uuid.uuid4().hex, "status": "running", "error": None}
+    store.put(orphan)
+    restarted = export_jobs.ExportJobQueue(store, max_workers=1, max_pending=4, ttl_seconds=0)
+    assert restarted.get(orphan["job_id"], "user:1")["error"] == "interrupted"
+    assert store.purge(0) == 2 and not list(tmp_path.glob("*.json"))
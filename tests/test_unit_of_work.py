@@ -0,0 +1,147 @@
+from datetime import datetime
+from pathlib import Path
+import sys
+import tempfile
+import uuid
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from core.models import Investor, Transaction  # noqa: E402
+from core.postgres_data_handler import PostgresDataHandler  # noqa: E402
+from core.services_enhanced import EnhancedFundManager  # noqa: E402
+
+
+def _build_manager():
+    db_file = Path(tempfile.gettempdir()) / f"cnfund_uow_{uuid.uuid4().hex}.db"
+    handler = PostgresDataHandler(database_url=f"sqlite:///{db_file.as_posix()}")
+    manager = EnhancedFundManager(handler, enable_snapshots=False)
+    manager.load_data()
+    manager._ensure_fund_manager_exists()
+    manager.investors.append(Investor(id=1, name="Tracked Investor"))
+    assert manager.save_data()
+    return manager
+
+
+def test_deposit_registers_new_rows_with_stable_keys():
+    manager = _build_manager()
+    ok, _ = manager.process_deposit(1, 1_000_000, 1_000_000, datetime(2026, 1, 10))
+    assert ok
+
+    pending = manager.unit_of_work.pending()
+    assert set(pending) == {"tranches", "transactions"}
+    assert pending["tranches"]["new"] == [manager.tranches[0].tranche_id]
+    assert pending["transactions"]["new"] == [manager.transactions[0].id]
+
+    assert manager.save_data()
+    assert manager.last_saved_changes["tranches"]["new"] == [manager.tranches[0].tranche_id]
+    assert manager.unit_of_work.pending() == {}
+
+
+def test_withdrawal_with_fee_registers_modified_tranches_and_fee_record():
+    manager = _build_manager()
+    manager.process_deposit(1, 1_000_000, 1_000_000, datetime(2025, 1, 10))
+    manager.process_nav_update(2_000_000, datetime(2026, 1, 10))
+    assert manager.save_data()
+    investor_tranche_id = manager.get_investor_tranches(1)[0].tranche_id
+
+    ok, _ = manager.process_withdrawal(1, 500_000, 1_500_000, datetime(2026, 1, 11))
+    assert ok
+
+    pending = manager.unit_of_work.pending()
+    assert investor_tranche_id in pending["tranches"]["modified"]
+    assert any(key.startswith("FEE_") for key in pending["tranches"]["new"])
+    assert len(pending["fee_records"]["new"]) == 1
+    assert len(pending["transactions"]["new"]) == 3
+
+    assert manager.save_data()
+    assert investor_tranche_id in manager.last_saved_changes["tranches"]["modified"]
+
+
+def test_delete_registers_removed_rows():
+    manager = _build_manager()
+    manager.process_deposit(1, 1_000_000, 1_000_000, datetime(2026, 1, 10))
+    assert manager.save_data()
+    tranche_id = manager.tranches[0].tranche_id
+    tx_id = manager.transactions[0].id
+
+    assert manager.delete_transaction(tx_id)
+    pending = manager.unit_of_work.pending()
+    assert pending["tranches"]["removed"] == [tranche_id]
+    assert pending["transactions"]["removed"] == [tx_id]
+
+
+def test_untracked_list_mutation_is_still_saved():
+    manager = _build_manager()
+    manager.transactions.append(
+        Transaction(id=99, investor_id=1, date=datetime(2026, 2, 1), type="NAV Update", amount=0, nav=1.0, units_change=0)
+    )
+    assert manager.unit_of_work.pending() == {}
+
+    assert manager.save_data()
+    assert manager.last_saved_changes == {"transactions": {"new": [99], "modified": [], "removed": []}}
+
+
+def test_failed_fee_application_restores_investor_tranches(monkeypatch):
+    manager = _build_manager()
+    manager.investors.append(Investor(id=2, name="Second Investor"))
+    manager.process_deposit(1, 1_000_000, 1_000_000, datetime(2024, 1, 10))
+    manager.process_deposit(1, 1_000_000, 2_000_000, datetime(2024, 6, 10))
+    manager.process_deposit(2, 1_000_000, 3_000_000, datetime(2024, 6, 11))
+    manager.process_nav_update(6_000_000, datetime(2025, 12, 31))
+    assert manager.save_data()
+    before = [vars(t).copy() for t in manager.tranches]
+
+    calls = {"count": 0}
+    track_modified = manager._track_modified
+
+    def _fail_on_second_tranche(entity, obj):
+        calls["count"] += 1
+        if calls["count"] == 2:
+            raise RuntimeError("boom")
+        track_modified(entity, obj)
+
+    monkeypatch.setattr(manager, "_track_modified", _fail_on_second_tranche)
+    fee_details = manager.calculate_investor_fee(1, datetime(2025, 12, 31, 17), 6_000_000)
+    fee_details["current_price"] = manager.calculate_price_per_unit(6_000_000)
+    assert fee_details["total_fee"] > 1
+    assert not manager._apply_fee_to_investor_tranches(1, fee_details, datetime(2025, 12, 31, 17), crystallize=True)
+    assert calls["count"] == 2
+
+    assert [vars(t) for t in manager.tranches] == before
+    assert manager.unit_of_work.pending() == {}
+    assert manager.get_investor_units(1) == sum(t["units"] for t in before if t["investor_id"] == 1)
+
+
+def test_tracked_changes_are_saved_without_full_diff(monkeypatch):
+    manager = _build_manager()
+    manager.process_deposit(1, 1_000_000, 1_000_000, datetime(2026, 1, 10))
+    assert manager.save_data()
+
+    diffed = []
+    diff_changes = manager.unit_of_work._diff_changes
+
+    def _record_diff(entity, source):
+        diffed.append(entity)
+        return diff_changes(entity, source)
+
+    monkeypatch.setattr(manager.unit_of_work, "_diff_changes", _record_diff)
+    manager.process_deposit(1, 500_000, 1_500_000, datetime(2026, 1, 20))
+    assert manager.save_data()
+    assert diffed == ["investors"]
+    assert len(manager.last_saved_changes["tranches"]["new"]) == 1
+    assert len(manager.last_saved_changes["transactions"]["new"]) == 1
+
+    manager.transactions.append(
+        Transaction(id=99, investor_id=1, date=datetime(2026, 2, 1), type="NAV Update", amount=0, nav=1.0, units_change=0)
+    )
+    assert manager.save_data()
+    assert diffed == ["investors", "investors", "transactions"]
+    assert manager.last_saved_changes == {"transactions": {"new": [99], "modified": [], "removed": []}}
+
+    reloaded = EnhancedFundManager(manager.data_handler, enable_snapshots=False)
+    reloaded.load_data()
+    assert [vars(t) for t in reloaded.tranches] == [vars(t) for t in manager.tranches]
+    assert sorted(tx.id for tx in reloaded.transactions) == sorted(tx.id for tx in manager.transactions)